@@ -12,6 +12,7 @@ from datetime import datetime
 import feedparser
 
 from adapters.newsletter_adapter import NewsletterAdapter
+import conditional_get_store
 import util
 
 
@@ -28,7 +29,7 @@ class AiWithMikeAdapter(NewsletterAdapter):
     @util.retry()
     def _fetch_feed(self):
         """Fetch RSS feed content."""
-        response = util.fetch(self.feed_url, timeout=10)
+        response = util.fetch(self.feed_url, timeout=10, conditional=self.config.conditional_get)
         response.raise_for_status()
         return response.content
 
@@ -43,7 +44,7 @@ class AiWithMikeAdapter(NewsletterAdapter):
             Normalized response dictionary
         """
         articles = []
-        excluded_set = set(excluded_urls)
+        excluded_set = frozenset(excluded_urls)
 
         target_date = datetime.fromisoformat(util.format_date_for_url(date))
         target_date_str = target_date.strftime("%Y-%m-%d")
@@ -52,7 +53,9 @@ class AiWithMikeAdapter(NewsletterAdapter):
 
         try:
             feed_content = self._fetch_feed()
-            feed = feedparser.parse(feed_content)
+            feed = conditional_get_store.memoize_parsed(
+                "feedparser", feed_content, feedparser.parse
+            )
 
             logger.info(f"Fetched {len(feed.entries)} total entries from feed")
 
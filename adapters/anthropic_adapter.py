@@ -10,6 +10,7 @@ import logging
 import re
 from datetime import datetime
 
+from adapters import sitemap_discovery
 from adapters.newsletter_adapter import NewsletterAdapter
 import util
 import summarizer
@@ -37,13 +38,18 @@ class AnthropicResearchAdapter(NewsletterAdapter):
             Normalized response dictionary
         """
         articles = []
-        excluded_set = set(excluded_urls)
+        excluded_set = frozenset(excluded_urls)
 
         target_date = datetime.fromisoformat(util.format_date_for_url(date))
         target_date_str = target_date.strftime("%Y-%m-%d")
 
         logger.info(f"Fetching articles for {target_date_str} (excluding {len(excluded_urls)} URLs)")
 
+        post_urls = sitemap_discovery.discover_post_urls(self.config, target_date.date())
+        if post_urls is not None and not post_urls:
+            logger.info(f"Sitemap lists no research post modified since {target_date_str}, skipping the research page")
+            return self._normalize_response([])
+
         try:
             markdown = summarizer.url_to_markdown(self.research_url)
 
@@ -5,7 +5,8 @@ This adapter fetches articles from the Google DeepMind blog by scraping
 the blog listing page, filtering by date and extracting article metadata.
 
 Note: The listing page shows "recently featured" dates, not original publication
-dates. This adapter fetches each article page to get the real publication date.
+dates. This adapter fetches each article page to get the real publication date,
+limited to the posts the sitemap shows as modified since the target date.
 """
 
 import logging
@@ -14,6 +15,7 @@ from datetime import datetime
 
 from bs4 import BeautifulSoup
 
+from adapters import sitemap_discovery
 from adapters.newsletter_adapter import NewsletterAdapter
 import util
 
@@ -103,12 +105,19 @@ class DeepMindAdapter(NewsletterAdapter):
             Normalized response dictionary
         """
         articles = []
-        excluded_set = set(excluded_urls)
+        excluded_set = frozenset(excluded_urls)
 
         target_date_str = util.format_date_for_url(date)
 
         logger.info(f"Fetching articles for {target_date_str} (excluding {len(excluded_urls)} URLs)")
 
+        post_urls = sitemap_discovery.discover_post_urls(
+            self.config, datetime.fromisoformat(target_date_str).date()
+        )
+        if post_urls is not None and not post_urls:
+            logger.info(f"Sitemap lists no blog post modified since {target_date_str}, skipping the blog page")
+            return self._normalize_response([])
+
         try:
             page_content = self._fetch_page()
             soup = BeautifulSoup(page_content, 'html.parser')
@@ -131,6 +140,10 @@ class DeepMindAdapter(NewsletterAdapter):
                 if canonical_url in excluded_set:
                     continue
 
+                # Unchanged since before the target date, so not published on it: skip the page fetch
+                if post_urls is not None and canonical_url not in post_urls:
+                    continue
+
                 real_publish_date = self._fetch_article_publish_date(full_url)
                 if real_publish_date != target_date_str:
                     continue
@@ -12,6 +12,7 @@ from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+from adapters import sitemap_discovery
 from adapters.newsletter_adapter import NewsletterAdapter
 import util
 
@@ -122,7 +123,7 @@ class GoogleResearchAdapter(NewsletterAdapter):
     def scrape_date(self, date: str, excluded_urls: list[str]) -> dict:
         """Fetch Google Research blog posts for an exact date."""
         articles: list[dict] = []
-        excluded_set = set(excluded_urls)
+        excluded_set = frozenset(excluded_urls)
 
         target_date = datetime.fromisoformat(util.format_date_for_url(date))
         target_date_str = target_date.strftime("%Y-%m-%d")
@@ -134,6 +135,14 @@ class GoogleResearchAdapter(NewsletterAdapter):
             len(excluded_urls),
         )
 
+        post_urls = sitemap_discovery.discover_post_urls(self.config, target_date.date())
+        if post_urls is not None and not post_urls:
+            logger.info(
+                "Sitemap lists no Google Research post modified since %s, skipping archive pages",
+                target_date_str,
+            )
+            return self._normalize_response(articles)
+
         try:
             page_number = 1
             while page_number <= total_pages:
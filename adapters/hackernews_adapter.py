@@ -31,8 +31,24 @@ class HackerNewsAdapter(NewsletterAdapter):
             min_comments=self.min_comments,
             limit=self.max_stories,
         )
+        return self._build_response_from_stories(stories, date_str, excluded_urls)
 
-        excluded_set = set(excluded_urls)
+    async def async_scrape_date(self, date: str, excluded_urls: list[str]) -> dict:
+        """Fetch and normalize Show HN stories for a date on the event loop."""
+        date_str = util.format_date_for_url(date)
+        start_timestamp, end_timestamp_exclusive = util.utc_day_epoch_seconds_bounds(date_str)
+
+        stories = await self._async_fetch_stories_algolia(
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp_exclusive,
+            min_points=self.min_points,
+            min_comments=self.min_comments,
+            limit=self.max_stories,
+        )
+        return self._build_response_from_stories(stories, date_str, excluded_urls)
+
+    def _build_response_from_stories(self, stories: list, date_str: str, excluded_urls: list[str]) -> dict:
+        excluded_set = frozenset(excluded_urls)
         articles = []
         for story in stories:
             url = story.get("url")
@@ -49,16 +65,28 @@ class HackerNewsAdapter(NewsletterAdapter):
     @util.retry()
     def _fetch_stories_algolia(self, start_timestamp: int, end_timestamp: int, min_points: int, min_comments: int, limit: int) -> list:
         """Query Algolia API for show_hn stories in a time range."""
-        params = {
-            "tags": "show_hn",
-            "numericFilters": f"created_at_i>{start_timestamp},created_at_i<{end_timestamp},points>={min_points},num_comments>={min_comments}",
-            "hitsPerPage": limit,
-        }
+        params = self._build_algolia_params(start_timestamp, end_timestamp, min_points, min_comments, limit)
         response = util.fetch(f"{ALGOLIA_API_BASE}/search_by_date", params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
         return data.get("hits", [])
 
+    @util.async_retry()
+    async def _async_fetch_stories_algolia(self, start_timestamp: int, end_timestamp: int, min_points: int, min_comments: int, limit: int) -> list:
+        """Query Algolia API for show_hn stories in a time range, on the event loop."""
+        params = self._build_algolia_params(start_timestamp, end_timestamp, min_points, min_comments, limit)
+        response = await util.async_fetch(f"{ALGOLIA_API_BASE}/search_by_date", params=params, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        return data.get("hits", [])
+
+    def _build_algolia_params(self, start_timestamp: int, end_timestamp: int, min_points: int, min_comments: int, limit: int) -> dict:
+        return {
+            "tags": "show_hn",
+            "numericFilters": f"created_at_i>{start_timestamp},created_at_i<{end_timestamp},points>={min_points},num_comments>={min_comments}",
+            "hitsPerPage": limit,
+        }
+
     def _algolia_story_to_article(self, story: dict, date: str) -> dict | None:
         """Convert a Show HN Algolia story into article payload."""
         if not story.get("url"):
@@ -34,7 +34,7 @@ class JessitronAdapter(NewsletterAdapter):
             Normalized response dictionary with articles and issues
         """
         articles = []
-        excluded_set = set(excluded_urls)
+        excluded_set = frozenset(excluded_urls)
 
         target_date_str = util.format_date_for_url(date)
         target_date = datetime.fromisoformat(target_date_str).date()
@@ -61,7 +61,7 @@ class JessitronAdapter(NewsletterAdapter):
             logger.error(f"Error fetching RSS feed: {e}", exc_info=True)
         return self._normalize_response(articles)
 
-    def _parse_rss_entry(self, entry: dict, target_date: datetime.date, excluded_set: set) -> dict | None:
+    def _parse_rss_entry(self, entry: dict, target_date: datetime.date, excluded_set: frozenset) -> dict | None:
         """Parse RSS entry into article dict if it matches the target date.
 
         Args:
@@ -7,10 +7,9 @@ filtering by date and extracting article metadata.
 
 import logging
 import re
-from datetime import datetime
-
-import feedparser
+from datetime import date, datetime
 
+from adapters import feed_stream
 from adapters.newsletter_adapter import NewsletterAdapter
 import util
 
@@ -21,6 +20,8 @@ logger = logging.getLogger("martin_fowler_adapter")
 class MartinFowlerAdapter(NewsletterAdapter):
     """Adapter for Martin Fowler's blog using Atom RSS feed."""
 
+    supports_range_scrape = True
+
     def __init__(self, config):
         """Initialize with config."""
         super().__init__(config)
@@ -29,7 +30,7 @@ class MartinFowlerAdapter(NewsletterAdapter):
     @util.retry()
     def _fetch_feed(self):
         """Fetch RSS feed content."""
-        response = util.fetch(self.feed_url, timeout=10)
+        response = util.fetch(self.feed_url, timeout=10, conditional=self.config.conditional_get)
         response.raise_for_status()
         return response.content
 
@@ -43,31 +44,43 @@ class MartinFowlerAdapter(NewsletterAdapter):
         Returns:
             Normalized response dictionary
         """
-        articles = []
-        excluded_set = set(excluded_urls)
-
         target_date = datetime.fromisoformat(util.format_date_for_url(date))
         target_date_str = target_date.strftime("%Y-%m-%d")
 
         logger.info(f"Fetching articles for {target_date_str} (excluding {len(excluded_urls)} URLs)")
 
+        articles = self._collect_articles_by_date(frozenset(excluded_urls), target_date.date()).get(target_date_str, [])
+
+        logger.info(f"Found {len(articles)} articles for {target_date_str}")
+        return self._normalize_response(articles)
+
+    def scrape_range(self, start_date, end_date, excluded_urls: list[str]) -> dict[str, dict]:
+        """Fetch the feed once and return per-date results for [start_date, end_date]."""
+        logger.info(
+            f"Fetching articles for {util.format_date_for_url(start_date)}..{util.format_date_for_url(end_date)} "
+            f"(excluding {len(excluded_urls)} URLs)"
+        )
+        since = datetime.fromisoformat(util.format_date_for_url(start_date)).date()
+        articles_by_date = self._collect_articles_by_date(frozenset(excluded_urls), since)
+        return self._normalize_range_response(start_date, end_date, articles_by_date)
+
+    def _collect_articles_by_date(self, excluded_set: frozenset[str], since: date) -> dict[str, list[dict]]:
+        """Fetch and parse the feed down to `since`, indexing non-excluded articles by update date."""
+        articles_by_date: dict[str, list[dict]] = {}
+
         try:
             feed_content = self._fetch_feed()
-            feed = feedparser.parse(feed_content)
+            entries = feed_stream.parse_feed_entries(feed_content, since, dated_by="updated")
 
-            logger.info(f"Fetched {len(feed.entries)} total entries from feed")
+            logger.info(f"Parsed {len(entries)} entries from feed since {since}")
 
-            for entry in feed.entries:
-                if not entry.get('updated_parsed'):
+            for entry in entries:
+                if entry.updated is None:
                     continue
 
-                entry_date = datetime(*entry.updated_parsed[:6])
-                entry_date_str = entry_date.strftime("%Y-%m-%d")
-
-                if entry_date_str != target_date_str:
-                    continue
+                entry_date_str = feed_stream.utc_date_str(entry.updated)
 
-                link = entry.get('link', '')
+                link = entry.link
                 if not link:
                     continue
 
@@ -76,15 +89,13 @@ class MartinFowlerAdapter(NewsletterAdapter):
                 if canonical_url in excluded_set:
                     continue
 
-                article = self._entry_to_article(entry, target_date_str)
+                article = self._entry_to_article(entry, entry_date_str)
                 if article:
-                    articles.append(article)
-
-            logger.info(f"Found {len(articles)} articles for {target_date_str}")
+                    articles_by_date.setdefault(entry_date_str, []).append(article)
 
         except Exception as e:
             logger.error(f"Error fetching feed: {e}", exc_info=True)
-        return self._normalize_response(articles)
+        return articles_by_date
 
     def _strip_html(self, html: str) -> str:
         """Strip HTML tags from text.
@@ -97,25 +108,25 @@ class MartinFowlerAdapter(NewsletterAdapter):
         text = re.sub(r'\s+', ' ', text)
         return text.strip()
 
-    def _entry_to_article(self, entry: dict, date: str) -> dict | None:
+    def _entry_to_article(self, entry: feed_stream.FeedEntry, date: str) -> dict | None:
         """Convert RSS feed entry to article dict.
 
         Args:
-            entry: feedparser entry dictionary
+            entry: Parsed feed entry
             date: Date string
 
         Returns:
             Article dictionary or None if entry should be skipped
         """
-        title = entry.get('title', '')
+        title = entry.title
         if not title:
             return None
 
-        link = entry.get('link', '')
+        link = entry.link
         if not link:
             return None
 
-        summary = entry.get('summary', entry.get('content', [{}])[0].get('value', ''))
+        summary = entry.summary or entry.content
         summary_text = self._strip_html(summary) if summary else ''
 
         if summary_text:
@@ -6,9 +6,9 @@ fetching articles from the Medium RSS feed and filtering them by publication dat
 """
 
 import logging
-import xml.etree.ElementTree as ET
-from datetime import datetime
+from datetime import date, datetime
 
+from adapters import feed_stream
 from adapters.newsletter_adapter import NewsletterAdapter
 import util
 
@@ -19,6 +19,8 @@ logger = logging.getLogger("netflix_adapter")
 class NetflixAdapter(NewsletterAdapter):
     """Adapter for Netflix Tech Blog using Medium RSS feed."""
 
+    supports_range_scrape = True
+
     def __init__(self, config):
         """Initialize with config.
 
@@ -37,134 +39,95 @@ class NetflixAdapter(NewsletterAdapter):
         Returns:
             Normalized response dictionary
         """
-        articles = []
-        excluded_set = set(excluded_urls)
-
-        target_date = datetime.fromisoformat(util.format_date_for_url(date))
+        target_date_str = util.format_date_for_url(date)
 
         logger.info(f"Fetching articles for {date} from RSS feed (excluding {len(excluded_urls)} URLs)")
 
+        since = datetime.fromisoformat(target_date_str).date()
+        articles = self._collect_articles_by_date(frozenset(excluded_urls), since).get(target_date_str, [])
+
+        logger.info(f"Converted {len(articles)} items to articles")
+
+        # Create issue metadata if we have articles
+        return self._normalize_response(articles)
+
+    def scrape_range(self, start_date, end_date, excluded_urls: list[str]) -> dict[str, dict]:
+        """Fetch the RSS feed once and return per-date results for [start_date, end_date]."""
+        logger.info(
+            f"Fetching articles for {util.format_date_for_url(start_date)}..{util.format_date_for_url(end_date)} "
+            f"from RSS feed (excluding {len(excluded_urls)} URLs)"
+        )
+        since = datetime.fromisoformat(util.format_date_for_url(start_date)).date()
+        articles_by_date = self._collect_articles_by_date(frozenset(excluded_urls), since)
+        return self._normalize_range_response(start_date, end_date, articles_by_date)
+
+    def _collect_articles_by_date(self, excluded_set: frozenset[str], since: date) -> dict[str, list[dict]]:
+        """Fetch the RSS feed and index non-excluded articles published since `since` by date."""
+        articles_by_date: dict[str, list[dict]] = {}
+
         try:
-            feed_items = self._fetch_rss_feed()
+            feed_items = feed_stream.parse_feed_entries(self._fetch_rss_feed(), since)
 
-            logger.info(f"Fetched {len(feed_items)} total items from RSS feed")
+            logger.info(f"Parsed {len(feed_items)} items from RSS feed since {since}")
 
-            # Filter items by date and excluded URLs
-            filtered_items = []
             for item in feed_items:
-                pub_date = self._parse_pub_date(item.get('pubDate', ''))
+                pub_date = item.published
                 if pub_date is None:
                     continue
 
-                # Check if article was published on target date
-                if pub_date.date() != target_date.date():
-                    continue
-
                 # Check if URL is excluded
-                url = item.get('link', '')
+                url = item.link
                 if not url:
                     continue
 
                 canonical_url = util.canonicalize_url(url)
-                if canonical_url not in excluded_set:
-                    filtered_items.append(item)
-
-            logger.info(f"{len(filtered_items)} articles match date {date}")
+                if canonical_url in excluded_set:
+                    continue
 
-            # Convert to article format
-            for item in filtered_items:
-                article = self._rss_item_to_article(item, date)
+                pub_date_str = pub_date.date().isoformat()
+                article = self._rss_item_to_article(item, pub_date_str)
                 if article:
-                    articles.append(article)
-
-            logger.info(f"Converted {len(articles)} items to articles")
+                    articles_by_date.setdefault(pub_date_str, []).append(article)
 
         except Exception as e:
             logger.error(f"Error fetching RSS feed: {e}", exc_info=True)
 
-        # Create issue metadata if we have articles
-        return self._normalize_response(articles)
+        return articles_by_date
 
     @util.retry()
-    def _fetch_rss_feed(self) -> list[dict]:
-        """Fetch and parse the RSS feed."""
+    def _fetch_rss_feed(self) -> bytes:
+        """Fetch the RSS feed content."""
         response = util.fetch(
             self.rss_url,
             timeout=30,
-            headers={'User-Agent': self.config.user_agent}
+            headers={'User-Agent': self.config.user_agent},
+            conditional=self.config.conditional_get,
         )
         response.raise_for_status()
-        root = ET.fromstring(response.content)
-        channel = root.find('channel')
-
-        if channel is None:
-            logger.warning("No channel found in RSS feed")
-            return []
-
-        items = []
-        for item_elem in channel.findall('item'):
-            title = item_elem.find('title')
-            link = item_elem.find('link')
-            pub_date = item_elem.find('pubDate')
-
-            # Medium RSS feeds include content:encoded with full HTML
-            content_ns = '{http://purl.org/rss/1.0/modules/content/}'
-            content_encoded = item_elem.find(f'{content_ns}encoded')
-
-            # Get all categories
-            categories = [cat.text for cat in item_elem.findall('category') if cat.text]
-
-            items.append({
-                'title': title.text if title is not None else '',
-                'link': link.text if link is not None else '',
-                'pubDate': pub_date.text if pub_date is not None else '',
-                'content': content_encoded.text if content_encoded is not None else '',
-                'categories': categories,
-            })
-
-        return items
-
-    def _parse_pub_date(self, pub_date_str: str) -> datetime | None:
-        """Parse RSS pubDate format to datetime.
-
-        Args:
-            pub_date_str: Date string in RSS format (RFC 822/2822)
-
-        Returns:
-            datetime object or None if parsing fails
-        """
-        if not pub_date_str:
-            return None
-
-        try:
-            # RSS 2.0 uses RFC 822/2822 format: "Tue, 04 Nov 2025 20:33:44 GMT"
-            return datetime.strptime(pub_date_str, '%a, %d %b %Y %H:%M:%S %Z')
-        except ValueError:
-            logger.warning(f"Failed to parse date: {pub_date_str}")
-            return None
+        return response.content
 
-    def _rss_item_to_article(self, item: dict, date: str) -> dict | None:
+    def _rss_item_to_article(self, item: feed_stream.FeedEntry, date: str) -> dict | None:
         """Convert RSS item to article dict.
 
         Args:
-            item: RSS item dictionary
+            item: Parsed RSS item
             date: Date string
 
         Returns:
             Article dictionary or None if item should be skipped
         """
-        title = item.get('title', '').strip()
-        url = item.get('link', '').strip()
+        title = item.title
+        url = item.link
 
         if not title or not url:
             return None
 
         # Get categories for metadata
-        categories = item.get('categories', [])
+        categories = item.categories
         category_str = ', '.join(categories[:3]) if categories else ''
 
         # Extract excerpt from content (strip HTML tags)
-        content = item.get('content', '')
+        content = item.content
         excerpt = self._extract_text_from_html(content)[:150]
 
         # Build article_meta with categories and excerpt length
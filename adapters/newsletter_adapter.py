@@ -6,6 +6,10 @@ providing a template method pattern for fetching, parsing, and normalizing
 newsletter content from different sources.
 """
 
+import asyncio
+import threading
+from datetime import datetime
+
 from bs4 import BeautifulSoup
 import html2text
 
@@ -19,8 +23,21 @@ class NewsletterAdapter:
     Subclasses can either:
     1. Implement fetch_issue and parse_articles for HTML-based sources
     2. Override scrape_date() entirely for API-based sources or custom workflows
+
+    Sources that list many dates in one document (RSS/Atom feeds) can additionally
+    override scrape_range() and set supports_range_scrape, so a multi-day scrape
+    fetches the source once instead of once per date.
+
+    One instance per source is shared by every scrape thread (see adapters.registry),
+    so instance state must be safe for concurrent use.
+
+    The asyncio scrape engine calls the async_* hooks. By default they bridge to the
+    sync methods on a worker thread; adapters can override async_fetch_issue() or
+    async_scrape_date() with util.async_fetch() to run natively on the event loop.
     """
 
+    supports_range_scrape = False
+
     def __init__(self, config: NewsletterSourceConfig):
         """Initialize adapter with source configuration.
 
@@ -28,13 +45,26 @@ class NewsletterAdapter:
             config: Configuration object defining source-specific settings
         """
         self.config = config
-        # Configure html2text for optimal conversion
-        self.h = html2text.HTML2Text()
-        self.h.body_width = 0  # Don't wrap lines
-        self.h.unicode_snob = True  # Use unicode instead of ASCII approximations
-        self.h.ignore_images = True  # Skip images, we only need text
-        self.h.protect_links = True  # Don't wrap URLs
-        self.h.single_line_break = True  # Use single line breaks
+        self._thread_local = threading.local()
+
+    @property
+    def h(self) -> html2text.HTML2Text:
+        """This thread's html2text converter.
+
+        Adapter instances are shared process-wide (see adapters.registry) and
+        HTML2Text keeps parse state on the instance, so each thread gets its own.
+        """
+        converter = getattr(self._thread_local, "html2text", None)
+        if converter is None:
+            # Configure html2text for optimal conversion
+            converter = html2text.HTML2Text()
+            converter.body_width = 0  # Don't wrap lines
+            converter.unicode_snob = True  # Use unicode instead of ASCII approximations
+            converter.ignore_images = True  # Skip images, we only need text
+            converter.protect_links = True  # Don't wrap URLs
+            converter.single_line_break = True  # Use single line breaks
+            self._thread_local.html2text = converter
+        return converter
 
     def fetch_issue(self, date: str, newsletter_type: str) -> str | None:
         """Fetch raw HTML for a specific issue.
@@ -87,23 +117,112 @@ class NewsletterAdapter:
         (e.g., API-based sources that don't use HTML conversion).
         """
         articles = []
-        excluded_set = set(excluded_urls)
+        excluded_set = frozenset(excluded_urls)
 
         for newsletter_type in self.config.types:
             html = self.fetch_issue(date, newsletter_type)
             if html is None:
                 continue
+            articles.extend(self._parse_issue_html(html, date, newsletter_type, excluded_set))
+
+        return self._normalize_response(articles)
 
-            markdown = self._html_to_markdown(html)
-            parsed_articles = self.parse_articles(markdown, date, newsletter_type)
+    def missing_issue_keys(self, date: str) -> list[str]:
+        """Return the issue keys a scrape of date depends on, for the missing-issue cache.
+
+        Adapters that report nonexistent issues to missing_issue_store override this so
+        the orchestrator can skip a date whose issues are all known missing. The default
+        empty list means the source is always scraped.
+
+        Args:
+            date: Date string in YYYY-MM-DD format
+
+        Returns:
+            Issue keys as passed to missing_issue_store.record_missing()
+        """
+        return []
+
+    def _parse_issue_html(
+        self, html: str, date: str, newsletter_type: str, excluded_set: frozenset[str]
+    ) -> list[dict]:
+        """Convert one fetched issue to markdown, parse it and drop excluded articles."""
+        markdown = self._html_to_markdown(html)
+        parsed_articles = self.parse_articles(markdown, date, newsletter_type)
+        return [
+            article
+            for article in parsed_articles
+            if util.canonicalize_url(article['url']) not in excluded_set
+        ]
+
+    async def async_fetch_issue(self, date: str, newsletter_type: str) -> str | None:
+        """Async hook for fetch_issue(). Defaults to running fetch_issue() on a worker thread."""
+        return await asyncio.to_thread(self.fetch_issue, date, newsletter_type)
+
+    async def async_scrape_date(self, date: str, excluded_urls: list[str]) -> dict:
+        """Async hook for scrape_date().
+
+        Adapters that override scrape_date() are bridged to a worker thread as a whole.
+        Template-method adapters await async_fetch_issue() for every type concurrently
+        and parse the fetched issues off the event loop.
+        """
+        if type(self).scrape_date is not NewsletterAdapter.scrape_date:
+            return await asyncio.to_thread(self.scrape_date, date, excluded_urls)
 
-            for article in parsed_articles:
-                canonical_url = util.canonicalize_url(article['url'])
-                if canonical_url not in excluded_set:
-                    articles.append(article)
+        excluded_set = frozenset(excluded_urls)
+        htmls = await asyncio.gather(
+            *(self.async_fetch_issue(date, newsletter_type) for newsletter_type in self.config.types)
+        )
+        articles = []
+        for newsletter_type, html in zip(self.config.types, htmls):
+            if html is None:
+                continue
+            articles.extend(
+                await asyncio.to_thread(
+                    self._parse_issue_html, html, date, newsletter_type, excluded_set
+                )
+            )
 
         return self._normalize_response(articles)
 
+    def scrape_range(self, start_date, end_date, excluded_urls: list[str]) -> dict[str, dict]:
+        """Fetch the source once and return per-date results for [start_date, end_date].
+
+        Optional. Only called by the orchestrator when supports_range_scrape is True;
+        other adapters are scraped with one scrape_date() call per date.
+
+        Args:
+            start_date: First date of the range (date or YYYY-MM-DD string)
+            end_date: Last date of the range, inclusive
+            excluded_urls: List of canonical URLs to exclude from results
+
+        Returns:
+            Mapping of YYYY-MM-DD date string to normalized response, one per date in range
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support range scraping"
+        )
+
+    async def async_scrape_range(self, start_date, end_date, excluded_urls: list[str]) -> dict[str, dict]:
+        """Async hook for scrape_range(). Defaults to running scrape_range() on a worker thread."""
+        return await asyncio.to_thread(self.scrape_range, start_date, end_date, excluded_urls)
+
+    def _normalize_range_response(
+        self, start_date, end_date, articles_by_date: dict[str, list[dict]]
+    ) -> dict[str, dict]:
+        """Normalize date-indexed articles into one response per date in the range.
+
+        Dates without articles map to an empty response so callers can tell
+        "scraped, nothing published" apart from "not scraped".
+        """
+        start = datetime.fromisoformat(util.format_date_for_url(start_date))
+        end = datetime.fromisoformat(util.format_date_for_url(end_date))
+        return {
+            util.format_date_for_url(current_date): self._normalize_response(
+                articles_by_date.get(util.format_date_for_url(current_date), [])
+            )
+            for current_date in util.get_date_range(start, end)
+        }
+
     def _html_to_markdown(self, html: str) -> str:
         """Convert HTML to markdown using BeautifulSoup and html2text.
 
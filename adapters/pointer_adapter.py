@@ -11,6 +11,8 @@ The adapter:
 
 import logging
 import re
+import threading
+import time
 from datetime import datetime
 
 from bs4 import BeautifulSoup
@@ -21,6 +23,8 @@ import util
 
 logger = logging.getLogger("pointer_adapter")
 
+DATE_TO_URL_CACHE_TTL_SECONDS = 15 * 60
+
 
 class PointerAdapter(NewsletterAdapter):
     """Adapter for Pointer newsletter."""
@@ -29,6 +33,8 @@ class PointerAdapter(NewsletterAdapter):
         """Initialize with config."""
         super().__init__(config)
         self._date_to_url_cache = None
+        self._date_to_url_cache_built_at = 0.0
+        self._date_to_url_cache_lock = threading.Lock()
 
     @util.retry()
     def _fetch_page(self, url: str) -> str:
@@ -57,7 +63,7 @@ class PointerAdapter(NewsletterAdapter):
             Normalized response dictionary
         """
         articles = []
-        excluded_set = set(excluded_urls)
+        excluded_set = frozenset(excluded_urls)
 
         date_str = util.format_date_for_url(date)
 
@@ -96,10 +102,18 @@ class PointerAdapter(NewsletterAdapter):
         Returns:
             Issue URL or None if not found
         """
-        if self._date_to_url_cache is None:
-            self._date_to_url_cache = self._build_date_to_url_mapping()
-
-        return self._date_to_url_cache.get(target_date)
+        date_to_url = self._date_to_url_cache
+        if date_to_url is not None and target_date in date_to_url:
+            return date_to_url[target_date]
+
+        # The adapter outlives a single request, so a miss rebuilds the mapping once
+        # it is old enough to be missing newly published issues.
+        with self._date_to_url_cache_lock:
+            cache_age = time.monotonic() - self._date_to_url_cache_built_at
+            if self._date_to_url_cache is None or cache_age > DATE_TO_URL_CACHE_TTL_SECONDS:
+                self._date_to_url_cache = self._build_date_to_url_mapping()
+                self._date_to_url_cache_built_at = time.monotonic()
+            return self._date_to_url_cache.get(target_date)
 
     def _build_date_to_url_mapping(self) -> dict[str, str]:
         """Build mapping of dates to issue URLs from archives page."""
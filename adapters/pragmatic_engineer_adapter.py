@@ -13,6 +13,7 @@ from datetime import datetime
 import feedparser
 
 from adapters.newsletter_adapter import NewsletterAdapter
+import conditional_get_store
 import util
 
 
@@ -30,7 +31,8 @@ class PragmaticEngineerAdapter(NewsletterAdapter):
         response = util.fetch(
             RSS_FEED_URL,
             timeout=10,
-            headers={'User-Agent': self.config.user_agent}
+            headers={'User-Agent': self.config.user_agent},
+            conditional=self.config.conditional_get,
         )
         response.raise_for_status()
         return response.content
@@ -46,7 +48,7 @@ class PragmaticEngineerAdapter(NewsletterAdapter):
             Normalized response dictionary with articles and issues
         """
         articles = []
-        excluded_set = set(excluded_urls)
+        excluded_set = frozenset(excluded_urls)
 
         target_date_str = util.format_date_for_url(date)
         target_date = datetime.fromisoformat(target_date_str).date()
@@ -55,7 +57,9 @@ class PragmaticEngineerAdapter(NewsletterAdapter):
 
         try:
             feed_content = self._fetch_feed()
-            feed = feedparser.parse(feed_content)
+            feed = conditional_get_store.memoize_parsed(
+                "feedparser", feed_content, feedparser.parse
+            )
 
             if not feed.entries:
                 logger.warning(f"No entries found in RSS feed")
@@ -74,7 +78,7 @@ class PragmaticEngineerAdapter(NewsletterAdapter):
             logger.error(f"Error fetching RSS feed: {e}", exc_info=True)
         return self._normalize_response(articles)
 
-    def _parse_rss_entry(self, entry: dict, target_date: datetime.date, excluded_set: set) -> dict | None:
+    def _parse_rss_entry(self, entry: dict, target_date: datetime.date, excluded_set: frozenset) -> dict | None:
         """Parse RSS entry into article dict if it matches the target date.
 
         Args:
@@ -12,13 +12,13 @@ The adapter:
 
 import logging
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 
-import feedparser
 from bs4 import BeautifulSoup
-from curl_cffi import requests as curl_requests
 
+from adapters import feed_stream
 from adapters.newsletter_adapter import NewsletterAdapter
+import http_sessions
 import util
 
 
@@ -33,7 +33,7 @@ class ReactStatusAdapter(NewsletterAdapter):
     @util.retry()
     def _fetch_feed(self):
         """Fetch RSS feed content."""
-        response = util.fetch(RSS_FEED_URL, timeout=10)
+        response = util.fetch(RSS_FEED_URL, timeout=10, conditional=self.config.conditional_get)
         response.raise_for_status()
         return response.content
 
@@ -54,7 +54,7 @@ class ReactStatusAdapter(NewsletterAdapter):
             Normalized response dictionary with articles and issues
         """
         articles = []
-        excluded_set = set(excluded_urls)
+        excluded_set = frozenset(excluded_urls)
 
         target_date_str = util.format_date_for_url(date)
         target_date = datetime.fromisoformat(target_date_str).date()
@@ -63,16 +63,13 @@ class ReactStatusAdapter(NewsletterAdapter):
 
         try:
             feed_content = self._fetch_feed()
-            feed = feedparser.parse(feed_content)
+            # Issues older than the target date cannot match, so parsing stops there
+            entries = feed_stream.parse_feed_entries(feed_content, target_date)
 
-            if not feed.entries:
-                logger.warning("No entries found in RSS feed")
-                return self._normalize_response([])
-
-            logger.info(f"Fetched {len(feed.entries)} issues from RSS")
+            logger.info(f"Parsed {len(entries)} issues from RSS since {target_date_str}")
 
             # Find the issue for the target date
-            matching_entry = self._find_matching_issue(feed.entries, target_date)
+            matching_entry = self._find_matching_issue(entries, target_date)
 
             if not matching_entry:
                 logger.info(f"No issue found for {target_date_str}")
@@ -91,7 +88,9 @@ class ReactStatusAdapter(NewsletterAdapter):
             logger.error(f"Error fetching RSS feed: {e}", exc_info=True)
         return self._normalize_response(articles)
 
-    def _find_matching_issue(self, entries: list, target_date: datetime.date) -> dict | None:
+    def _find_matching_issue(
+        self, entries: list[feed_stream.FeedEntry], target_date: datetime.date
+    ) -> feed_stream.FeedEntry | None:
         """Find the RSS entry matching the target date.
 
         React Status publishes weekly. This finds the issue published on or
@@ -105,11 +104,10 @@ class ReactStatusAdapter(NewsletterAdapter):
             Matching RSS entry or None if not found
         """
         for entry in entries:
-            published_parsed = entry.get('published_parsed')
-            if not published_parsed:
+            if entry.published is None:
                 continue
 
-            entry_date = datetime(*published_parsed[:3]).date()
+            entry_date = entry.published.astimezone(timezone.utc).date()
 
             # For weekly newsletters, use the exact date or find the most recent issue
             if entry_date == target_date:
@@ -118,19 +116,19 @@ class ReactStatusAdapter(NewsletterAdapter):
         return None
 
     def _parse_issue_articles(
-        self, entry: dict, date_str: str, excluded_set: set
+        self, entry: feed_stream.FeedEntry, date_str: str, excluded_set: frozenset
     ) -> list[dict]:
         """Parse articles from an RSS feed entry.
 
         Args:
-            entry: RSS feed entry dictionary
+            entry: Parsed RSS feed entry
             date_str: Date string in YYYY-MM-DD format
             excluded_set: Set of canonical URLs to exclude
 
         Returns:
             List of article dictionaries
         """
-        summary_html = entry.get('summary', '')
+        summary_html = entry.summary
         if not summary_html:
             return []
 
@@ -205,7 +203,7 @@ class ReactStatusAdapter(NewsletterAdapter):
             Actual destination URL or None if resolution fails
         """
         try:
-            response = curl_requests.head(
+            response = http_sessions.curl_head(
                 tracking_url,
                 impersonate="chrome131",
                 allow_redirects=True,
@@ -0,0 +1,125 @@
+"""
+Declarative source_id → adapter class registry with process-wide adapter instances.
+
+Adapter modules are imported lazily the first time their source is used, and each
+source gets one adapter instance for the lifetime of the process. Adapter-level
+caches (e.g. Pointer's archive mapping) therefore survive across tasks and requests,
+so adapters must be safe to call from several scrape threads at once.
+
+Import and construction times are recorded per source and exposed via stats().
+"""
+
+import importlib
+import logging
+import threading
+import time
+
+from newsletter_config import NewsletterSourceConfig
+
+
+logger = logging.getLogger("adapter_registry")
+
+# source_id → "module:ClassName". Sources whose id starts with "tldr_" share TLDRAdapter.
+ADAPTER_CLASS_PATHS: dict[str, str] = {
+    "hackernews": "adapters.hackernews_adapter:HackerNewsAdapter",
+    "simon_willison": "adapters.simon_willison_adapter:SimonWillisonAdapter",
+    "danluu": "adapters.danluu_adapter:DanLuuAdapter",
+    "will_larson": "adapters.will_larson_adapter:WillLarsonAdapter",
+    "pragmatic_engineer": "adapters.pragmatic_engineer_adapter:PragmaticEngineerAdapter",
+    "jessitron": "adapters.jessitron_adapter:JessitronAdapter",
+    "stripe_engineering": "adapters.stripe_engineering_adapter:StripeEngineeringAdapter",
+    "deepmind": "adapters.deepmind_adapter:DeepMindAdapter",
+    "google_research": "adapters.google_research_adapter:GoogleResearchAdapter",
+    "pointer": "adapters.pointer_adapter:PointerAdapter",
+    "softwareleadweekly": "adapters.softwareleadweekly_adapter:SoftwareLeadWeeklyAdapter",
+    "anthropic": "adapters.anthropic_adapter:AnthropicResearchAdapter",
+    "anthropic_news": "adapters.anthropic_news_adapter:AnthropicNewsAdapter",
+    "claude_blog": "adapters.claude_blog_adapter:ClaudeBlogAdapter",
+    "netflix": "adapters.netflix_adapter:NetflixAdapter",
+    "hillel_wayne": "adapters.hillel_wayne_adapter:HillelWayneAdapter",
+    "martin_fowler": "adapters.martin_fowler_adapter:MartinFowlerAdapter",
+    "react_status": "adapters.react_status_adapter:ReactStatusAdapter",
+    "aiwithmike": "adapters.aiwithmike_adapter:AiWithMikeAdapter",
+    "savannah_ostrowski": "adapters.savannah_adapter:SavannahAdapter",
+    "lucumr": "adapters.lucumr_adapter:LucumrAdapter",
+    "trendshift": "adapters.trendshift_adapter:TrendshiftAdapter",
+}
+_TLDR_ADAPTER_CLASS_PATH = "adapters.tldr_adapter:TLDRAdapter"
+
+_instances_lock = threading.Lock()
+_instances: dict[str, object] = {}
+_timings: dict[str, dict] = {}
+
+
+def resolve_adapter_class_path(source_id: str) -> str:
+    """Return the "module:ClassName" path registered for source_id.
+
+    >>> resolve_adapter_class_path("tldr_ai")
+    'adapters.tldr_adapter:TLDRAdapter'
+    >>> resolve_adapter_class_path("nope")
+    Traceback (most recent call last):
+    ...
+    ValueError: No adapter registered for source: nope
+    """
+    if source_id.startswith("tldr_"):
+        return _TLDR_ADAPTER_CLASS_PATH
+    class_path = ADAPTER_CLASS_PATHS.get(source_id)
+    if class_path is None:
+        raise ValueError(f"No adapter registered for source: {source_id}")
+    return class_path
+
+
+def load_adapter_class(source_id: str) -> type:
+    """Import and return the adapter class for source_id."""
+    module_name, class_name = resolve_adapter_class_path(source_id).split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_adapter(config: NewsletterSourceConfig):
+    """Return the process-wide adapter instance for config.source_id, building it on first use.
+
+    Raises:
+        ValueError: If no adapter exists for the source
+    """
+    source_id = config.source_id
+    adapter = _instances.get(source_id)
+    if adapter is not None:
+        return adapter
+
+    with _instances_lock:
+        adapter = _instances.get(source_id)
+        if adapter is not None:
+            return adapter
+
+        import_start = time.perf_counter()
+        adapter_class = load_adapter_class(source_id)
+        construct_start = time.perf_counter()
+        adapter = adapter_class(config)
+        construct_end = time.perf_counter()
+
+        _timings[source_id] = {
+            "import_ms": round((construct_start - import_start) * 1000, 2),
+            "construct_ms": round((construct_end - construct_start) * 1000, 2),
+        }
+        _instances[source_id] = adapter
+        logger.info(
+            "adapter ready source=%s class=%s import_ms=%s construct_ms=%s",
+            source_id,
+            adapter_class.__name__,
+            _timings[source_id]["import_ms"],
+            _timings[source_id]["construct_ms"],
+        )
+        return adapter
+
+
+def stats() -> dict[str, dict]:
+    """Return {source_id: {import_ms, construct_ms}} for every adapter built so far."""
+    with _instances_lock:
+        return {source_id: dict(timing) for source_id, timing in sorted(_timings.items())}
+
+
+def reset() -> None:
+    """Drop all adapter instances so the next get_adapter() rebuilds them."""
+    with _instances_lock:
+        _instances.clear()
+        _timings.clear()
@@ -0,0 +1,161 @@
+"""
+Sitemap-driven post discovery for listing-page adapters.
+
+Listing pages are large HTML documents (or paid Firecrawl calls), and a date
+usually has no new post. A source's sitemap.xml gives every post URL with a
+lastmod date, and a post cannot have been published on a date after it was last
+modified. discover_post_urls() reads the sitemap through a conditional GET, so an
+unchanged sitemap costs one 304, and returns the post URLs modified on or after
+the requested date. An empty result lets the adapter answer without fetching the
+listing at all.
+
+The gate only applies while the date is still open, i.e. a later scrape would
+replace this one. A date's final scrape would be cached as final, and a sitemap
+that has not caught up yet (lastmod is regenerated on the site's schedule) would
+then leave the date empty for good, so final scrapes read the listing instead.
+
+Sources opt in with NewsletterSourceConfig.sitemap_url and sitemap_path_prefix.
+Sitemap indexes are followed, skipping child sitemaps whose lastmod is older than
+the window. When the sitemap cannot be fetched or parsed, discovery returns None
+and the adapter falls back to its listing page.
+"""
+
+import io
+import logging
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+import conditional_get_store
+import util
+
+
+logger = logging.getLogger("sitemap_discovery")
+
+# Index -> child sitemap is as deep as real sites nest them
+MAX_SITEMAP_DEPTH = 2
+
+# lastmod is often UTC while pages show the site's local date; allow a day either way
+LASTMOD_SLACK = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class SitemapEntry:
+    """One <url> or child <sitemap> entry; lastmod is None when the sitemap omits it."""
+
+    loc: str
+    lastmod: date | None
+
+
+def _parse_lastmod(value: str | None) -> date | None:
+    """Parse a W3C datetime lastmod to its calendar date.
+
+    >>> _parse_lastmod("2026-03-04T18:20:00+00:00")
+    datetime.date(2026, 3, 4)
+    >>> _parse_lastmod("2026-03-04")
+    datetime.date(2026, 3, 4)
+    >>> _parse_lastmod("yesterday") is None
+    True
+    """
+    if not value or not value.strip():
+        return None
+    try:
+        return datetime.fromisoformat(value.strip().replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
+
+
+def parse_sitemap(body: bytes) -> tuple[tuple[SitemapEntry, ...], tuple[SitemapEntry, ...]]:
+    """Split a sitemap or sitemap index into (page URLs, child sitemaps).
+
+    >>> pages, children = parse_sitemap(b'''<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    ... <url><loc>https://a.example/blog/post</loc><lastmod>2026-03-04</lastmod></url>
+    ... </urlset>''')
+    >>> pages, children
+    ((SitemapEntry(loc='https://a.example/blog/post', lastmod=datetime.date(2026, 3, 4)),), ())
+    """
+    pages: list[SitemapEntry] = []
+    children: list[SitemapEntry] = []
+    for _, elem in ET.iterparse(io.BytesIO(body), events=("end",)):
+        kind = elem.tag.rsplit("}", 1)[-1]
+        if kind not in ("url", "sitemap"):
+            continue
+        fields = {child.tag.rsplit("}", 1)[-1]: (child.text or "").strip() for child in elem}
+        elem.clear()
+        if not fields.get("loc"):
+            continue
+        entry = SitemapEntry(loc=fields["loc"], lastmod=_parse_lastmod(fields.get("lastmod")))
+        (pages if kind == "url" else children).append(entry)
+    return tuple(pages), tuple(children)
+
+
+@util.retry()
+def _fetch_sitemap(sitemap_url: str) -> bytes:
+    response = util.fetch(sitemap_url, timeout=10, conditional=True)
+    response.raise_for_status()
+    return response.content
+
+
+def _modified_since(entry: SitemapEntry, since: date) -> bool:
+    # No lastmod cannot rule the entry out
+    return entry.lastmod is None or entry.lastmod >= since - LASTMOD_SLACK
+
+
+def _collect_pages(sitemap_url: str, since: date, depth: int) -> list[SitemapEntry]:
+    body = _fetch_sitemap(sitemap_url)
+    pages, children = conditional_get_store.memoize_parsed("sitemap", body, parse_sitemap)
+    collected = [page for page in pages if _modified_since(page, since)]
+    if depth >= MAX_SITEMAP_DEPTH:
+        if children:
+            logger.warning(f"Not following {len(children)} sitemaps nested deeper than {MAX_SITEMAP_DEPTH} in {sitemap_url}")
+        return collected
+    for child in children:
+        if _modified_since(child, since):
+            collected.extend(_collect_pages(child.loc, since, depth + 1))
+    return collected
+
+
+def _is_final_scrape(config, since: date, now_epoch_seconds: float | None = None) -> bool:
+    """Return True when a scrape of `since` made now would be cached as final.
+
+    >>> from newsletter_config import NEWSLETTER_CONFIGS
+    >>> _is_final_scrape(NEWSLETTER_CONFIGS["claude_blog"], date(2026, 3, 4), now_epoch_seconds=1772650800)
+    False
+    >>> _is_final_scrape(NEWSLETTER_CONFIGS["claude_blog"], date(2026, 3, 4), now_epoch_seconds=1772900000)
+    True
+    """
+    now_epoch_seconds = time.time() if now_epoch_seconds is None else now_epoch_seconds
+    return not util.should_rescrape(
+        since.isoformat(), now_epoch_seconds, settle_seconds=config.rescrape_settle_hours * 3600
+    )
+
+
+def discover_post_urls(config, since: date) -> set[str] | None:
+    """Return canonical URLs of the source's posts modified on or after `since`.
+
+    Only URLs under config.sitemap_path_prefix count as posts. Returns None when the
+    source has no sitemap configured, its sitemap could not be read, or this scrape of
+    `since` is final, so the caller must fall back to its listing page.
+    """
+    if not config.sitemap_url:
+        return None
+    if _is_final_scrape(config, since):
+        logger.info(f"Final scrape of {since}, reading the listing page instead of trusting {config.sitemap_url}")
+        return None
+    try:
+        pages = _collect_pages(config.sitemap_url, since, depth=1)
+    except util.DeadlineExceeded:
+        raise
+    except Exception as e:
+        logger.warning(f"Sitemap discovery failed for {config.sitemap_url}, using listing page: {e}")
+        return None
+
+    prefix = config.sitemap_path_prefix
+    candidates = {
+        util.canonicalize_url(page.loc)
+        for page in pages
+        if page.loc.startswith(prefix) and page.loc.rstrip("/") != prefix.rstrip("/")
+    }
+    logger.info(f"Sitemap {config.sitemap_url} lists {len(candidates)} posts under {prefix} modified since {since}")
+    return candidates
@@ -12,6 +12,7 @@ import re
 from datetime import datetime, timedelta
 
 from adapters.newsletter_adapter import NewsletterAdapter
+import missing_issue_store
 import util
 
 
@@ -46,7 +47,7 @@ class SoftwareLeadWeeklyAdapter(NewsletterAdapter):
             Normalized response dictionary
         """
         articles = []
-        excluded_set = set(excluded_urls)
+        excluded_set = frozenset(excluded_urls)
 
         target_date = datetime.fromisoformat(util.format_date_for_url(date))
         target_date_str = target_date.strftime("%Y-%m-%d")
@@ -63,6 +64,9 @@ class SoftwareLeadWeeklyAdapter(NewsletterAdapter):
             html = self.fetch_issue(str(issue_number), "newsletter")
             if html is None:
                 logger.info(f"No content found for issue {issue_number}")
+                missing_issue_store.record_missing(
+                    self.config.source_id, str(issue_number), issue_date.strftime("%Y-%m-%d"), "404"
+                )
                 return self._normalize_response([])
 
             markdown = self._html_to_markdown(html)
@@ -79,6 +83,15 @@ class SoftwareLeadWeeklyAdapter(NewsletterAdapter):
             logger.error(f"Error fetching issue {issue_number}: {e}", exc_info=True)
         return self._normalize_response(articles)
 
+    def missing_issue_keys(self, date: str) -> list[str]:
+        """Return the issue number that date maps to.
+
+        >>> SoftwareLeadWeeklyAdapter(None).missing_issue_keys("2025-11-16")
+        ['677']
+        """
+        target_date = datetime.fromisoformat(util.format_date_for_url(date))
+        return [str(self._calculate_issue_number(self._get_issue_date_for_target(target_date)))]
+
     def _get_issue_date_for_target(self, target_date: datetime) -> datetime:
         """Get the Friday that corresponds to the target date.
 
@@ -11,6 +11,7 @@ import os
 from datetime import datetime
 from firecrawl import FirecrawlApp
 
+from adapters import sitemap_discovery
 from adapters.newsletter_adapter import NewsletterAdapter
 import util
 
@@ -39,13 +40,18 @@ class StripeEngineeringAdapter(NewsletterAdapter):
             Normalized response dictionary
         """
         articles = []
-        excluded_set = set(excluded_urls)
+        excluded_set = frozenset(excluded_urls)
 
         target_date = datetime.fromisoformat(util.format_date_for_url(date))
         target_date_str = target_date.strftime("%Y-%m-%d")
 
         logger.info(f"Fetching articles for {target_date_str} (excluding {len(excluded_urls)} URLs)")
 
+        post_urls = sitemap_discovery.discover_post_urls(self.config, target_date.date())
+        if post_urls is not None and not post_urls:
+            logger.info(f"Sitemap lists no blog post modified since {target_date_str}, skipping the Firecrawl scrape")
+            return self._normalize_response([])
+
         try:
             result = self.firecrawl.scrape(self.blog_url)
             markdown = result.markdown
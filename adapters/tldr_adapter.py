@@ -13,6 +13,7 @@ import unicodedata
 from dataclasses import dataclass
 
 from adapters.newsletter_adapter import NewsletterAdapter
+import missing_issue_store
 import util
 
 
@@ -46,9 +47,7 @@ class TLDRAdapter(NewsletterAdapter):
     def fetch_issue(self, date: str, newsletter_type: str) -> str | None:
         """Fetch TLDR newsletter HTML for a specific date and type."""
         date_str = util.format_date_for_url(date)
-        url = self.config.url_pattern.format(
-            base_url=self.config.base_url, type=newsletter_type, date=date_str
-        )
+        url = self._build_issue_url(date_str, newsletter_type)
 
         net_start = time.time()
         response = util.fetch(
@@ -57,19 +56,66 @@ class TLDRAdapter(NewsletterAdapter):
             headers={"User-Agent": self.config.user_agent},
             allow_redirects=False,
         )
+        return self._issue_html_from_response(response, date_str, newsletter_type, net_start)
+
+    @util.async_retry()
+    async def async_fetch_issue(self, date: str, newsletter_type: str) -> str | None:
+        """Fetch TLDR newsletter HTML on the event loop."""
+        date_str = util.format_date_for_url(date)
+        url = self._build_issue_url(date_str, newsletter_type)
+
+        net_start = time.time()
+        response = await util.async_fetch(
+            url,
+            timeout=30,
+            headers={"User-Agent": self.config.user_agent},
+            allow_redirects=False,
+        )
+        return self._issue_html_from_response(response, date_str, newsletter_type, net_start)
+
+    def missing_issue_keys(self, date: str) -> list[str]:
+        """Return one issue key per newsletter type for date.
+
+        >>> from newsletter_config import NEWSLETTER_CONFIGS
+        >>> TLDRAdapter(NEWSLETTER_CONFIGS["tldr_ai"]).missing_issue_keys("2025-01-04")
+        ['2025-01-04/ai']
+        """
+        date_str = util.format_date_for_url(date)
+        return [f"{date_str}/{newsletter_type}" for newsletter_type in self.config.types]
+
+    def _build_issue_url(self, date_str: str, newsletter_type: str) -> str:
+        return self.config.url_pattern.format(
+            base_url=self.config.base_url, type=newsletter_type, date=date_str
+        )
+
+    def _issue_html_from_response(
+        self, response, date_str: str, newsletter_type: str, net_start: float
+    ) -> str | None:
+        """Return the issue HTML, or None when the issue does not exist (404 or redirect).
+
+        Nonexistent issues are recorded in missing_issue_store so later scrapes skip them.
+        """
         net_ms = int(round((time.time() - net_start) * 1000))
 
         if response.status_code == 404:
+            self._record_missing_issue(date_str, newsletter_type, "404")
             return None
 
         response.raise_for_status()
 
         if 300 <= response.status_code < 400:
+            self._record_missing_issue(date_str, newsletter_type, f"redirect {response.status_code}")
             return None
 
         logger.info(f"Fetched {newsletter_type} for {date_str} in {net_ms}ms")
         return response.text
 
+    def _record_missing_issue(self, date_str: str, newsletter_type: str, reason: str) -> None:
+        logger.info(f"No {newsletter_type} issue for {date_str} ({reason})")
+        missing_issue_store.record_missing(
+            self.config.source_id, f"{date_str}/{newsletter_type}", date_str, reason
+        )
+
     def _parse_markdown_structure(
         self, markdown: str, date: str, newsletter_type: str
     ) -> ParsedMarkdown:
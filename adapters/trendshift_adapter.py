@@ -29,7 +29,7 @@ class TrendshiftAdapter(NewsletterAdapter):
             logger.info("Trendshift only serves today's data via SSR; skipping %s", target_date)
             return self._normalize_response([])
 
-        excluded_set = set(excluded_urls)
+        excluded_set = frozenset(excluded_urls)
         category = self.config.category_display_names["daily_explore"]
         scraped_articles = self._scrape_daily_explore(target_date)
 
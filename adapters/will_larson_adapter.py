@@ -5,11 +5,12 @@ This adapter implements the NewsletterAdapter interface for Will Larson's blog,
 using the RSS feed at lethain.com for efficient article fetching.
 """
 
+import html
 import logging
-import xml.etree.ElementTree as ET
-from datetime import datetime
-from email.utils import parsedate_to_datetime
+import re
+from datetime import date, datetime
 
+from adapters import feed_stream
 from adapters.newsletter_adapter import NewsletterAdapter
 import util
 
@@ -20,6 +21,8 @@ logger = logging.getLogger("will_larson_adapter")
 class WillLarsonAdapter(NewsletterAdapter):
     """Adapter for Will Larson's blog using RSS feed."""
 
+    supports_range_scrape = True
+
     def __init__(self, config):
         """Initialize with config."""
         super().__init__(config)
@@ -28,7 +31,7 @@ class WillLarsonAdapter(NewsletterAdapter):
     @util.retry()
     def _fetch_feed(self):
         """Fetch RSS feed content."""
-        response = util.fetch(self.rss_url, timeout=10)
+        response = util.fetch(self.rss_url, timeout=10, conditional=self.config.conditional_get)
         response.raise_for_status()
         return response.content
 
@@ -42,47 +45,47 @@ class WillLarsonAdapter(NewsletterAdapter):
         Returns:
             Normalized response dictionary
         """
-        articles = []
-        excluded_set = set(excluded_urls)
-
         # Parse target date
         target_date = datetime.fromisoformat(util.format_date_for_url(date))
         target_date_str = target_date.strftime("%Y-%m-%d")
 
         logger.info(f"Fetching articles for {target_date_str} from RSS feed")
 
+        articles = self._collect_articles_by_date(frozenset(excluded_urls), target_date.date()).get(target_date_str, [])
+
+        logger.info(f"Found {len(articles)} articles for {target_date_str}")
+
+        # Create issue metadata if we have articles
+        return self._normalize_response(articles)
+
+    def scrape_range(self, start_date, end_date, excluded_urls: list[str]) -> dict[str, dict]:
+        """Fetch the RSS feed once and return per-date results for [start_date, end_date]."""
+        logger.info(
+            f"Fetching articles for {util.format_date_for_url(start_date)}..{util.format_date_for_url(end_date)} from RSS feed"
+        )
+        since = datetime.fromisoformat(util.format_date_for_url(start_date)).date()
+        articles_by_date = self._collect_articles_by_date(frozenset(excluded_urls), since)
+        return self._normalize_range_response(start_date, end_date, articles_by_date)
+
+    def _collect_articles_by_date(self, excluded_set: frozenset[str], since: date) -> dict[str, list[dict]]:
+        """Fetch and parse the RSS feed down to `since`, indexing non-excluded articles by publication date."""
+        articles_by_date: dict[str, list[dict]] = {}
+
         try:
             feed_content = self._fetch_feed()
-            root = ET.fromstring(feed_content)
-            items = root.findall('.//item')
+            items = feed_stream.parse_feed_entries(feed_content, since)
 
-            logger.info(f"Found {len(items)} items in RSS feed")
+            logger.info(f"Parsed {len(items)} items from RSS feed since {since}")
 
-            # Filter items by date
             for item in items:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-                pubdate_elem = item.find('pubDate')
-                description_elem = item.find('description')
-
-                if title_elem is None or link_elem is None or pubdate_elem is None:
-                    continue
-
-                # Parse publication date
-                try:
-                    pub_datetime = parsedate_to_datetime(pubdate_elem.text)
-                    article_date_str = pub_datetime.strftime("%Y-%m-%d")
-                except Exception as e:
-                    logger.warning(f"Error parsing date '{pubdate_elem.text}': {e}")
+                if not item.title or not item.link or item.published is None:
                     continue
 
-                # Check if article matches target date
-                if article_date_str != target_date_str:
-                    continue
+                article_date_str = item.published.strftime("%Y-%m-%d")
 
                 # Get article details
-                title = title_elem.text
-                url = link_elem.text
+                title = item.title
+                url = item.link
                 canonical_url = util.canonicalize_url(url)
 
                 # Skip if excluded
@@ -90,11 +93,9 @@ class WillLarsonAdapter(NewsletterAdapter):
                     continue
 
                 # Extract excerpt from description (first 200 chars)
-                description = description_elem.text if description_elem is not None else ""
+                description = item.summary
                 if description:
                     # Strip HTML tags and decode HTML entities
-                    import re
-                    import html
                     description_text = re.sub(r'<[^>]+>', '', description)
                     description_text = html.unescape(description_text)
                     excerpt = description_text[:200].strip()
@@ -108,17 +109,14 @@ class WillLarsonAdapter(NewsletterAdapter):
                     "article_meta": excerpt,
                     "url": canonical_url,
                     "category": "Engineering Leadership",
-                    "date": target_date_str,
+                    "date": article_date_str,
                     "newsletter_type": "blog",
                     "removed": False,
                 }
 
-                articles.append(article)
-
-            logger.info(f"Found {len(articles)} articles for {target_date_str}")
+                articles_by_date.setdefault(article_date_str, []).append(article)
 
         except Exception as e:
             logger.error(f"Error fetching RSS feed: {e}", exc_info=True)
 
-        # Create issue metadata if we have articles
-        return self._normalize_response(articles)
+        return articles_by_date
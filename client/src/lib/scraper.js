@@ -22,8 +22,11 @@ function summarizeScrapeResponse(data) {
   }
 }
 
+// A newer scrape from this tab cancels the server-side work of the one it replaces
+const SCRAPE_SUPERSEDE_KEY = `tab-${crypto.randomUUID()}`
+
 export async function scrapeNewsletters(startDate, endDate, signal) {
-  const requestPayload = { start_date: startDate, end_date: endDate }
+  const requestPayload = { start_date: startDate, end_date: endDate, supersede_key: SCRAPE_SUPERSEDE_KEY }
   console.log(`scrape_request:\n${formatYaml(requestPayload, 1)}`)
 
   const response = await window.fetch('/api/scrape', {
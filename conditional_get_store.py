@@ -0,0 +1,213 @@
+"""
+Persistent conditional-GET validator store for feeds and archive pages.
+
+Sources that opt in via NewsletterSourceConfig.conditional_get have util.fetch
+remember each response's ETag / Last-Modified together with its body. The next
+fetch of the same URL sends If-None-Match / If-Modified-Since, and a 304 answer is
+served from the stored body without re-downloading it.
+
+Entries live in a local SQLite file (HTTP_VALIDATOR_STORE_PATH, defaulting to the
+system temp dir so it also works on read-only serverless images). Store failures
+are logged and treated as misses; they never fail the fetch itself.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import urllib.parse as urlparse
+from collections import OrderedDict
+
+import requests
+
+import util
+
+
+logger = logging.getLogger("conditional_get_store")
+
+_PARSED_CACHE_MAX_ENTRIES = 64
+
+_schema_lock = threading.Lock()
+_initialized_store_paths: set[str] = set()
+_parsed_cache_lock = threading.Lock()
+_parsed_cache: OrderedDict[tuple[str, str], object] = OrderedDict()
+
+
+def _store_path() -> str:
+    return util.resolve_env_var(
+        "HTTP_VALIDATOR_STORE_PATH",
+        os.path.join(tempfile.gettempdir(), "tldr-scraper-http-validators.sqlite3"),
+    )
+
+
+def _connect() -> sqlite3.Connection:
+    path = _store_path()
+    connection = sqlite3.connect(path, timeout=5)
+    if path not in _initialized_store_paths:
+        with _schema_lock:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_validators (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_type TEXT,
+                    encoding TEXT,
+                    body BLOB NOT NULL,
+                    body_sha256 TEXT NOT NULL,
+                    stored_at REAL NOT NULL
+                )
+                """
+            )
+            connection.commit()
+            _initialized_store_paths.add(path)
+    return connection
+
+
+def build_store_key(url: str, params: dict | None = None) -> str:
+    """Return the key a (url, params) request is stored under.
+
+    >>> build_store_key("https://a.com/feed", {"b": 2, "a": 1})
+    'https://a.com/feed?a=1&b=2'
+    >>> build_store_key("https://a.com/feed")
+    'https://a.com/feed'
+    """
+    if not params:
+        return url
+    return f"{url}?{urlparse.urlencode(sorted(params.items()))}"
+
+
+def get_entry(store_key: str) -> dict | None:
+    """Return the stored validators and body for store_key, or None on miss or error."""
+    try:
+        connection = _connect()
+        try:
+            row = connection.execute(
+                "SELECT etag, last_modified, content_type, encoding, body, body_sha256 "
+                "FROM http_validators WHERE url = ?",
+                (store_key,),
+            ).fetchone()
+        finally:
+            connection.close()
+    except Exception as error:
+        logger.warning(
+            "validator store read failed; treating as miss url=%s error=%s",
+            store_key,
+            repr(error),
+        )
+        return None
+
+    if row is None:
+        return None
+
+    etag, last_modified, content_type, encoding, body, body_sha256 = row
+    return {
+        "etag": etag,
+        "last_modified": last_modified,
+        "content_type": content_type,
+        "encoding": encoding,
+        "body": bytes(body),
+        "body_sha256": body_sha256,
+    }
+
+
+def put_response(store_key: str, response) -> None:
+    """Persist a 200 response's validators and body. Responses without validators are skipped."""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+
+    body = response.content or b""
+    try:
+        connection = _connect()
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO http_validators "
+                "(url, etag, last_modified, content_type, encoding, body, body_sha256, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    store_key,
+                    etag,
+                    last_modified,
+                    response.headers.get("Content-Type"),
+                    getattr(response, "encoding", None),
+                    body,
+                    hashlib.sha256(body).hexdigest(),
+                    time.time(),
+                ),
+            )
+            connection.commit()
+        finally:
+            connection.close()
+    except Exception as error:
+        logger.warning(
+            "validator store write failed; next fetch will be unconditional url=%s error=%s",
+            store_key,
+            repr(error),
+        )
+
+
+def build_validator_headers(entry: dict | None) -> dict:
+    """Return If-None-Match / If-Modified-Since headers for a stored entry.
+
+    >>> build_validator_headers({"etag": '"abc"', "last_modified": None})
+    {'If-None-Match': '"abc"'}
+    >>> build_validator_headers(None)
+    {}
+    """
+    if entry is None:
+        return {}
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def build_response_from_entry(url: str, entry: dict) -> requests.Response:
+    """Build a 200 response carrying the stored body, for serving a 304 answer."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = entry["body"]
+    response.encoding = entry.get("encoding") or "utf-8"
+    if entry.get("content_type"):
+        response.headers["Content-Type"] = entry["content_type"]
+    if entry.get("etag"):
+        response.headers["ETag"] = entry["etag"]
+    if entry.get("last_modified"):
+        response.headers["Last-Modified"] = entry["last_modified"]
+    response.headers["X-Validator-Cache"] = "hit"
+    return response
+
+
+def memoize_parsed(namespace: str, body: bytes, parse):
+    """Return parse(body), reusing the previous result when the body hash is unchanged.
+
+    Combined with conditional GETs this skips re-parsing feeds that did not change
+    between scrapes. Parsed results are shared, so callers must not mutate them.
+
+    >>> calls = []
+    >>> memoize_parsed("doctest", b"<rss/>", lambda body: calls.append(body) or len(calls))
+    1
+    >>> memoize_parsed("doctest", b"<rss/>", lambda body: calls.append(body) or len(calls))
+    1
+    """
+    cache_key = (namespace, hashlib.sha256(body).hexdigest())
+    with _parsed_cache_lock:
+        if cache_key in _parsed_cache:
+            _parsed_cache.move_to_end(cache_key)
+            return _parsed_cache[cache_key]
+
+    parsed = parse(body)
+
+    with _parsed_cache_lock:
+        _parsed_cache[cache_key] = parsed
+        while len(_parsed_cache) > _PARSED_CACHE_MAX_ENTRIES:
+            _parsed_cache.popitem(last=False)
+    return parsed
@@ -0,0 +1,122 @@
+"""
+Content-addressed exclusion sets for /api/scrape.
+
+Clients with a long history would otherwise resend every excluded URL on each
+scrape. put() stores a URL set once and returns its id, the SHA-256 of the
+sorted, de-duplicated URLs joined by newlines, so a client can also compute the
+id itself and only upload after a miss. Scrapes then reference the set by
+exclusion_set_id and get the stored frozenset back, shared by every task.
+
+Sets are stored in the Supabase exclusion_sets table, so an id registered on one
+serverless instance resolves on every other. Each process keeps the sets it has
+used in memory, least recently used first out once more than
+EXCLUSION_SET_MAX_URLS URLs (default 2,000,000) are held, so repeated scrapes on
+a warm instance do not reload them. An id that is in neither place raises
+UnknownExclusionSet; the client is expected to upload the set again.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+
+import storage_service
+import util
+
+
+logger = logging.getLogger("exclusion_sets")
+
+_sets_lock = threading.Lock()
+_sets: OrderedDict[str, frozenset[str]] = OrderedDict()
+_held_url_count = 0
+
+
+class UnknownExclusionSet(LookupError):
+    """Raised for an exclusion_set_id that was never stored."""
+
+
+def compute_set_id(urls: Iterable[str]) -> str:
+    """Return the id a URL set is stored under.
+
+    >>> compute_set_id(["b.com/2", "a.com/1", "b.com/2"]) == compute_set_id(["a.com/1", "b.com/2"])
+    True
+    >>> compute_set_id([]) == hashlib.sha256(b"").hexdigest()
+    True
+    """
+    return hashlib.sha256("\n".join(sorted(set(urls))).encode("utf-8")).hexdigest()
+
+
+def _max_urls() -> int:
+    return int(util.resolve_env_var("EXCLUSION_SET_MAX_URLS", "2000000"))
+
+
+def _hold(set_id: str, url_set: frozenset[str]) -> frozenset[str]:
+    """Keep url_set in this process's memory and return the held copy."""
+    global _held_url_count
+    with _sets_lock:
+        existing = _sets.get(set_id)
+        if existing is not None:
+            _sets.move_to_end(set_id)
+            return existing
+        _sets[set_id] = url_set
+        _held_url_count += len(url_set)
+        max_urls = _max_urls()
+        # Keep the newest set even when it alone is over the limit
+        while _held_url_count > max_urls and len(_sets) > 1:
+            evicted_id, evicted = _sets.popitem(last=False)
+            _held_url_count -= len(evicted)
+            logger.info("evicted exclusion set from memory id=%s urls=%s", evicted_id[:12], len(evicted))
+        return url_set
+
+
+def put(urls: Iterable[str]) -> tuple[str, frozenset[str]]:
+    """Store a URL set and return (set_id, the stored frozenset)."""
+    url_set = frozenset(url for url in urls if url)
+    set_id = compute_set_id(url_set)
+    with _sets_lock:
+        already_held = set_id in _sets
+    if not already_held:
+        storage_service.set_exclusion_set(set_id, sorted(url_set))
+        logger.info("stored exclusion set id=%s urls=%s", set_id[:12], len(url_set))
+    return set_id, _hold(set_id, url_set)
+
+
+def get(set_id: str) -> frozenset[str]:
+    """Return the stored set for set_id, loading it from storage on a memory miss.
+
+    Raises UnknownExclusionSet when the id is not stored anywhere.
+    """
+    with _sets_lock:
+        url_set = _sets.get(set_id)
+        if url_set is not None:
+            _sets.move_to_end(set_id)
+            return url_set
+
+    urls = storage_service.get_exclusion_set(set_id)
+    if urls is None or compute_set_id(urls) != set_id:
+        raise UnknownExclusionSet(set_id)
+    logger.info("loaded exclusion set id=%s urls=%s", set_id[:12], len(urls))
+    return _hold(set_id, frozenset(urls))
+
+
+def resolve(excluded_urls: Iterable[str] | None, set_id: str | None) -> frozenset[str]:
+    """Return the exclusions of a scrape request: the referenced set plus any inline URLs.
+
+    >>> resolve(["a.com/1"], None)
+    frozenset({'a.com/1'})
+    """
+    if not set_id:
+        return frozenset(excluded_urls or ())
+    url_set = get(set_id)
+    if not excluded_urls:
+        return url_set
+    return url_set | frozenset(excluded_urls)
+
+
+def clear() -> None:
+    """Drop every set held in this process's memory."""
+    global _held_url_count
+    with _sets_lock:
+        _sets.clear()
+        _held_url_count = 0
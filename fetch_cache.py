@@ -0,0 +1,201 @@
+"""
+Request-scoped HTTP response memoization for scrape fan-outs.
+
+A single /api/scrape call runs many adapter tasks in parallel, and several of them
+fetch the exact same URL (listing pages, archive indexes, pages loaded through
+summarizer.url_to_markdown). Inside a scrape_scope(), util.fetch and
+summarizer.scrape_url route through the active FetchCache: the first caller for a
+key performs the request, concurrent callers for the same key wait on that single
+in-flight request, and later callers reuse the stored response.
+
+The scope lives in a ContextVar, so it is visible to worker threads only when tasks
+are submitted with a copied context (see submit_in_context).
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import logging
+import threading
+from concurrent.futures import Future
+
+
+logger = logging.getLogger("fetch_cache")
+
+_active_fetch_cache: contextvars.ContextVar["FetchCache | None"] = contextvars.ContextVar(
+    "active_fetch_cache", default=None
+)
+
+
+def _response_size_bytes(response) -> int:
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+    return 0
+
+
+class FetchCache:
+    """Thread-safe, single-flight memo of responses for the lifetime of one scrape."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, Future] = {}
+        self._hits = 0
+        self._misses = 0
+        self._bytes_saved = 0
+
+    def get_or_fetch(self, key: tuple, loader, *, cacheable=None):
+        """Return the response stored under key, calling loader at most once per key.
+
+        Callers that arrive while the first request is in flight block on it instead of
+        issuing a duplicate. Exceptions are propagated to every waiter and never stored,
+        and neither are responses for which cacheable(response) is False, so retries
+        hit the network again.
+
+        >>> cache = FetchCache()
+        >>> cache.get_or_fetch(("fetch", "u"), lambda: "first")
+        'first'
+        >>> cache.get_or_fetch(("fetch", "u"), lambda: "second")
+        'first'
+        >>> cache.stats()["hits"]
+        1
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            is_owner = entry is None
+            if is_owner:
+                entry = Future()
+                self._entries[key] = entry
+                self._misses += 1
+
+        if not is_owner:
+            response = entry.result()
+            with self._lock:
+                self._hits += 1
+                self._bytes_saved += _response_size_bytes(response)
+            return response
+
+        try:
+            response = loader()
+        except BaseException as error:
+            with self._lock:
+                self._entries.pop(key, None)
+            entry.set_exception(error)
+            raise
+
+        if cacheable is not None and not cacheable(response):
+            with self._lock:
+                self._entries.pop(key, None)
+        entry.set_result(response)
+        return response
+
+    async def get_or_fetch_async(self, key: tuple, loader, *, cacheable=None):
+        """Coroutine variant of get_or_fetch() where loader is an async callable.
+
+        Entries are shared with get_or_fetch(), so the threaded and async engines
+        coalesce onto the same in-flight requests within one scrape.
+
+        >>> cache = FetchCache()
+        >>> async def load():
+        ...     return "first"
+        >>> asyncio.run(cache.get_or_fetch_async(("fetch", "u"), load))
+        'first'
+        >>> cache.get_or_fetch(("fetch", "u"), lambda: "second")
+        'first'
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            is_owner = entry is None
+            if is_owner:
+                entry = Future()
+                self._entries[key] = entry
+                self._misses += 1
+
+        if not is_owner:
+            response = await asyncio.wrap_future(entry)
+            with self._lock:
+                self._hits += 1
+                self._bytes_saved += _response_size_bytes(response)
+            return response
+
+        try:
+            response = await loader()
+        except BaseException as error:
+            with self._lock:
+                self._entries.pop(key, None)
+            entry.set_exception(error)
+            raise
+
+        if cacheable is not None and not cacheable(response):
+            with self._lock:
+                self._entries.pop(key, None)
+        entry.set_result(response)
+        return response
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the response bytes that were not re-downloaded."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "bytes_saved": self._bytes_saved,
+            }
+
+
+def get_active_fetch_cache() -> FetchCache | None:
+    """Return the FetchCache of the enclosing scrape_scope(), or None outside of one.
+
+    >>> get_active_fetch_cache() is None
+    True
+    """
+    return _active_fetch_cache.get()
+
+
+@contextlib.contextmanager
+def scrape_scope(cache: FetchCache | None = None):
+    """Activate cache (or a fresh FetchCache) for the duration of one scrape request."""
+    cache = cache if cache is not None else FetchCache()
+    token = _active_fetch_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_fetch_cache.reset(token)
+        stats = cache.stats()
+        if stats["hits"]:
+            logger.info(
+                "fetch cache hits=%s misses=%s bytes_saved=%s",
+                stats["hits"],
+                stats["misses"],
+                stats["bytes_saved"],
+            )
+
+
+def build_fetch_key(
+    kind: str,
+    url: str,
+    *,
+    headers: dict | None = None,
+    params: dict | None = None,
+    impersonate: str | None = None,
+    allow_redirects: bool = True,
+) -> tuple:
+    """Build a hashable cache key from everything that can change the response.
+
+    >>> build_fetch_key("fetch", "https://a.com", headers={"b": "2", "a": "1"}) == build_fetch_key(
+    ...     "fetch", "https://a.com", headers={"a": "1", "b": "2"})
+    True
+    """
+    return (
+        kind,
+        url,
+        tuple(sorted((headers or {}).items())),
+        tuple(sorted((params or {}).items())),
+        impersonate,
+        allow_redirects,
+    )
+
+
+def submit_in_context(executor, fn, *args, **kwargs) -> Future:
+    """Submit fn to executor so it runs with a copy of the caller's context variables."""
+    context = contextvars.copy_context()
+    return executor.submit(context.run, fn, *args, **kwargs)
@@ -0,0 +1,311 @@
+"""
+Per-host concurrency limits and request-rate token buckets for outbound scraping.
+
+util.fetch wraps every network request in host_slot(url). A host has at most
+max_concurrency requests in flight and starts at most requests_per_second requests
+per second. Other hosts are unaffected, so the scrape pool keeps flowing to hosts
+that are not throttled. The shared executor applies the same max_concurrency before
+dispatch (ExecutorLane.submit_to_host), so workers are not parked waiting here for a
+saturated host.
+
+Limits are process-wide and keyed by the configured host. A configured host also
+covers its subdomains, so "medium.com" also limits "netflixtechblog.medium.com".
+Override them with HOST_LIMITS, e.g. "tldr.tech=4/4,medium.com=2/0.5"
+(concurrency/requests-per-second, where 0 rps means no rate limit). Unlisted hosts
+fall back to HOST_MAX_CONCURRENCY and HOST_REQUESTS_PER_SECOND.
+
+Time spent waiting for a slot is recorded per host in the HostWaitStats of the
+enclosing wait_stats_scope(), so each scrape can report its own queue waits.
+
+Waiting for a slot or a rate token honours the active scrape's deadline and
+cancellation (util.deadline_scope / util.cancel_scope): a stopped scrape raises
+instead of parking a shared worker behind a slow host. Async waiters are woken
+when a slot is released rather than polling for one.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import logging
+import threading
+import time
+import urllib.parse as urlparse
+from dataclasses import dataclass
+
+import util
+
+
+logger = logging.getLogger("host_limiter")
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    """Limits for one host."""
+
+    max_concurrency: int
+    requests_per_second: float = 0.0  # 0 disables the token bucket
+
+
+_BUILTIN_HOST_LIMITS = {
+    "tldr.tech": HostLimit(max_concurrency=4, requests_per_second=4.0),
+    "medium.com": HostLimit(max_concurrency=2, requests_per_second=1.0),
+    "substack.com": HostLimit(max_concurrency=3, requests_per_second=2.0),
+}
+
+# Waiters re-check their scrape's cancel token at least this often
+_SLOT_WAIT_SLICE_SECONDS = 0.1
+
+_limiters_lock = threading.Lock()
+_limiters: dict[str, "HostLimiter"] = {}
+_configured_limits: dict[str, HostLimit] | None = None
+
+_active_wait_stats: contextvars.ContextVar["HostWaitStats | None"] = contextvars.ContextVar(
+    "active_host_wait_stats", default=None
+)
+
+
+def parse_host_limits(text: str) -> dict[str, HostLimit]:
+    """Parse a HOST_LIMITS value. Malformed entries are logged and skipped.
+
+    >>> parse_host_limits("tldr.tech=4/2.5, example.com=1")
+    {'tldr.tech': HostLimit(max_concurrency=4, requests_per_second=2.5), 'example.com': HostLimit(max_concurrency=1, requests_per_second=0.0)}
+    """
+    limits = {}
+    for entry in text.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            host, spec = entry.split("=", 1)
+            concurrency_text, _, rate_text = spec.partition("/")
+            limits[host.strip().lower()] = HostLimit(
+                max_concurrency=max(1, int(concurrency_text)),
+                requests_per_second=max(0.0, float(rate_text or 0)),
+            )
+        except ValueError:
+            logger.warning("Ignoring malformed HOST_LIMITS entry %r", entry)
+    return limits
+
+
+def _get_configured_limits() -> dict[str, HostLimit]:
+    global _configured_limits
+    if _configured_limits is None:
+        _configured_limits = {
+            **_BUILTIN_HOST_LIMITS,
+            **parse_host_limits(util.resolve_env_var("HOST_LIMITS", "")),
+        }
+    return _configured_limits
+
+
+def _default_limit() -> HostLimit:
+    return HostLimit(
+        max_concurrency=max(1, int(util.resolve_env_var("HOST_MAX_CONCURRENCY", "6"))),
+        requests_per_second=max(0.0, float(util.resolve_env_var("HOST_REQUESTS_PER_SECOND", "0"))),
+    )
+
+
+def resolve_host_key(url: str) -> str:
+    """Return the host a URL is limited under: the configured parent domain if any, else its own host.
+
+    >>> resolve_host_key("https://netflixtechblog.medium.com/some-post")
+    'medium.com'
+    >>> resolve_host_key("https://www.example.com/a")
+    'example.com'
+    """
+    host = (urlparse.urlparse(url).hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    configured_limits = _get_configured_limits()
+    parts = host.split(".")
+    for index in range(len(parts) - 1):
+        candidate = ".".join(parts[index:])
+        if candidate in configured_limits:
+            return candidate
+    return host
+
+
+class HostLimiter:
+    """Concurrency limit plus token bucket for a single host, shared by threads and event loops."""
+
+    def __init__(self, host: str, limit: HostLimit):
+        self.host = host
+        self.limit = limit
+        self._slot_condition = threading.Condition()
+        self._slots_in_use = 0
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._bucket_lock = threading.Lock()
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+
+    def _reserve_token_delay(self) -> float:
+        """Take one token, returning how long to sleep until it is actually available."""
+        rate = self.limit.requests_per_second
+        if rate <= 0:
+            return 0.0
+        burst = max(1.0, rate)
+        with self._bucket_lock:
+            now = time.monotonic()
+            self._tokens = min(burst, self._tokens + (now - self._last_refill) * rate)
+            self._last_refill = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / rate
+
+    def _try_take_slot(self) -> bool:
+        # Caller holds _slot_condition
+        if self._slots_in_use < self.limit.max_concurrency:
+            self._slots_in_use += 1
+            return True
+        return False
+
+    def _release_slot(self) -> None:
+        with self._slot_condition:
+            self._slots_in_use -= 1
+            self._slot_condition.notify()
+            async_waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in async_waiters:
+            loop.call_soon_threadsafe(_wake_async_waiter, waiter)
+
+    def _acquire_slot(self) -> None:
+        with self._slot_condition:
+            while not self._try_take_slot():
+                util.raise_if_scrape_stopped()
+                self._slot_condition.wait(_wait_slice_seconds())
+
+    async def _async_acquire_slot(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._slot_condition:
+                if self._try_take_slot():
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                util.raise_if_scrape_stopped()
+                await asyncio.wait({waiter}, timeout=_wait_slice_seconds())
+            finally:
+                with self._slot_condition:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+
+    def _token_delay_within_deadline(self) -> float:
+        delay = self._reserve_token_delay()
+        remaining = util.remaining_deadline_seconds()
+        if remaining is not None and delay >= remaining:
+            raise util.DeadlineExceeded("scrape deadline reached waiting for a rate token")
+        return delay
+
+    @contextlib.contextmanager
+    def slot(self):
+        """Hold one of this host's concurrency slots, after waiting for a rate token."""
+        started_waiting = time.monotonic()
+        self._acquire_slot()
+        try:
+            delay = self._token_delay_within_deadline()
+            if delay > 0:
+                time.sleep(delay)
+            _record_wait(self.host, time.monotonic() - started_waiting)
+            yield
+        finally:
+            self._release_slot()
+
+    @contextlib.asynccontextmanager
+    async def async_slot(self):
+        """Async variant of slot(); waits on the event loop until a slot is released."""
+        started_waiting = time.monotonic()
+        await self._async_acquire_slot()
+        try:
+            delay = self._token_delay_within_deadline()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            _record_wait(self.host, time.monotonic() - started_waiting)
+            yield
+        finally:
+            self._release_slot()
+
+
+def _wake_async_waiter(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _wait_slice_seconds() -> float:
+    """How long a slot waiter sleeps before re-checking: the slice, cut to the remaining deadline."""
+    remaining = util.remaining_deadline_seconds()
+    if remaining is None:
+        return _SLOT_WAIT_SLICE_SECONDS
+    return max(0.0, min(_SLOT_WAIT_SLICE_SECONDS, remaining))
+
+
+def get_host_limiter(url: str) -> HostLimiter:
+    """Return the process-wide limiter for url's host, creating it on first use."""
+    host_key = resolve_host_key(url)
+    with _limiters_lock:
+        limiter = _limiters.get(host_key)
+        if limiter is None:
+            limit = _get_configured_limits().get(host_key) or _default_limit()
+            limiter = HostLimiter(host_key, limit)
+            _limiters[host_key] = limiter
+        return limiter
+
+
+def host_slot(url: str):
+    """Context manager that holds a concurrency slot and rate token for url's host."""
+    return get_host_limiter(url).slot()
+
+
+def async_host_slot(url: str):
+    """Async context manager counterpart of host_slot()."""
+    return get_host_limiter(url).async_slot()
+
+
+class HostWaitStats:
+    """Thread-safe per-host queue-wait accumulator for one scrape."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_host: dict[str, dict] = {}
+
+    def record(self, host: str, wait_seconds: float) -> None:
+        wait_ms = wait_seconds * 1000
+        with self._lock:
+            entry = self._by_host.setdefault(host, {"requests": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0})
+            entry["requests"] += 1
+            entry["wait_ms_total"] += wait_ms
+            entry["wait_ms_max"] = max(entry["wait_ms_max"], wait_ms)
+
+    def stats(self) -> dict[str, dict]:
+        """Return {host: {requests, wait_ms_total, wait_ms_max}} with milliseconds rounded.
+
+        >>> wait_stats = HostWaitStats()
+        >>> wait_stats.record("tldr.tech", 0.25)
+        >>> wait_stats.stats()
+        {'tldr.tech': {'requests': 1, 'wait_ms_total': 250.0, 'wait_ms_max': 250.0}}
+        """
+        with self._lock:
+            return {
+                host: {
+                    "requests": entry["requests"],
+                    "wait_ms_total": round(entry["wait_ms_total"], 1),
+                    "wait_ms_max": round(entry["wait_ms_max"], 1),
+                }
+                for host, entry in sorted(self._by_host.items())
+            }
+
+
+def _record_wait(host: str, wait_seconds: float) -> None:
+    wait_stats = _active_wait_stats.get()
+    if wait_stats is not None:
+        wait_stats.record(host, wait_seconds)
+
+
+@contextlib.contextmanager
+def wait_stats_scope(wait_stats: HostWaitStats | None = None):
+    """Record host queue waits into wait_stats (or a fresh HostWaitStats) within this scope."""
+    wait_stats = wait_stats if wait_stats is not None else HostWaitStats()
+    token = _active_wait_stats.set(wait_stats)
+    try:
+        yield wait_stats
+    finally:
+        _active_wait_stats.reset(token)
@@ -0,0 +1,160 @@
+"""
+Pooled keep-alive HTTP sessions for scraping and LLM calls.
+
+Module-level curl_requests.get / requests.get open a new connection per call, so
+every fetch repeats DNS resolution and the TCP and TLS handshakes. This module owns
+process-wide sessions instead:
+
+- curl_get / curl_head use one curl_cffi Session. Each thread gets its own curl
+  handle (curl handles are not thread-safe) that keeps a bounded connection cache
+  (HTTP_POOL_MAX_CONNECTIONS per handle) and caches DNS for HTTP_DNS_CACHE_SECONDS.
+  Browser impersonation negotiates HTTP/2 where the server offers it.
+- get_requests_session() is a shared requests.Session whose urllib3 pools keep up
+  to HTTP_POOL_MAX_CONNECTIONS connections per host.
+
+The sessions are shared by every source, so they pool connections only: neither
+keeps cookies, so a Set-Cookie from one site is never sent on a later request.
+
+stats() reports how many requests reused a pooled connection.
+"""
+
+import logging
+import threading
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from curl_cffi import CurlInfo, CurlOpt
+from curl_cffi import requests as curl_requests
+from requests.adapters import HTTPAdapter
+
+import util
+
+
+logger = logging.getLogger("http_sessions")
+
+_sessions_lock = threading.Lock()
+_curl_session: curl_requests.Session | None = None
+_requests_session: requests.Session | None = None
+
+_curl_stats_lock = threading.Lock()
+_curl_stats = {"requests": 0, "new_connections": 0}
+
+
+def _pool_max_connections() -> int:
+    return max(1, int(util.resolve_env_var("HTTP_POOL_MAX_CONNECTIONS", "32")))
+
+
+def _curl_session_options() -> dict:
+    return {
+        # curl_cffi clears the handle's cookie engine before each request, so this keeps it empty
+        "discard_cookies": True,
+        "curl_options": {
+            CurlOpt.MAXCONNECTS: _pool_max_connections(),
+            CurlOpt.DNS_CACHE_TIMEOUT: int(util.resolve_env_var("HTTP_DNS_CACHE_SECONDS", "300")),
+        },
+        "curl_infos": [CurlInfo.NUM_CONNECTS],
+    }
+
+
+def get_curl_session() -> curl_requests.Session:
+    """Return the process-wide curl_cffi Session, creating it on first use."""
+    global _curl_session
+    with _sessions_lock:
+        if _curl_session is None:
+            _curl_session = curl_requests.Session(use_thread_local_curl=True, **_curl_session_options())
+        return _curl_session
+
+
+def build_async_curl_session(max_clients: int) -> curl_requests.AsyncSession:
+    """Return a new AsyncSession configured like the sync pool, for one event loop."""
+    return curl_requests.AsyncSession(max_clients=max_clients, **_curl_session_options())
+
+
+def get_requests_session() -> requests.Session:
+    """Return the process-wide requests.Session with pooled per-host connections."""
+    global _requests_session
+    with _sessions_lock:
+        if _requests_session is None:
+            session = requests.Session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(pool_connections=_pool_max_connections(), pool_maxsize=_pool_max_connections())
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _requests_session = session
+        return _requests_session
+
+
+def record_curl_response(response) -> None:
+    """Count a curl_cffi response as a reused or newly opened connection."""
+    infos = getattr(response, "infos", None) or {}
+    new_connections = infos.get(CurlInfo.NUM_CONNECTS)
+    if new_connections is None:
+        return
+    with _curl_stats_lock:
+        _curl_stats["requests"] += 1
+        _curl_stats["new_connections"] += int(new_connections)
+
+
+def curl_get(url: str, **kwargs):
+    """GET url on the pooled curl_cffi session. Accepts the same kwargs as curl_requests.get."""
+    response = get_curl_session().get(url, **kwargs)
+    record_curl_response(response)
+    return response
+
+
+def curl_head(url: str, **kwargs):
+    """HEAD url on the pooled curl_cffi session."""
+    response = get_curl_session().head(url, **kwargs)
+    record_curl_response(response)
+    return response
+
+
+def _reuse_ratio(requests_count: int, new_connections: int) -> float | None:
+    """Fraction of requests that did not open a new connection.
+
+    >>> _reuse_ratio(10, 2)
+    0.8
+    >>> _reuse_ratio(0, 0) is None
+    True
+    """
+    if not requests_count:
+        return None
+    return round(max(0, requests_count - new_connections) / requests_count, 3)
+
+
+def _requests_pool_counts() -> tuple[int, int]:
+    if _requests_session is None:
+        return 0, 0
+    requests_count = 0
+    new_connections = 0
+    for adapter in set(_requests_session.adapters.values()):
+        pool_manager = getattr(adapter, "poolmanager", None)
+        if pool_manager is None:
+            continue
+        for pool_key in list(pool_manager.pools.keys()):
+            pool = pool_manager.pools.get(pool_key)
+            if pool is None:
+                continue
+            requests_count += pool.num_requests
+            new_connections += pool.num_connections
+    return requests_count, new_connections
+
+
+def stats() -> dict:
+    """Return process-wide request and new-connection counts with reuse ratios per client."""
+    with _curl_stats_lock:
+        curl_requests_count = _curl_stats["requests"]
+        curl_new_connections = _curl_stats["new_connections"]
+    requests_count, requests_new_connections = _requests_pool_counts()
+    return {
+        "curl": {
+            "requests": curl_requests_count,
+            "new_connections": curl_new_connections,
+            "reuse_ratio": _reuse_ratio(curl_requests_count, curl_new_connections),
+        },
+        "requests": {
+            "requests": requests_count,
+            "new_connections": requests_new_connections,
+            "reuse_ratio": _reuse_ratio(requests_count, requests_new_connections),
+        },
+    }
@@ -0,0 +1,151 @@
+"""
+Persistent negative cache for newsletter issues that do not exist.
+
+TLDR answers 404 or a redirect for weekends and holidays, and Software Lead Weekly
+404s for issues that are not out yet. Adapters record those misses here keyed by
+(source_id, issue_key), and the orchestrator drops a (date, source) work item before
+it is scheduled when every issue behind it is known missing.
+
+Policy, mirroring the daily payload cache (util.should_rescrape):
+- A miss checked after its issue date ended (Pacific) is final and never retried.
+- A miss checked on the issue date itself (usually today) is retried once
+  MISSING_ISSUE_RETRY_SECONDS (default 30 minutes) have passed.
+
+Entries live in a local SQLite file (MISSING_ISSUE_STORE_PATH, defaulting to the
+system temp dir). Store failures are logged and treated as "not known missing", so
+they can only cost a fetch, never drop real content.
+"""
+
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import util
+
+
+logger = logging.getLogger("missing_issue_store")
+
+_schema_lock = threading.Lock()
+_initialized_store_paths: set[str] = set()
+
+
+def _store_path() -> str:
+    return util.resolve_env_var(
+        "MISSING_ISSUE_STORE_PATH",
+        os.path.join(tempfile.gettempdir(), "tldr-scraper-missing-issues.sqlite3"),
+    )
+
+
+def _retry_seconds() -> float:
+    return float(util.resolve_env_var("MISSING_ISSUE_RETRY_SECONDS", "1800"))
+
+
+def _connect() -> sqlite3.Connection:
+    path = _store_path()
+    connection = sqlite3.connect(path, timeout=5)
+    if path not in _initialized_store_paths:
+        with _schema_lock:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS missing_issues (
+                    source_id TEXT NOT NULL,
+                    issue_key TEXT NOT NULL,
+                    issue_date TEXT NOT NULL,
+                    reason TEXT NOT NULL,
+                    checked_at REAL NOT NULL,
+                    PRIMARY KEY (source_id, issue_key)
+                )
+                """
+            )
+            connection.commit()
+            _initialized_store_paths.add(path)
+    return connection
+
+
+def is_skippable(entry: dict, now: float | None = None) -> bool:
+    """Return True when a recorded miss should not be fetched again yet.
+
+    >>> is_skippable({"issue_date": "2025-01-04", "checked_at": 1e10})
+    True
+    >>> is_skippable({"issue_date": "2025-01-04", "checked_at": 0.0}, now=1e10)
+    False
+    """
+    if not util.should_rescrape(entry["issue_date"], entry["checked_at"]):
+        return True
+    now = time.time() if now is None else now
+    return now - entry["checked_at"] < _retry_seconds()
+
+
+def record_missing(source_id: str, issue_key: str, issue_date: str, reason: str) -> None:
+    """Remember that issue_key of source_id does not exist, as of now."""
+    try:
+        connection = _connect()
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO missing_issues "
+                "(source_id, issue_key, issue_date, reason, checked_at) VALUES (?, ?, ?, ?, ?)",
+                (source_id, issue_key, issue_date, reason, time.time()),
+            )
+            connection.commit()
+        finally:
+            connection.close()
+    except Exception as error:
+        logger.warning(
+            "missing issue store write failed source=%s issue=%s error=%s",
+            source_id,
+            issue_key,
+            repr(error),
+        )
+
+
+def load_entries(source_ids: list[str]) -> dict[tuple[str, str], dict]:
+    """Return {(source_id, issue_key): entry} for every recorded miss of source_ids."""
+    if not source_ids:
+        return {}
+    placeholders = ",".join("?" for _ in source_ids)
+    try:
+        connection = _connect()
+        try:
+            rows = connection.execute(
+                "SELECT source_id, issue_key, issue_date, reason, checked_at "
+                f"FROM missing_issues WHERE source_id IN ({placeholders})",
+                list(source_ids),
+            ).fetchall()
+        finally:
+            connection.close()
+    except Exception as error:
+        logger.warning("missing issue store read failed; treating as empty error=%s", repr(error))
+        return {}
+
+    return {
+        (source_id, issue_key): {"issue_date": issue_date, "reason": reason, "checked_at": checked_at}
+        for source_id, issue_key, issue_date, reason, checked_at in rows
+    }
+
+
+def all_known_missing(
+    entries: dict[tuple[str, str], dict],
+    source_id: str,
+    issue_keys: list[str],
+    now: float | None = None,
+) -> bool:
+    """Return True when every issue_key of source_id is a skippable miss.
+
+    An empty issue_keys list means the source does not track issues, so it is never skipped.
+
+    >>> entries = {("tldr_tech", "2025-01-04/tech"): {"issue_date": "2025-01-04", "checked_at": 1e10}}
+    >>> all_known_missing(entries, "tldr_tech", ["2025-01-04/tech"])
+    True
+    >>> all_known_missing(entries, "tldr_tech", [])
+    False
+    """
+    if not issue_keys:
+        return False
+    for issue_key in issue_keys:
+        entry = entries.get((source_id, issue_key))
+        if entry is None or not is_skippable(entry, now):
+            return False
+    return True
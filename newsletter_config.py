@@ -26,6 +26,20 @@ class NewsletterSourceConfig:
     category_display_names: dict[str, str]  # {"tech": "TLDR Tech"}
     sort_order: int  # For multi-source ordering (lower = higher priority)
     deduplicate_across_history: bool = False
+    # Send stored ETag / Last-Modified validators and reuse the stored body on 304
+    conditional_get: bool = False
+    # How often the background scrape daemon refreshes this source for today
+    refresh_interval_minutes: int = 120
+    # Hours after a date ends (Pacific) before this source's scrape of it is final
+    rescrape_settle_hours: int = 0
+    # Minimum minutes between rescrapes of a date still in progress; None = RESCRAPE_COOLDOWN_MINUTES
+    rescrape_cooldown_minutes: int | None = None
+    # Weekdays the source publishes on (Monday = 0); None = any day. Other dates are not scraped
+    publish_weekdays: tuple[int, ...] | None = None
+    # Sitemap listing the source's posts, and the URL prefix posts live under. Dates with no
+    # post modified since are answered from the sitemap without fetching the listing page
+    sitemap_url: str | None = None
+    sitemap_path_prefix: str = ""
 
 
 # Registered newsletter sources
@@ -40,6 +54,8 @@ NEWSLETTER_CONFIGS = {
         article_pattern=r"\((\d+)\s+minute\s+read\)|\(GitHub\s+Repo\)",
         category_display_names={"tech": "TLDR Tech"},
         sort_order=11,
+        refresh_interval_minutes=30,
+        publish_weekdays=(0, 1, 2, 3, 4),  # No weekend issues
     ),
     "tldr_ai": NewsletterSourceConfig(
         source_id="tldr_ai",
@@ -51,6 +67,8 @@ NEWSLETTER_CONFIGS = {
         article_pattern=r"\((\d+)\s+minute\s+read\)|\(GitHub\s+Repo\)",
         category_display_names={"ai": "TLDR AI"},
         sort_order=10,
+        refresh_interval_minutes=30,
+        publish_weekdays=(0, 1, 2, 3, 4),  # No weekend issues
     ),
     "hackernews": NewsletterSourceConfig(
         source_id="hackernews",
@@ -62,6 +80,8 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"show": "HN Show"},
         sort_order=23,
+        refresh_interval_minutes=30,
+        rescrape_settle_hours=24,  # Story points keep moving the day after
     ),
 "simon_willison": NewsletterSourceConfig(
         source_id="simon_willison",
@@ -73,6 +93,7 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"blog": "Simon Willison"},
         sort_order=16,  # 7.5/week - bursty
+        conditional_get=True,
     ),
     "danluu": NewsletterSourceConfig(
         source_id="danluu",
@@ -84,6 +105,7 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"blog": "Dan Luu"},
         sort_order=5,  # 0.8/week - rare, bursty
+        conditional_get=True,
     ),
     "will_larson": NewsletterSourceConfig(
         source_id="will_larson",
@@ -95,6 +117,7 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"blog": "Engineering Leadership"},
         sort_order=6,  # 0.8/week - rare, bursty
+        conditional_get=True,
     ),
     "pragmatic_engineer": NewsletterSourceConfig(
         source_id="pragmatic_engineer",
@@ -106,6 +129,7 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"newsletter": "The Pragmatic Engineer"},
         sort_order=9,  # 2.5/week - consistent
+        conditional_get=True,
     ),
     "jessitron": NewsletterSourceConfig(
         source_id="jessitron",
@@ -128,6 +152,8 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"engineering": "Stripe Engineering"},
         sort_order=1,  # 0.2/week - rarest, bursty (highest priority)
+        sitemap_url="https://stripe.com/sitemap.xml",
+        sitemap_path_prefix="https://stripe.com/blog/",
     ),
     "deepmind": NewsletterSourceConfig(
         source_id="deepmind",
@@ -139,6 +165,8 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"blog": "Google DeepMind"},
         sort_order=12,  # 3.2/week - consistent
+        sitemap_url="https://deepmind.google/sitemap.xml",
+        sitemap_path_prefix="https://deepmind.google/discover/blog/",
     ),
     "google_research": NewsletterSourceConfig(
         source_id="google_research",
@@ -150,6 +178,8 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"blog": "Google Research Blog"},
         sort_order=11,  # Frequent, high-signal research posts
+        sitemap_url="https://research.google/sitemap.xml",
+        sitemap_path_prefix="https://research.google/blog/",
     ),
     "pointer": NewsletterSourceConfig(
         source_id="pointer",
@@ -172,6 +202,7 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"blog": "Netflix Tech"},
         sort_order=2,  # 0.2/week - rarest, consistent
+        conditional_get=True,
     ),
     "anthropic": NewsletterSourceConfig(
         source_id="anthropic",
@@ -183,6 +214,8 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"research": "Anthropic Research"},
         sort_order=10,  # 2.5/week - consistent
+        sitemap_url="https://www.anthropic.com/sitemap.xml",
+        sitemap_path_prefix="https://www.anthropic.com/research/",
     ),
     "anthropic_news": NewsletterSourceConfig(
         source_id="anthropic_news",
@@ -194,6 +227,8 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"news": "Anthropic News"},
         sort_order=9,  # ~2/week - consistent
+        sitemap_url="https://www.anthropic.com/sitemap.xml",
+        sitemap_path_prefix="https://www.anthropic.com/news/",
     ),
     "claude_blog": NewsletterSourceConfig(
         source_id="claude_blog",
@@ -205,6 +240,8 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"blog": "Claude Blog"},
         sort_order=11,  # ~2/week - consistent
+        sitemap_url="https://claude.com/sitemap.xml",
+        sitemap_path_prefix="https://claude.com/blog/",
     ),
     "softwareleadweekly": NewsletterSourceConfig(
         source_id="softwareleadweekly",
@@ -216,6 +253,7 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"newsletter": "Software Lead Weekly"},
         sort_order=18,  # 9.5/week
+        publish_weekdays=(4,),  # One issue every Friday
     ),
     "hillel_wayne": NewsletterSourceConfig(
         source_id="hillel_wayne",
@@ -227,6 +265,7 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"blog": "Hillel Wayne"},
         sort_order=3,  # 0.5/week - rare, bursty
+        conditional_get=True,
     ),
     "martin_fowler": NewsletterSourceConfig(
         source_id="martin_fowler",
@@ -238,6 +277,7 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"blog": "Martin Fowler"},
         sort_order=7,  # 1.0/week - bursty
+        conditional_get=True,
     ),
     "react_status": NewsletterSourceConfig(
         source_id="react_status",
@@ -249,6 +289,7 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"newsletter": "React Status"},
         sort_order=17,  # 7.5/week - consistent
+        conditional_get=True,
     ),
     "aiwithmike": NewsletterSourceConfig(
         source_id="aiwithmike",
@@ -260,6 +301,7 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"newsletter": "Mathy AI"},
         sort_order=21,
+        conditional_get=True,
     ),
     "savannah_ostrowski": NewsletterSourceConfig(
         source_id="savannah_ostrowski",
@@ -271,6 +313,7 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"blog": "Savannah Ostrowski"},
         sort_order=4,  # High priority - Python core dev, steering council
+        conditional_get=True,
     ),
     "lucumr": NewsletterSourceConfig(
         source_id="lucumr",
@@ -282,6 +325,7 @@ NEWSLETTER_CONFIGS = {
         article_pattern="",
         category_display_names={"blog": "Armin Ronacher"},
         sort_order=7,  # High priority - Flask/Ruff creator
+        conditional_get=True,
     ),
     "trendshift": NewsletterSourceConfig(
         source_id="trendshift",
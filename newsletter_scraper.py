@@ -1,7 +1,10 @@
+import asyncio
 import logging
+import threading
+import time
 
 from newsletter_config import NEWSLETTER_CONFIGS
-from adapters.tldr_adapter import TLDRAdapter
+from adapters import registry as adapter_registry
 import storage_service
 
 import util
@@ -10,7 +13,7 @@ logger = logging.getLogger("newsletter_scraper")
 
 
 def _get_adapter_for_source(config):
-    """Factory pattern - returns appropriate adapter for source.
+    """Return the process-wide adapter for config's source, via the adapter registry.
 
     Args:
         config: NewsletterSourceConfig instance
@@ -21,76 +24,7 @@ def _get_adapter_for_source(config):
     Raises:
         ValueError: If no adapter exists for the source
     """
-    if config.source_id.startswith("tldr_"):
-        return TLDRAdapter(config)
-    elif config.source_id == "hackernews":
-        from adapters.hackernews_adapter import HackerNewsAdapter
-        return HackerNewsAdapter(config)
-    elif config.source_id == "simon_willison":
-        from adapters.simon_willison_adapter import SimonWillisonAdapter
-        return SimonWillisonAdapter(config)
-    elif config.source_id == "danluu":
-        from adapters.danluu_adapter import DanLuuAdapter
-        return DanLuuAdapter(config)
-    elif config.source_id == "will_larson":
-        from adapters.will_larson_adapter import WillLarsonAdapter
-        return WillLarsonAdapter(config)
-    elif config.source_id == "pragmatic_engineer":
-        from adapters.pragmatic_engineer_adapter import PragmaticEngineerAdapter
-        return PragmaticEngineerAdapter(config)
-    elif config.source_id == "jessitron":
-        from adapters.jessitron_adapter import JessitronAdapter
-        return JessitronAdapter(config)
-    elif config.source_id == "stripe_engineering":
-        from adapters.stripe_engineering_adapter import StripeEngineeringAdapter
-        return StripeEngineeringAdapter(config)
-    elif config.source_id == "deepmind":
-        from adapters.deepmind_adapter import DeepMindAdapter
-        return DeepMindAdapter(config)
-    elif config.source_id == "google_research":
-        from adapters.google_research_adapter import GoogleResearchAdapter
-        return GoogleResearchAdapter(config)
-    elif config.source_id == "pointer":
-        from adapters.pointer_adapter import PointerAdapter
-        return PointerAdapter(config)
-    elif config.source_id == "softwareleadweekly":
-        from adapters.softwareleadweekly_adapter import SoftwareLeadWeeklyAdapter
-        return SoftwareLeadWeeklyAdapter(config)
-    elif config.source_id == "anthropic":
-        from adapters.anthropic_adapter import AnthropicResearchAdapter
-        return AnthropicResearchAdapter(config)
-    elif config.source_id == "anthropic_news":
-        from adapters.anthropic_news_adapter import AnthropicNewsAdapter
-        return AnthropicNewsAdapter(config)
-    elif config.source_id == "claude_blog":
-        from adapters.claude_blog_adapter import ClaudeBlogAdapter
-        return ClaudeBlogAdapter(config)
-    elif config.source_id == "netflix":
-        from adapters.netflix_adapter import NetflixAdapter
-        return NetflixAdapter(config)
-    elif config.source_id == "hillel_wayne":
-        from adapters.hillel_wayne_adapter import HillelWayneAdapter
-        return HillelWayneAdapter(config)
-    elif config.source_id == "martin_fowler":
-        from adapters.martin_fowler_adapter import MartinFowlerAdapter
-        return MartinFowlerAdapter(config)
-    elif config.source_id == "react_status":
-        from adapters.react_status_adapter import ReactStatusAdapter
-        return ReactStatusAdapter(config)
-    elif config.source_id == "aiwithmike":
-        from adapters.aiwithmike_adapter import AiWithMikeAdapter
-        return AiWithMikeAdapter(config)
-    elif config.source_id == "savannah_ostrowski":
-        from adapters.savannah_adapter import SavannahAdapter
-        return SavannahAdapter(config)
-    elif config.source_id == "lucumr":
-        from adapters.lucumr_adapter import LucumrAdapter
-        return LucumrAdapter(config)
-    elif config.source_id == "trendshift":
-        from adapters.trendshift_adapter import TrendshiftAdapter
-        return TrendshiftAdapter(config)
-    else:
-        raise ValueError(f"No adapter registered for source: {config.source_id}")
+    return adapter_registry.get_adapter(config)
 
 
 def get_default_source_ids() -> list[str]:
@@ -102,61 +36,379 @@ def get_default_source_ids() -> list[str]:
     return list(NEWSLETTER_CONFIGS.keys())
 
 
-def scrape_single_source_for_date(
-    date,
-    source_id,
-    excluded_urls,
-):
-    result = {
+def source_supports_range_scrape(source_id: str) -> bool:
+    """Return True when the source's adapter can scrape a whole date range in one fetch.
+
+    >>> source_supports_range_scrape("unknown_source")
+    False
+    """
+    config = NEWSLETTER_CONFIGS.get(source_id)
+    if config is None:
+        return False
+    return _get_adapter_for_source(config).supports_range_scrape
+
+
+def get_missing_issue_keys(source_id: str, date_str: str) -> list[str]:
+    """Return the issue keys scraping source_id for date_str depends on (see missing_issue_store).
+
+    >>> get_missing_issue_keys("unknown_source", "2025-01-04")
+    []
+    """
+    config = NEWSLETTER_CONFIGS.get(source_id)
+    if config is None:
+        return []
+    return _get_adapter_for_source(config).missing_issue_keys(date_str)
+
+
+def _build_empty_source_result(source_id: str) -> dict:
+    return {
         "articles": [],
         "network_articles": 0,
         "error": None,
         "source_id": source_id,
     }
-    date_str = util.format_date_for_url(date)
 
+
+class SourceCircuitBreaker:
+    """Health of one source: failure counts, latency EWMA and a closed/open/half-open breaker.
+
+    After failure_threshold consecutive failures the breaker opens and the source's
+    remaining work is skipped. Once cooldown_seconds have passed it goes half-open and
+    lets a single probe through: success closes it, failure reopens it.
+
+    >>> breaker = SourceCircuitBreaker(failure_threshold=2, cooldown_seconds=10)
+    >>> breaker.record(False, 50.0, now=0.0); breaker.record(False, 50.0, now=1.0)
+    >>> breaker.state, breaker.allow(now=5.0)
+    ('open', False)
+    >>> breaker.allow(now=11.0), breaker.state, breaker.allow(now=11.0)
+    (True, 'half_open', False)
+    >>> breaker.record(True, 20.0, now=12.0)
+    >>> breaker.state, breaker.allow(now=12.0)
+    ('closed', True)
+    """
+
+    EWMA_ALPHA = 0.3
+
+    def __init__(self, failure_threshold: int, cooldown_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.failures = 0
+        self.successes = 0
+        self.latency_ewma_ms: float | None = None
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def is_open(self, now: float | None = None) -> bool:
+        """Return True while work should be skipped, without claiming a half-open probe."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self.state == "open":
+                return now - self._opened_at < self.cooldown_seconds
+            return self.state == "half_open" and self._probe_in_flight
+
+    def allow(self, now: float | None = None) -> bool:
+        """Return True when a task may call the source; claims the probe when half-open."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self.state == "open" and now - self._opened_at >= self.cooldown_seconds:
+                self.state = "half_open"
+                self._probe_in_flight = False
+            if self.state == "closed":
+                return True
+            if self.state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record(self, success: bool, latency_ms: float, now: float | None = None) -> None:
+        """Record one finished call to the source."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self.latency_ewma_ms is None:
+                self.latency_ewma_ms = latency_ms
+            else:
+                self.latency_ewma_ms += self.EWMA_ALPHA * (latency_ms - self.latency_ewma_ms)
+
+            if success:
+                self.successes += 1
+                self.consecutive_failures = 0
+                self.state = "closed"
+                self._probe_in_flight = False
+                return
+
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = now
+                self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe that ended without an outcome, so the next task may probe.
+
+        >>> breaker = SourceCircuitBreaker(failure_threshold=1, cooldown_seconds=10)
+        >>> breaker.record(False, 50.0, now=0.0)
+        >>> breaker.allow(now=11.0), breaker.is_open(now=11.0)
+        (True, True)
+        >>> breaker.release_probe()
+        >>> breaker.state, breaker.is_open(now=11.0), breaker.allow(now=11.0)
+        ('half_open', False, True)
+        """
+        with self._lock:
+            if self.state == "half_open":
+                self._probe_in_flight = False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "failures": self.failures,
+                "successes": self.successes,
+                "latency_ewma_ms": None if self.latency_ewma_ms is None else round(self.latency_ewma_ms, 1),
+            }
+
+
+# Shared by every scrape in the process, so one request's failures protect the next
+_source_breakers_lock = threading.Lock()
+_source_breakers: dict[str, SourceCircuitBreaker] = {}
+
+
+def get_source_breaker(source_id: str) -> SourceCircuitBreaker:
+    """Return the process-wide circuit breaker for source_id."""
+    with _source_breakers_lock:
+        breaker = _source_breakers.get(source_id)
+        if breaker is None:
+            breaker = SourceCircuitBreaker(
+                failure_threshold=max(1, int(util.resolve_env_var("SOURCE_BREAKER_FAILURE_THRESHOLD", "3"))),
+                cooldown_seconds=float(util.resolve_env_var("SOURCE_BREAKER_COOLDOWN_SECONDS", "120")),
+            )
+            _source_breakers[source_id] = breaker
+        return breaker
+
+
+def source_health_stats(source_ids: list[str]) -> dict[str, dict]:
+    """Return {source_id: breaker snapshot} for the given sources that have been called."""
+    with _source_breakers_lock:
+        breakers = {source_id: _source_breakers.get(source_id) for source_id in source_ids}
+    return {source_id: breaker.snapshot() for source_id, breaker in breakers.items() if breaker is not None}
+
+
+def reset_source_health() -> None:
+    """Forget every source's health, closing all breakers."""
+    with _source_breakers_lock:
+        _source_breakers.clear()
+
+
+def _record_source_failure(breaker: SourceCircuitBreaker, started: float) -> None:
+    """Count a failed call against the source, unless the scrape's deadline or cancellation cut it short.
+
+    A call cut short says nothing about the source's health; it only gives back the
+    half-open probe it may hold.
+    """
+    remaining = util.remaining_deadline_seconds()
+    if (remaining is not None and remaining <= 0) or util.scrape_cancelled():
+        breaker.release_probe()
+        return
+    breaker.record(False, (time.perf_counter() - started) * 1000)
+
+
+def _build_circuit_open_result(source_id: str) -> dict:
+    result = _build_empty_source_result(source_id)
+    result["error"] = "circuit open"
+    result["circuit_open"] = True
+    return result
+
+
+def _collect_source_articles(config, date_str: str, scrape_result: dict, result: dict) -> None:
+    """Canonicalize scraped article URLs into result, applying history dedup when configured."""
+    articles = scrape_result.get("articles", [])
+    canonical_urls = util.canonicalize_urls(article["url"] for article in articles)
+    history_deduplicated_urls: set[str] | None = None
+    if config.deduplicate_across_history:
+        history_deduplicated_urls = storage_service.filter_new_urls_for_history_dedup(
+            source_id=config.source_id,
+            first_seen_date=date_str,
+            canonical_urls=canonical_urls,
+        )
+
+    for article, canonical_url in zip(articles, canonical_urls):
+        if history_deduplicated_urls is not None and canonical_url not in history_deduplicated_urls:
+            continue
+        article["url"] = canonical_url
+        result["articles"].append(article)
+
+    result["network_articles"] = len(result["articles"])
+
+
+def _unscrapable_source_results(source_id: str, date_strs: list[str]) -> list[tuple[str, dict]] | None:
+    """Return the results for a source that cannot be scraped right now, or None when it can.
+
+    Asking the breaker takes the half-open probe, so a None answer must be followed by a call.
+    """
     if source_id not in NEWSLETTER_CONFIGS:
         logger.warning(f"Unknown source_id: {source_id}, skipping")
-        result["error"] = f"Unknown source_id: {source_id}"
-        return date_str, result
+        results = []
+        for date_str in date_strs:
+            result = _build_empty_source_result(source_id)
+            result["error"] = f"Unknown source_id: {source_id}"
+            results.append((date_str, result))
+        return results
+    if not get_source_breaker(source_id).allow():
+        return [(date_str, _build_circuit_open_result(source_id)) for date_str in date_strs]
+    return None
+
+
+def _collect_source_results(config, date_strs: list[str], scrape_results_by_date: dict) -> list[tuple[str, dict]]:
+    results = []
+    for date_str in date_strs:
+        result = _build_empty_source_result(config.source_id)
+        _collect_source_articles(config, date_str, scrape_results_by_date.get(date_str, {}), result)
+        results.append((date_str, result))
+    return results
+
+
+async def _async_collect_source_results(config, date_strs: list[str], scrape_results_by_date: dict) -> list[tuple[str, dict]]:
+    """_collect_source_results for the asyncio engine; history dedup queries storage off the event loop."""
+    if config.deduplicate_across_history:
+        return await asyncio.to_thread(_collect_source_results, config, date_strs, scrape_results_by_date)
+    return _collect_source_results(config, date_strs, scrape_results_by_date)
+
+
+def _failed_source_results(
+    config, breaker: SourceCircuitBreaker, started: float, date_strs: list[str], error: Exception
+) -> list[tuple[str, dict]]:
+    """Record a failed call and mark every date it covered as errored."""
+    _record_source_failure(breaker, started)
+    dates_label = date_strs[0] if len(date_strs) == 1 else f"{date_strs[0]}..{date_strs[-1]}"
+    logger.error(
+        f"Error processing {config.display_name} for {dates_label}: {error}",
+        exc_info=True,
+    )
+    results = []
+    for date_str in date_strs:
+        result = _build_empty_source_result(config.source_id)
+        result["error"] = str(error)
+        results.append((date_str, result))
+    return results
 
-    config = NEWSLETTER_CONFIGS[source_id]
 
+def _scrape_source(source_id: str, date_strs: list[str], call) -> list[tuple[str, dict]]:
+    """Run call(adapter) -> {date_str: scrape_result} under the source's breaker.
+
+    Returns one (date_str, result) pair per date in date_strs. A failure marks every
+    date as errored.
+    """
+    results = _unscrapable_source_results(source_id, date_strs)
+    if results is not None:
+        return results
+
+    config = NEWSLETTER_CONFIGS[source_id]
+    breaker = get_source_breaker(source_id)
+    started = time.perf_counter()
     try:
-        adapter = _get_adapter_for_source(config)
-        scrape_result = adapter.scrape_date(date, excluded_urls)
-
-        history_deduplicated_urls: set[str] | None = None
-        if config.deduplicate_across_history:
-            canonical_urls = [
-                util.canonicalize_url(article["url"])
-                for article in scrape_result.get("articles", [])
-            ]
-            history_deduplicated_urls = storage_service.filter_new_urls_for_history_dedup(
-                source_id=config.source_id,
-                first_seen_date=date_str,
-                canonical_urls=canonical_urls,
-            )
+        scrape_results_by_date = call(_get_adapter_for_source(config))
+        latency_ms = (time.perf_counter() - started) * 1000
+        results = _collect_source_results(config, date_strs, scrape_results_by_date)
+    except Exception as error:
+        return _failed_source_results(config, breaker, started, date_strs, error)
+    breaker.record(True, latency_ms)
+    return results
 
-        for article in scrape_result.get("articles", []):
-            canonical_url = util.canonicalize_url(article["url"])
-            if history_deduplicated_urls is not None and canonical_url not in history_deduplicated_urls:
-                continue
-            article["url"] = canonical_url
-            result["articles"].append(article)
 
-        result["network_articles"] = len(result["articles"])
+async def _async_scrape_source(source_id: str, date_strs: list[str], call) -> list[tuple[str, dict]]:
+    """Coroutine counterpart of _scrape_source; call(adapter) returns an awaitable."""
+    results = _unscrapable_source_results(source_id, date_strs)
+    if results is not None:
+        return results
 
+    config = NEWSLETTER_CONFIGS[source_id]
+    breaker = get_source_breaker(source_id)
+    started = time.perf_counter()
+    try:
+        scrape_results_by_date = await call(_get_adapter_for_source(config))
+        latency_ms = (time.perf_counter() - started) * 1000
+        results = await _async_collect_source_results(config, date_strs, scrape_results_by_date)
+    except asyncio.CancelledError:
+        breaker.release_probe()
+        raise
     except Exception as error:
-        logger.error(
-            f"Error processing {config.display_name} for {date_str}: {error}",
-            exc_info=True,
-        )
-        result["error"] = str(error)
+        return _failed_source_results(config, breaker, started, date_strs, error)
+    breaker.record(True, latency_ms)
+    return results
+
+
+def _range_date_strs(start_date, end_date) -> list[str]:
+    return [
+        util.format_date_for_url(current_date)
+        for current_date in util.get_date_range(start_date, end_date)
+    ]
 
+
+def scrape_single_source_for_date(
+    date,
+    source_id,
+    excluded_urls,
+):
+    date_str = util.format_date_for_url(date)
+    ((_, result),) = _scrape_source(
+        source_id,
+        [date_str],
+        lambda adapter: {date_str: adapter.scrape_date(date, excluded_urls)},
+    )
     return date_str, result
 
 
+def scrape_single_source_for_range(
+    start_date,
+    end_date,
+    source_id,
+    excluded_urls,
+) -> list[tuple[str, dict]]:
+    """Scrape one range-capable source for every date in [start_date, end_date] with a single fetch.
+
+    Returns (date_str, result) pairs shaped exactly like scrape_single_source_for_date's,
+    one per date in the range. A failure marks every date in the range as errored.
+    """
+    return _scrape_source(
+        source_id,
+        _range_date_strs(start_date, end_date),
+        lambda adapter: adapter.scrape_range(start_date, end_date, excluded_urls),
+    )
+
+
+async def async_scrape_single_source_for_date(
+    date,
+    source_id,
+    excluded_urls,
+):
+    """Coroutine counterpart of scrape_single_source_for_date for the asyncio scrape engine."""
+    date_str = util.format_date_for_url(date)
+
+    async def call(adapter):
+        return {date_str: await adapter.async_scrape_date(date, excluded_urls)}
+
+    ((_, result),) = await _async_scrape_source(source_id, [date_str], call)
+    return date_str, result
+
+
+async def async_scrape_single_source_for_range(
+    start_date,
+    end_date,
+    source_id,
+    excluded_urls,
+) -> list[tuple[str, dict]]:
+    """Coroutine counterpart of scrape_single_source_for_range for the asyncio scrape engine."""
+    return await _async_scrape_source(
+        source_id,
+        _range_date_strs(start_date, end_date),
+        lambda adapter: adapter.async_scrape_range(start_date, end_date, excluded_urls),
+    )
+
+
 def merge_source_results_for_date(date_str: str, source_results: list[tuple[str, dict]]) -> dict:
     url_set: set[str] = set()
     all_articles: list[dict] = []
@@ -0,0 +1,69 @@
+"""
+Background persistence of finished scrape dates.
+
+The orchestrator finalizes each date as soon as its last source task reports
+and hands the payload to submit() instead of writing it inline. A single
+worker thread writes them to daily_cache in submission order, so a slow
+database write never holds back the next date's scrape or stream event, and
+two scrapes finishing the same date are persisted in the order they finished.
+
+At most SCRAPE_WRITE_MAX_PENDING writes (default 16) wait at once; submit()
+blocks while the queue is full. A scrape waits for its own writes before its
+final stats event, so a completed response means its dates are stored. A stream
+closed early by a disconnected client waits for the writes it already queued
+before it finishes closing, since a serverless instance may be frozen once the
+response ends. A scrape cut short by a crash or timeout keeps every date already
+written, and the next request only redoes the unfinished ones.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future, wait
+
+import util
+
+
+logger = logging.getLogger("payload_writer")
+
+_worker_lock = threading.Lock()
+_worker: threading.Thread | None = None
+_queue: queue.Queue | None = None
+
+
+def _run(write_queue: queue.Queue) -> None:
+    while True:
+        future, write, date_str, payload = write_queue.get()
+        if future.set_running_or_notify_cancel():
+            try:
+                write(date_str, payload)
+            except Exception as error:
+                logger.exception("write failed date=%s error=%s", date_str, error)
+                future.set_exception(error)
+            else:
+                future.set_result(date_str)
+        write_queue.task_done()
+
+
+def _ensure_worker() -> queue.Queue:
+    global _worker, _queue
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _queue = queue.Queue(maxsize=max(1, int(util.resolve_env_var("SCRAPE_WRITE_MAX_PENDING", "16"))))
+            _worker = threading.Thread(target=_run, args=(_queue,), name="payload-writer", daemon=True)
+            _worker.start()
+        return _queue
+
+
+def submit(write, date_str: str, payload: dict) -> Future:
+    """Queue write(date_str, payload) behind earlier writes; blocks while the queue is full."""
+    future: Future = Future()
+    _ensure_worker().put((future, write, date_str, payload))
+    return future
+
+
+def wait_for(futures_by_date: dict[str, Future]) -> dict:
+    """Wait for a scrape's writes and return {"persisted": count, "failed": [dates]}."""
+    wait(futures_by_date.values())
+    failed = sorted(date_str for date_str, future in futures_by_date.items() if future.exception() is not None)
+    return {"persisted": len(futures_by_date) - len(failed), "failed": failed}
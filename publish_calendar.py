@@ -0,0 +1,177 @@
+"""
+Publish-calendar prediction for newsletter sources.
+
+Two rules decide whether a (date, source) work item can produce articles at all:
+- Static: NewsletterSourceConfig.publish_weekdays lists the weekdays a source
+  publishes on (TLDR Monday to Friday, Software Lead Weekly Friday). None means any day.
+- Learned: the cadence each source showed in daily_cache over the last
+  PUBLISH_CALENDAR_LOOKBACK_DAYS days (default 56, 0 disables learning).
+
+A weekday is only predicted empty with high confidence: the source must have
+finished an empty scrape of that weekday at least PUBLISH_CALENDAR_MIN_OBSERVATIONS
+times (default 6), never have had articles on it in the window, and have published at
+least that many days overall. Rare or bursty sources never reach that bar, so they
+keep being scraped every day.
+
+The learned cadence is computed from one daily_cache read of each date's sourceMeta
+(not the article payloads) and reused process-wide for PUBLISH_CALENDAR_REFRESH_SECONDS
+(default 6 hours). One caller relearns it while the others keep using the previous
+cadence, so no request waits on the read. A failed read leaves the learned rule
+empty, which can only cost a fetch.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+import storage_service
+import util
+from newsletter_config import NEWSLETTER_CONFIGS
+
+
+logger = logging.getLogger("publish_calendar")
+
+_cadence_lock = threading.Lock()
+_learned: dict = {"cadence": None, "learned_at": 0.0, "refreshing": False}
+
+
+def _lookback_days() -> int:
+    return int(util.resolve_env_var("PUBLISH_CALENDAR_LOOKBACK_DAYS", "56"))
+
+
+def _min_observations() -> int:
+    return int(util.resolve_env_var("PUBLISH_CALENDAR_MIN_OBSERVATIONS", "6"))
+
+
+def _refresh_seconds() -> float:
+    return float(util.resolve_env_var("PUBLISH_CALENDAR_REFRESH_SECONDS", "21600"))
+
+
+def _weekday(date_str: str) -> int:
+    return date.fromisoformat(date_str).weekday()
+
+
+def _new_source_cadence() -> dict[str, list[int]]:
+    return {"published": [0] * 7, "empty": [0] * 7}
+
+
+def _finished_empty(date_str: str, source_id: str, meta: dict | None) -> bool:
+    """Return True when source_id's latest scrape of date_str succeeded, found nothing and is final."""
+    if not meta or meta.get("articleCount") or meta.get("lastSuccessAt") is None:
+        return False
+    last_success_epoch = util.parse_cached_at_epoch_seconds(meta["lastSuccessAt"])
+    if meta.get("lastErrorAt") and util.parse_cached_at_epoch_seconds(meta["lastErrorAt"]) > last_success_epoch:
+        return False
+    config = NEWSLETTER_CONFIGS.get(source_id)
+    settle_seconds = config.rescrape_settle_hours * 3600 if config else 0
+    return not util.should_rescrape(date_str, last_success_epoch, settle_seconds=settle_seconds)
+
+
+def learn_cadence(rows: list[dict]) -> dict[str, dict[str, list[int]]]:
+    """Return {source_id: {"published": [...], "empty": [...]}} day counts per weekday (Monday = 0).
+
+    Takes {"date", "sourceMeta"} rows. A date counts as published for a source whose
+    sourceMeta records articles, and as empty for one whose sourceMeta records a final
+    scrape that found nothing.
+
+    >>> rows = [
+    ...     {"date": "2025-01-03", "sourceMeta": {"tldr_tech": {"lastSuccessAt": "2025-01-03T12:00:00+00:00", "articleCount": 3}}},
+    ...     {"date": "2025-01-04", "sourceMeta": {"tldr_tech": {"lastSuccessAt": "2025-01-06T12:00:00+00:00", "articleCount": 0}}},
+    ... ]
+    >>> cadence = learn_cadence(rows)["tldr_tech"]
+    >>> cadence["published"][4], cadence["empty"][5]
+    (1, 1)
+    """
+    cadence: dict[str, dict[str, list[int]]] = defaultdict(_new_source_cadence)
+    for row in rows:
+        weekday = _weekday(row["date"])
+        for source_id, meta in (row.get("sourceMeta") or {}).items():
+            if meta and meta.get("articleCount"):
+                cadence[source_id]["published"][weekday] += 1
+            elif _finished_empty(row["date"], source_id, meta):
+                cadence[source_id]["empty"][weekday] += 1
+    return dict(cadence)
+
+
+def predicts_empty(
+    cadence: dict[str, dict[str, list[int]]], source_id: str, weekday: int, min_observations: int
+) -> bool:
+    """Return True when the learned cadence is confident source_id publishes nothing on weekday.
+
+    >>> weekdays_only = {"published": [8, 8, 8, 8, 8, 0, 0], "empty": [0, 0, 0, 0, 0, 8, 2]}
+    >>> predicts_empty({"tldr_tech": weekdays_only}, "tldr_tech", 5, 6)
+    True
+    >>> predicts_empty({"tldr_tech": weekdays_only}, "tldr_tech", 6, 6)
+    False
+    """
+    source_cadence = cadence.get(source_id)
+    if source_cadence is None:
+        return False
+    return (
+        source_cadence["published"][weekday] == 0
+        and source_cadence["empty"][weekday] >= min_observations
+        and sum(source_cadence["published"]) >= min_observations
+    )
+
+
+def get_learned_cadence(now: float | None = None) -> dict[str, dict[str, list[int]]]:
+    """Return the process-wide learned cadence, relearning it from daily_cache when it is due."""
+    lookback_days = _lookback_days()
+    if lookback_days <= 0:
+        return {}
+    now = time.time() if now is None else now
+    with _cadence_lock:
+        if _learned["cadence"] is not None and now - _learned["learned_at"] < _refresh_seconds():
+            return _learned["cadence"]
+        if _learned["refreshing"]:
+            # Another caller is reading daily_cache; the previous cadence (or none) only costs fetches
+            return _learned["cadence"] or {}
+        _learned["refreshing"] = True
+
+    today = datetime.now(util.PACIFIC_TZ).date()
+    start_date_text = (today - timedelta(days=lookback_days)).isoformat()
+    end_date_text = (today - timedelta(days=1)).isoformat()
+    try:
+        rows = storage_service.get_source_meta_range(start_date_text, end_date_text)
+        cadence = learn_cadence(rows)
+    except Exception as error:
+        logger.warning("publish cadence learning failed; using static rules only error=%s", repr(error))
+        cadence = {}
+    else:
+        logger.info(
+            "learned publish cadence start=%s end=%s dates=%s sources=%s",
+            start_date_text,
+            end_date_text,
+            len(rows),
+            len(cadence),
+        )
+    with _cadence_lock:
+        _learned["cadence"] = cadence
+        _learned["learned_at"] = now
+        _learned["refreshing"] = False
+    return cadence
+
+
+def reset_learned_cadence() -> None:
+    """Forget the learned cadence so the next lookup relearns it."""
+    with _cadence_lock:
+        _learned["cadence"] = None
+        _learned["learned_at"] = 0.0
+        _learned["refreshing"] = False
+
+
+def can_publish_on(source_id: str, date_str: str, cadence: dict[str, dict[str, list[int]]]) -> bool:
+    """Return False when source_id is predicted to publish nothing on date_str.
+
+    >>> can_publish_on("softwareleadweekly", "2025-11-14", {})
+    True
+    >>> can_publish_on("softwareleadweekly", "2025-11-15", {})
+    False
+    """
+    weekday = _weekday(date_str)
+    config = NEWSLETTER_CONFIGS.get(source_id)
+    if config is not None and config.publish_weekdays is not None and weekday not in config.publish_weekdays:
+        return False
+    return not predicts_empty(cadence, source_id, weekday, _min_observations())
@@ -0,0 +1,185 @@
+"""
+Background scrape daemon that keeps today's and yesterday's cache warm.
+
+Run with:
+    python -m scrape_daemon          # loop forever
+    python -m scrape_daemon --once   # one pass, then exit
+
+or `just daemon [--once]`.
+
+Each source is refreshed for today on its own cadence (refresh_interval_minutes in
+NewsletterSourceConfig, overridable with DAEMON_SOURCE_INTERVALS such as
+"tldr_tech=15,hackernews=20"), with +/- DAEMON_JITTER_FRACTION random jitter so
+sources do not all fire together. Refreshing goes through
+tldr_service.scrape_newsletters_in_date_range, so results are merged into the cached
+payload and persisted with set_daily_payload_from_scrape exactly as for /api/scrape.
+
+Yesterday is refreshed with every source whose last scrape of it is not final yet,
+judged from the payload's sourceMeta with the same per-source check the request path
+uses (tldr_service._source_needs_rescrape). A source that failed, or whose settle time
+has not passed, keeps being retried after the others are final.
+"""
+
+import argparse
+import logging
+import random
+import signal
+import threading
+import time
+from datetime import datetime, timedelta
+
+from newsletter_config import NEWSLETTER_CONFIGS
+import storage_service
+import tldr_service
+import util
+
+
+logger = logging.getLogger("scrape_daemon")
+
+_MAX_IDLE_SECONDS = 60
+
+
+def parse_source_intervals(text: str) -> dict[str, int]:
+    """Parse a DAEMON_SOURCE_INTERVALS value into {source_id: minutes}.
+
+    >>> parse_source_intervals("tldr_tech=15, hackernews=20, bad")
+    {'tldr_tech': 15, 'hackernews': 20}
+    """
+    intervals = {}
+    for entry in text.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        source_id, _, minutes_text = entry.partition("=")
+        try:
+            intervals[source_id.strip()] = max(1, int(minutes_text))
+        except ValueError:
+            logger.warning("Ignoring malformed DAEMON_SOURCE_INTERVALS entry %r", entry)
+    return intervals
+
+
+def resolve_refresh_intervals(source_ids: list[str]) -> dict[str, float]:
+    """Return {source_id: refresh interval in seconds}, applying DAEMON_SOURCE_INTERVALS overrides."""
+    overrides = parse_source_intervals(util.resolve_env_var("DAEMON_SOURCE_INTERVALS", ""))
+    return {
+        source_id: 60.0 * overrides.get(source_id, NEWSLETTER_CONFIGS[source_id].refresh_interval_minutes)
+        for source_id in source_ids
+    }
+
+
+def jittered(interval_seconds: float, jitter_fraction: float, rng: random.Random) -> float:
+    """Return interval_seconds scaled by a random factor in [1 - jitter, 1 + jitter].
+
+    >>> jittered(100.0, 0.0, random.Random(0))
+    100.0
+    >>> 90.0 <= jittered(100.0, 0.1, random.Random(0)) <= 110.0
+    True
+    """
+    return interval_seconds * (1 + rng.uniform(-jitter_fraction, jitter_fraction))
+
+
+def _pacific_today_and_yesterday() -> tuple[str, str]:
+    today = datetime.now(util.PACIFIC_TZ).date()
+    return today.isoformat(), (today - timedelta(days=1)).isoformat()
+
+
+def _yesterday_sources_needing_final_scrape(yesterday: str) -> list[str]:
+    rows = storage_service.get_daily_payloads_range(yesterday, yesterday)
+    cached_payload = rows[0]["payload"] if rows else None
+    cached_at = rows[0].get("cached_at") if rows else None
+    cached_at_epoch = util.parse_cached_at_epoch_seconds(cached_at) if cached_at else None
+    return [
+        source_id
+        for source_id in tldr_service.get_default_source_ids()
+        if tldr_service._source_needs_rescrape(yesterday, cached_payload, cached_at_epoch, source_id)
+    ]
+
+
+def run_pass(due_source_ids: list[str]) -> None:
+    """Refresh today for due_source_ids, and yesterday for every source whose scrape of it is not final yet."""
+    today, yesterday = _pacific_today_and_yesterday()
+
+    yesterday_source_ids = _yesterday_sources_needing_final_scrape(yesterday)
+    if yesterday_source_ids:
+        started = time.monotonic()
+        result = tldr_service.scrape_newsletters_in_date_range(yesterday, yesterday, source_ids=yesterday_source_ids)
+        logger.info(
+            "refreshed date=%s sources=%s articles=%s elapsed_ms=%s",
+            yesterday,
+            ",".join(yesterday_source_ids),
+            result["stats"]["total_articles"],
+            int((time.monotonic() - started) * 1000),
+        )
+
+    if due_source_ids:
+        started = time.monotonic()
+        result = tldr_service.scrape_newsletters_in_date_range(today, today, source_ids=due_source_ids)
+        logger.info(
+            "refreshed date=%s sources=%s articles=%s elapsed_ms=%s",
+            today,
+            ",".join(due_source_ids),
+            result["stats"]["total_articles"],
+            int((time.monotonic() - started) * 1000),
+        )
+
+
+def run_daemon(stop_event: threading.Event, *, once: bool = False, rng: random.Random | None = None) -> None:
+    """Run refresh passes until stop_event is set (or after one pass when once=True)."""
+    rng = rng or random.Random()
+    source_ids = tldr_service.get_default_source_ids()
+    intervals = resolve_refresh_intervals(source_ids)
+    jitter_fraction = float(util.resolve_env_var("DAEMON_JITTER_FRACTION", "0.1"))
+    # Spread the first pass over the jitter window as well
+    next_run_at = {
+        source_id: time.monotonic() + rng.uniform(0, jitter_fraction) * min(intervals[source_id], _MAX_IDLE_SECONDS)
+        for source_id in source_ids
+    }
+    logger.info(
+        "daemon start sources=%s jitter=%s intervals_min=%s",
+        len(source_ids),
+        jitter_fraction,
+        {source_id: round(seconds / 60) for source_id, seconds in intervals.items()},
+    )
+
+    while not stop_event.is_set():
+        now = time.monotonic()
+        due_source_ids = [source_id for source_id in source_ids if next_run_at[source_id] <= now or once]
+        try:
+            run_pass(due_source_ids)
+        except Exception as error:
+            logger.error("daemon pass failed error=%s", repr(error), exc_info=True)
+
+        finished = time.monotonic()
+        for source_id in due_source_ids:
+            next_run_at[source_id] = finished + jittered(intervals[source_id], jitter_fraction, rng)
+
+        if once:
+            return
+        idle_seconds = min(max(0.0, min(next_run_at.values()) - time.monotonic()), _MAX_IDLE_SECONDS)
+        stop_event.wait(idle_seconds)
+
+    logger.info("daemon stopped")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m scrape_daemon", description="Keep today's and yesterday's cache warm"
+    )
+    parser.add_argument("--once", action="store_true", help="Run a single pass and exit")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=util.resolve_env_var("LOG_LEVEL", "INFO"),
+        format="%(asctime)s %(levelname)s │ %(name)s %(filename)s:%(lineno)d %(funcName)s │ %(message)s",
+        force=True,
+    )
+
+    stop_event = threading.Event()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signal_number, lambda *_: stop_event.set())
+
+    run_daemon(stop_event, once=args.once)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+Process-wide worker pool shared by every scrape, digest and elaborate request.
+
+Each caller opens a lane (lane()) and submits to it like a concurrent.futures executor.
+SCRAPE_EXECUTOR_WORKERS long-lived threads (default 20) serve all lanes:
+
+- Fairness: workers take the next task from the lanes round-robin, so a wide range
+  scrape cannot starve a request that arrives after it.
+- Per-lane cap: a lane never runs more than its max_active tasks at once
+  (MAX_PARALLEL_SCRAPES for scrapes, 5 for digest and elaborate fetches).
+- Per-host cap: a task submitted with submit_to_host() only starts while fewer than
+  its host's max_concurrency (host_limiter) tasks for that host are running. A
+  saturated host's tasks are deferred and the worker takes the next task in line, so
+  a wide tldr.tech range does not park every worker behind the host limiter while
+  other hosts sit idle.
+- Backpressure: at most SCRAPE_EXECUTOR_MAX_QUEUED tasks (default 4096) wait across
+  all lanes. submit() blocks while the queue is full, and raises DeadlineExceeded if
+  the active scrape deadline passes first.
+
+stats() reports live gauges: queue depth and active workers, overall, per lane and
+per host.
+"""
+
+import collections
+import itertools
+import logging
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+import host_limiter
+import util
+
+
+logger = logging.getLogger("scrape_executor")
+
+
+class ExecutorLane(Executor):
+    """One caller's queue on the shared pool."""
+
+    def __init__(self, pool: "SharedExecutor", name: str, max_active: int):
+        self._pool = pool
+        self.name = name
+        self.max_active = max(1, max_active)
+        self.queue: collections.deque = collections.deque()
+        self.active = 0
+        self.closed = False
+        self.ready = False
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        return self._pool._submit(self, None, fn, args, kwargs)
+
+    def submit_to_host(self, url: str | None, fn, /, *args, **kwargs) -> Future:
+        """Submit a task that fetches from url's host; it waits in the queue while that host is saturated."""
+        return self._pool._submit(self, url, fn, args, kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._pool._shutdown_lane(self, wait, cancel_futures)
+
+
+class _ThreadPoolLane(ThreadPoolExecutor):
+    """ThreadPoolExecutor face of a lane, for loop.set_default_executor(), which only accepts one."""
+
+    def __init__(self, lane: ExecutorLane):
+        super().__init__(max_workers=1)
+        self._lane = lane
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        return self._lane.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._lane.shutdown(wait, cancel_futures=cancel_futures)
+        super().shutdown(wait=False)
+
+
+class SharedExecutor:
+    """Fixed set of worker threads serving lanes round-robin, with a bounded shared queue."""
+
+    def __init__(self, workers: int, max_queued: int):
+        self.workers = max(1, workers)
+        self.max_queued = max(1, max_queued)
+        self._condition = threading.Condition()
+        self._ready_lanes: collections.deque[ExecutorLane] = collections.deque()
+        self._lanes: set[ExecutorLane] = set()
+        # Lanes whose queued tasks all wait for a saturated host; re-offered when a host task ends
+        self._host_blocked_lanes: set[ExecutorLane] = set()
+        self._host_active: collections.Counter[str] = collections.Counter()
+        self._threads: list[threading.Thread] = []
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._backpressure_waits = 0
+        self._thread_ids = itertools.count()
+
+    def lane(self, name: str, max_active: int) -> ExecutorLane:
+        """Open a lane running at most max_active of its tasks at once."""
+        lane = ExecutorLane(self, name, max_active)
+        with self._condition:
+            self._lanes.add(lane)
+        return lane
+
+    def thread_pool_lane(self, name: str, max_active: int) -> ThreadPoolExecutor:
+        """Open a lane wrapped as a ThreadPoolExecutor, for asyncio's default executor."""
+        return _ThreadPoolLane(self.lane(name, max_active))
+
+    def _mark_ready(self, lane: ExecutorLane) -> None:
+        # Caller holds the condition
+        if not lane.ready and lane.queue and lane.active < lane.max_active:
+            lane.ready = True
+            self._ready_lanes.append(lane)
+            self._condition.notify_all()
+
+    def _submit(self, lane: ExecutorLane, url: str | None, fn, args, kwargs) -> Future:
+        future: Future = Future()
+        host = None
+        if url:
+            limiter = host_limiter.get_host_limiter(url)
+            host = (limiter.host, limiter.limit.max_concurrency)
+        with self._condition:
+            if lane.closed:
+                raise RuntimeError("cannot submit to a lane after shutdown")
+            if self._queued >= self.max_queued:
+                self._backpressure_waits += 1
+                while self._queued >= self.max_queued:
+                    remaining = util.remaining_deadline_seconds()
+                    if remaining is not None and remaining <= 0:
+                        raise util.DeadlineExceeded("scrape deadline reached while the executor queue was full")
+                    self._condition.wait(timeout=remaining)
+            lane.queue.append((future, host, fn, args, kwargs))
+            self._queued += 1
+            self._mark_ready(lane)
+            if len(self._threads) < self.workers:
+                self._start_worker()
+        return future
+
+    def _start_worker(self) -> None:
+        thread = threading.Thread(
+            target=self._work, name=f"scrape-worker-{next(self._thread_ids)}", daemon=True
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _take_startable(self, lane: ExecutorLane) -> tuple | None:
+        """Remove and return the lane's first task whose host has room, or None when every one waits for a host."""
+        # Caller holds the condition
+        for index, task in enumerate(lane.queue):
+            host = task[1]
+            if host is None or self._host_active[host[0]] < host[1]:
+                del lane.queue[index]
+                return task
+        return None
+
+    def _unblock_host_lanes(self) -> None:
+        # Caller holds the condition
+        blocked_lanes, self._host_blocked_lanes = self._host_blocked_lanes, set()
+        for lane in blocked_lanes:
+            self._mark_ready(lane)
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._ready_lanes:
+                    self._condition.wait()
+                lane = self._ready_lanes.popleft()
+                lane.ready = False
+                task = self._take_startable(lane)
+                if task is None:
+                    if lane.queue:
+                        self._host_blocked_lanes.add(lane)
+                    # Otherwise its queued futures were cancelled by shutdown(cancel_futures=True)
+                    continue
+                future, host, fn, args, kwargs = task
+                self._queued -= 1
+                self._active += 1
+                lane.active += 1
+                if host is not None:
+                    self._host_active[host[0]] += 1
+                # Back of the line: every other ready lane gets a worker before this one again
+                self._mark_ready(lane)
+                self._condition.notify_all()
+
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as error:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            del task, future, fn, args, kwargs
+
+            with self._condition:
+                self._active -= 1
+                self._completed += 1
+                lane.active -= 1
+                if host is not None:
+                    self._host_active[host[0]] -= 1
+                    self._unblock_host_lanes()
+                self._mark_ready(lane)
+                if lane.closed and not lane.queue and not lane.active:
+                    self._lanes.discard(lane)
+                self._condition.notify_all()
+
+    def _shutdown_lane(self, lane: ExecutorLane, wait: bool, cancel_futures: bool) -> None:
+        with self._condition:
+            lane.closed = True
+            if cancel_futures:
+                while lane.queue:
+                    future, *_ = lane.queue.popleft()
+                    future.cancel()
+                    self._queued -= 1
+                self._condition.notify_all()
+            if wait:
+                while lane.queue or lane.active:
+                    self._condition.wait()
+            if not lane.queue and not lane.active:
+                self._lanes.discard(lane)
+
+    def stats(self) -> dict:
+        """Return live gauges: pool size, queue depth and active workers, overall, per lane and per host."""
+        with self._condition:
+            lanes = [
+                {"name": lane.name, "queued": len(lane.queue), "active": lane.active, "max_active": lane.max_active}
+                for lane in self._lanes
+                if lane.queue or lane.active
+            ]
+            hosts = {host: active for host, active in sorted(self._host_active.items()) if active}
+            return {
+                "workers": self.workers,
+                "threads": len(self._threads),
+                "active": self._active,
+                "queued": self._queued,
+                "max_queued": self.max_queued,
+                "completed": self._completed,
+                "backpressure_waits": self._backpressure_waits,
+                "lanes": sorted(lanes, key=lambda item: item["name"]),
+                "hosts": hosts,
+            }
+
+
+_executor_lock = threading.Lock()
+_executor: SharedExecutor | None = None
+
+
+def get_executor() -> SharedExecutor:
+    """Return the process-wide executor, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = SharedExecutor(
+                workers=int(util.resolve_env_var("SCRAPE_EXECUTOR_WORKERS", "20")),
+                max_queued=int(util.resolve_env_var("SCRAPE_EXECUTOR_MAX_QUEUED", "4096")),
+            )
+            logger.info(
+                "started shared executor workers=%s max_queued=%s", _executor.workers, _executor.max_queued
+            )
+        return _executor
+
+
+def stats() -> dict:
+    """Gauges of the process-wide executor."""
+    return get_executor().stats()
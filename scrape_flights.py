@@ -0,0 +1,210 @@
+"""
+Process-wide single-flight registry for (date, source_id) scrape work items.
+
+When two /api/scrape calls overlap, the first to schedule a (date, source_id) pair
+leads it; later calls attach to the leader's future instead of scraping the pair
+again, and adopt its result filtered by their own excluded URLs.
+
+A caller may only attach when the leader excluded a subset of the URLs the caller
+excludes. Otherwise the leader's result could be missing articles the caller still
+wants, and the caller scrapes the pair itself.
+
+A caller whose whole date came from one leader leaves persisting it to that leader.
+Each flight carries the leader's date_write future, settled True once the leader has
+queued the date's final write and False when it stopped first (cancelled, deadline,
+disconnected client), in which case the caller writes the date itself.
+
+A leader that stops before finishing a pair fails its flight with DeadlineExceeded
+(or ScrapeCancelled). That says nothing about the source, so an attached caller
+that is still running does not adopt it: it re-claims the pair with rescrape() and
+scrapes it under its own deadline and cancel token.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, InvalidStateError
+
+import util
+
+
+logger = logging.getLogger("scrape_flights")
+
+
+class ScrapeFlight:
+    """One in-flight (date, source_id) scrape: its result future, leading run, exclusions and date write."""
+
+    __slots__ = ("future", "run_id", "excluded", "date_write")
+
+    def __init__(self, run_id: object, excluded: frozenset[str], date_write: Future | None = None):
+        self.future: Future = Future()
+        self.run_id = run_id
+        self.excluded = excluded
+        self.date_write = date_write
+
+
+_flights_lock = threading.Lock()
+_flights: dict[tuple[str, str], ScrapeFlight] = {}
+
+
+def claim(
+    flight_key: tuple[str, str], run_id: object, excluded: frozenset[str], date_write: Future | None = None
+) -> tuple[ScrapeFlight, bool]:
+    """Return (flight, is_leader) for flight_key. A new flight carries the leader's date_write.
+
+    >>> first, first_leads = claim(("2026-01-01", "doc"), "run-a", frozenset())
+    >>> second, second_leads = claim(("2026-01-01", "doc"), "run-b", frozenset({"x"}))
+    >>> first_leads, second_leads, first is second
+    (True, False, True)
+    >>> resolve(("2026-01-01", "doc"), first, outcome=("2026-01-01", {}))
+    """
+    with _flights_lock:
+        flight = _flights.get(flight_key)
+        if flight is not None and flight.excluded <= excluded:
+            return flight, False
+        flight = ScrapeFlight(run_id, excluded, date_write)
+        # A flight that could not be shared keeps running; the newest one is offered to later callers
+        _flights[flight_key] = flight
+        return flight, True
+
+
+def resolve(
+    flight_key: tuple[str, str],
+    flight: ScrapeFlight,
+    outcome=None,
+    error: BaseException | None = None,
+) -> None:
+    """Publish the leader's outcome (or error) to attached callers and retire the flight."""
+    with _flights_lock:
+        if _flights.get(flight_key) is flight:
+            del _flights[flight_key]
+    try:
+        if error is not None:
+            flight.future.set_exception(error)
+        else:
+            flight.future.set_result(outcome)
+    except InvalidStateError:
+        pass
+
+
+def withdraw(flight_key: tuple[str, str], flight: ScrapeFlight) -> None:
+    """Stop offering flight to later callers, e.g. because its scrape was cancelled."""
+    with _flights_lock:
+        if _flights.get(flight_key) is flight:
+            del _flights[flight_key]
+
+
+def settle_date_write(date_write: Future, written: bool) -> None:
+    """Tell attached callers whether the leader queued the date's final write.
+
+    >>> date_write = Future()
+    >>> settle_date_write(date_write, False)
+    >>> settle_date_write(date_write, True)
+    >>> date_write.result()
+    False
+    """
+    try:
+        date_write.set_result(written)
+    except InvalidStateError:
+        pass
+
+
+def leader_wrote_date(date_write: Future | None, timeout: float | None) -> bool:
+    """Wait up to timeout for the leader's date_write; False when it gave up or did not answer in time."""
+    if date_write is None:
+        return False
+    try:
+        return date_write.result(timeout=timeout)
+    except TimeoutError:
+        logger.warning("leader did not settle its date write in time; writing the date here")
+        return False
+
+
+def _raise_if_leader_stopped() -> None:
+    # Adapters catch fetch errors, so a cancelled or timed-out scrape can return an
+    # emptied result that looks like success; attached callers must see the stop instead
+    util.raise_if_scrape_stopped()
+
+
+def is_leader_stop(error: BaseException | None) -> bool:
+    """Return True when an attached flight failed only because its leader stopped first.
+
+    >>> is_leader_stop(util.ScrapeCancelled("leading scrape was cancelled")), is_leader_stop(ValueError())
+    (True, False)
+    """
+    return isinstance(error, util.DeadlineExceeded)
+
+
+def rescrape(flight_key: tuple[str, str], run_id: object, excluded: frozenset[str], fn, *args):
+    """Scrape a pair whose leader stopped before finishing it, as the calling scrape.
+
+    Claims the pair again: leads a new flight, or attaches to one another caller
+    already re-claimed. Raises once the calling scrape itself is stopped.
+    """
+    while True:
+        util.raise_if_scrape_stopped()
+        # date_write=None: callers attaching to this flight write their dates themselves
+        flight, is_leader = claim(flight_key, run_id, excluded)
+        if is_leader:
+            logger.info("re-scraping pair whose leader stopped date=%s source=%s", *flight_key)
+            return lead(flight_key, flight, fn, *args)
+        try:
+            return flight.future.result(timeout=util.remaining_deadline_seconds())
+        except util.DeadlineExceeded:
+            continue
+
+
+async def async_rescrape(flight_key: tuple[str, str], run_id: object, excluded: frozenset[str], fn, *args):
+    """Coroutine counterpart of rescrape() for the asyncio scrape engine."""
+    while True:
+        util.raise_if_scrape_stopped()
+        flight, is_leader = claim(flight_key, run_id, excluded)
+        if is_leader:
+            logger.info("re-scraping pair whose leader stopped date=%s source=%s", *flight_key)
+            return await async_lead(flight_key, flight, fn, *args)
+        try:
+            return await asyncio.wrap_future(flight.future)
+        except util.DeadlineExceeded:
+            continue
+
+
+def lead(flight_key: tuple[str, str], flight: ScrapeFlight, fn, *args):
+    """Run fn(*args) as the flight's leader, publishing its outcome to attached callers."""
+    try:
+        outcome = fn(*args)
+        _raise_if_leader_stopped()
+    except BaseException as error:
+        resolve(flight_key, flight, error=error)
+        raise
+    resolve(flight_key, flight, outcome=outcome)
+    return outcome
+
+
+async def async_lead(flight_key: tuple[str, str], flight: ScrapeFlight, fn, *args):
+    """Coroutine counterpart of lead() for the asyncio scrape engine."""
+    try:
+        outcome = await fn(*args)
+        _raise_if_leader_stopped()
+    except asyncio.CancelledError:
+        # The leader's engine was stopped; attached callers must not be cancelled with it
+        resolve(flight_key, flight, error=util.ScrapeCancelled("leading scrape was cancelled"))
+        raise
+    except BaseException as error:
+        resolve(flight_key, flight, error=error)
+        raise
+    resolve(flight_key, flight, outcome=outcome)
+    return outcome
+
+
+def adopt_result(outcome: tuple[str, dict], excluded: frozenset[str]) -> tuple[str, dict]:
+    """Return a copy of a leader's (date_str, result) filtered by the attached caller's exclusions.
+
+    The attached caller made no network request, so network_articles is 0.
+
+    >>> outcome = ("2026-01-01", {"articles": [{"url": "a"}, {"url": "b"}], "network_articles": 2})
+    >>> adopt_result(outcome, frozenset({"a"}))
+    ('2026-01-01', {'articles': [{'url': 'b'}], 'network_articles': 0})
+    """
+    date_str, result = outcome
+    articles = [dict(article) for article in result.get("articles", []) if article.get("url") not in excluded]
+    return date_str, {**result, "articles": articles, "network_articles": 0}
@@ -0,0 +1,142 @@
+"""
+Background revalidations behind /api/scrape's stale-while-revalidate mode.
+
+A mode=swr request answers from cache at once and hands the stale dates to
+start(), which runs the normal scrape on a background thread and records its
+events under an opaque token. Clients read them back with events_after() (poll
+with a cursor) or iter_events() (block and stream until the scrape finishes).
+
+Requests for the same range and sources while a revalidation is still running
+share it and get its token. Finished revalidations stay readable for
+SCRAPE_REVALIDATION_TTL_SECONDS (default 300), then are dropped.
+
+Both the thread and the tokens are local to one long-running process. On
+serverless hosts a function is frozen once its response is sent and the next
+poll may reach another instance, so background revalidation is off there (see
+background_enabled()) and clients stream mode=swr instead, which revalidates
+inside the request.
+"""
+
+import logging
+import os
+import secrets
+import threading
+import time
+
+import util
+
+
+logger = logging.getLogger("scrape_revalidation")
+
+
+class Revalidation:
+    """Events of one background scrape, appended as they arrive."""
+
+    def __init__(self, token: str, key: tuple):
+        self.token = token
+        self.key = key
+        self.events: list[dict] = []
+        self.done = False
+        self.finished_at: float | None = None
+        self.cancel_token = util.CancelToken()
+        self._condition = threading.Condition()
+
+    def append(self, event: dict) -> None:
+        with self._condition:
+            self.events.append(event)
+            self._condition.notify_all()
+
+    def finish(self) -> None:
+        with self._condition:
+            self.done = True
+            self.finished_at = time.monotonic()
+            self._condition.notify_all()
+
+    def events_after(self, cursor: int) -> tuple[list[dict], bool]:
+        """Return (events from index cursor on, whether the revalidation has finished)."""
+        with self._condition:
+            return self.events[max(0, cursor):], self.done
+
+    def iter_events(self, cursor: int = 0, heartbeat_seconds: float = 15.0):
+        """Yield events from cursor on as they arrive, until the revalidation finishes.
+
+        Yields None after heartbeat_seconds without an event, so a streaming response
+        can notice a departed client.
+        """
+        while True:
+            with self._condition:
+                if cursor >= len(self.events) and not self.done:
+                    self._condition.wait(heartbeat_seconds)
+                pending, done = self.events[cursor:], self.done
+            cursor += len(pending)
+            yield from pending
+            if done and not pending:
+                return
+            if not pending:
+                yield None
+
+
+def background_enabled() -> bool:
+    """Return whether a revalidation may keep running after its response is sent.
+
+    SCRAPE_BACKGROUND_REVALIDATION ("1" / "0") decides; by default it is on except on
+    Vercel, which sets VERCEL in every function.
+    """
+    configured = util.resolve_env_var("SCRAPE_BACKGROUND_REVALIDATION", "")
+    if configured:
+        return configured.lower() in ("1", "true", "yes")
+    return not os.getenv("VERCEL")
+
+
+_revalidations_lock = threading.Lock()
+_revalidations: dict[str, Revalidation] = {}
+_running_by_key: dict[tuple, Revalidation] = {}
+
+
+def _prune_finished() -> None:
+    # Caller holds _revalidations_lock
+    ttl_seconds = float(util.resolve_env_var("SCRAPE_REVALIDATION_TTL_SECONDS", "300"))
+    now = time.monotonic()
+    for token, revalidation in list(_revalidations.items()):
+        if revalidation.done and now - revalidation.finished_at > ttl_seconds:
+            del _revalidations[token]
+
+
+def start(key: tuple, run_events) -> tuple[Revalidation, bool]:
+    """Return (revalidation, started) for key, starting run_events(cancel_token) in the background.
+
+    run_events must return an iterator of scrape events. While a revalidation for key is
+    still running it is returned instead (started is False).
+    """
+    with _revalidations_lock:
+        _prune_finished()
+        running = _running_by_key.get(key)
+        if running is not None:
+            return running, False
+        revalidation = Revalidation(secrets.token_urlsafe(16), key)
+        _revalidations[revalidation.token] = revalidation
+        _running_by_key[key] = revalidation
+
+    def run():
+        try:
+            for event in run_events(revalidation.cancel_token):
+                revalidation.append(event)
+        except Exception as error:
+            logger.exception("revalidation failed token=%s error=%s", revalidation.token, error)
+            revalidation.append({"type": "error", "error": str(error)})
+        finally:
+            with _revalidations_lock:
+                if _running_by_key.get(key) is revalidation:
+                    del _running_by_key[key]
+            revalidation.finish()
+
+    threading.Thread(target=run, name=f"scrape-revalidation-{revalidation.token[:8]}", daemon=True).start()
+    return revalidation, True
+
+
+def get(token: str) -> Revalidation | None:
+    """Return the revalidation for token, or None if it is unknown or expired."""
+    with _revalidations_lock:
+        _prune_finished()
+        return _revalidations.get(token)
+
@@ -0,0 +1,89 @@
+"""
+Micro-benchmark for util.canonicalize_url memoization and the canonicalize_urls bulk API.
+
+Builds an exclusion list shaped like the orchestrator's combined_excluded: a month
+of cached article URLs (with the scheme/www/query/trailing-slash variety newsletters
+produce) canonicalized once per stale date. Compares the uncached function, the
+memoized one on a cold and warm cache, and the bulk API, and checks that every
+variant returns identical output.
+
+Usage, from the project root:
+    python scripts/dev/benchmark_canonicalize_url.py
+    python scripts/dev/benchmark_canonicalize_url.py --urls 50000 --dates 31 --repeat 5
+"""
+
+import argparse
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+import util
+
+
+_HOSTS = ["github.com", "www.nytimes.com", "news.ycombinator.com", "Medium.com", "blog.example.dev", "arxiv.org"]
+
+
+def build_urls(count: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    urls = []
+    for index in range(count):
+        host = rng.choice(_HOSTS)
+        scheme = rng.choice(["https://", "http://", ""])
+        path = f"/{rng.choice(['posts', 'item', 'abs', 'p'])}/{index}-{rng.randrange(10**6)}"
+        suffix = rng.choice(["", "/", "?utm_source=tldr", "#comments", "?id=1&ref=newsletter"])
+        urls.append(f"{scheme}{host}{path}{suffix}")
+    return urls
+
+
+def _time(label: str, fn, repeat: int) -> tuple[float, list[str]]:
+    best = float("inf")
+    output: list[str] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = fn()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<28} {best * 1000:9.1f} ms")
+    return best, output
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=30000, help="Distinct cached article URLs")
+    parser.add_argument("--dates", type=int, default=31, help="Stale dates that each re-canonicalize the list")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    urls = build_urls(args.urls)
+    uncached = util.canonicalize_url.__wrapped__
+    print(f"{args.urls} URLs x {args.dates} dates, best of {args.repeat}")
+
+    def run_uncached():
+        for _ in range(args.dates):
+            output = [uncached(url) for url in urls]
+        return output
+
+    def run_memoized_cold():
+        util.canonicalize_url.cache_clear()
+        for _ in range(args.dates):
+            output = [util.canonicalize_url(url) for url in urls]
+        return output
+
+    def run_bulk():
+        for _ in range(args.dates):
+            output = util.canonicalize_urls(urls)
+        return output
+
+    baseline, expected = _time("uncached", run_uncached, args.repeat)
+    memoized, memoized_output = _time("memoized (cold per run)", run_memoized_cold, args.repeat)
+    bulk, bulk_output = _time("bulk (warm)", run_bulk, args.repeat)
+
+    assert memoized_output == expected and bulk_output == expected, "canonicalization output differs"
+    print(f"speedup memoized x{baseline / memoized:.1f}, bulk x{baseline / bulk:.1f}")
+    print(f"cache {util.canonicalize_url.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Parse-time benchmark: feedparser against adapters.feed_stream on recorded feeds.
+
+Pass recorded feed bodies with --feed (e.g. saved with `curl -o danluu.xml
+https://danluu.com/atom.xml`). Without --feed, an RSS and an Atom feed shaped like
+the blog feeds the adapters read (one post a day, newest first, HTML bodies) are
+generated. For each feed it times feedparser.parse, a full streaming parse, and a
+streaming parse stopped at --since-days before the newest entry, and checks that
+the streaming parser returns the same links and UTC dates as feedparser.
+
+Usage, from the project root:
+    python scripts/dev/benchmark_feed_parser.py
+    python scripts/dev/benchmark_feed_parser.py --feed danluu.xml --feed lucumr.atom --since-days 3
+"""
+
+import argparse
+import calendar
+import pathlib
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import feedparser
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from adapters import feed_stream
+
+
+_BODY = "<p>" + "Paragraph with <a href=\"https://example.com/ref\">a link</a> and some &amp; text. " * 40 + "</p>"
+
+
+def build_rss(entries: int, newest: datetime) -> bytes:
+    items = "".join(
+        f"""<item><title>Post {index}</title><link>https://blog.example.dev/posts/{index}</link>
+<pubDate>{(newest - timedelta(days=index)).strftime("%a, %d %b %Y %H:%M:%S +0000")}</pubDate>
+<category>engineering</category><description><![CDATA[{_BODY}]]></description>
+<content:encoded><![CDATA[{_BODY * 3}]]></content:encoded></item>"""
+        for index in range(entries)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><rss version="2.0" '
+        'xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel><title>Recorded RSS</title>'
+        f"{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+def build_atom(entries: int, newest: datetime) -> bytes:
+    items = "".join(
+        f"""<entry><title>Post {index}</title><link href="https://blog.example.dev/{index}/" rel="alternate"/>
+<id>tag:blog.example.dev,{index}</id><published>{(newest - timedelta(days=index)).isoformat()}</published>
+<updated>{(newest - timedelta(days=index)).isoformat()}</updated><category term="python"/>
+<summary type="html">{_BODY.replace("&amp;", "and").replace("<", "&lt;")}</summary>
+<content type="html">{(_BODY * 3).replace("&amp;", "and").replace("<", "&lt;")}</content></entry>"""
+        for index in range(entries)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>Recorded Atom</title>{items}</feed>"
+    ).encode("utf-8")
+
+
+def _time(label: str, fn, repeat: int) -> tuple[float, object]:
+    best = float("inf")
+    output = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = fn()
+        best = min(best, time.perf_counter() - started)
+    print(f"  {label:<28} {best * 1000:9.2f} ms")
+    return best, output
+
+
+def _feedparser_keys(parsed) -> list[tuple[str, str]]:
+    keys = []
+    for entry in parsed.entries:
+        struct = entry.get("published_parsed") or entry.get("updated_parsed")
+        if struct:
+            published = datetime.fromtimestamp(calendar.timegm(struct), timezone.utc)
+            keys.append((entry.get("link", ""), published.strftime("%Y-%m-%d")))
+    return keys
+
+
+def _stream_keys(entries: list[feed_stream.FeedEntry]) -> list[tuple[str, str]]:
+    return [(entry.link, feed_stream.utc_date_str(entry.published)) for entry in entries if entry.published]
+
+
+def benchmark(name: str, body: bytes, since_days: int, repeat: int) -> None:
+    print(f"{name}: {len(body) / 1024:.0f} KiB")
+    baseline, parsed = _time("feedparser.parse", lambda: feedparser.parse(body), repeat)
+    full, entries = _time("feed_stream (full)", lambda: list(feed_stream.iter_feed_entries(body)), repeat)
+    assert _stream_keys(entries) == _feedparser_keys(parsed), f"{name}: entries differ from feedparser"
+
+    newest = max((entry.published for entry in entries if entry.published), default=None)
+    if newest is None:
+        return
+    since = (newest - timedelta(days=since_days)).date()
+    windowed, recent = _time(
+        f"feed_stream (since -{since_days}d)",
+        lambda: list(feed_stream.iter_feed_entries(body, since=since)),
+        repeat,
+    )
+    print(
+        f"  {len(entries)} entries, {len(recent)} in window; "
+        f"speedup full x{baseline / full:.1f}, windowed x{baseline / windowed:.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--feed", action="append", default=[], help="Recorded feed body; repeatable")
+    parser.add_argument("--entries", type=int, default=200, help="Entries per generated feed")
+    parser.add_argument("--since-days", type=int, default=2, help="Window before the newest entry")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.feed:
+        feeds = [(path, pathlib.Path(path).read_bytes()) for path in args.feed]
+    else:
+        newest = datetime(2026, 3, 4, 9, 30, tzinfo=timezone.utc)
+        feeds = [("generated rss", build_rss(args.entries, newest)), ("generated atom", build_atom(args.entries, newest))]
+
+    for name, body in feeds:
+        benchmark(name, body, args.since_days, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark the threaded and asyncio scrape engines on a live scrape.
+
+Runs scrape_newsletters_in_date_range once per engine over the same date range
+and sources (default: the last 31 days, all sources). Storage reads return no
+cache and writes are discarded, so every run hits the network the same way. Each
+run gets its own empty conditional-GET store so neither engine benefits from the
+other's validators.
+
+Usage, from the project root:
+    python scripts/dev/benchmark_scrape_engines.py
+    python scripts/dev/benchmark_scrape_engines.py --days 7 --sources tldr_tech hackernews
+    python scripts/dev/benchmark_scrape_engines.py --engines asyncio --repeat 3
+"""
+
+import argparse
+import datetime as dt
+import logging
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+import storage_service
+import tldr_service
+import util
+
+
+def _disable_storage():
+    storage_service.get_daily_payloads_range = lambda start_date, end_date: []
+    storage_service.set_daily_payload_from_scrape = lambda date_text, payload: None
+    storage_service.filter_new_urls_for_history_dedup = (
+        lambda source_id, first_seen_date, canonical_urls: set(canonical_urls)
+    )
+
+
+def run_once(engine: str, start_date: str, end_date: str, source_ids: list[str] | None) -> dict:
+    os.environ["SCRAPE_ENGINE"] = engine
+    with tempfile.TemporaryDirectory() as store_dir:
+        os.environ["HTTP_VALIDATOR_STORE_PATH"] = str(pathlib.Path(store_dir) / "validators.sqlite3")
+        started = time.perf_counter()
+        result = tldr_service.scrape_newsletters_in_date_range(start_date, end_date, source_ids=source_ids)
+        elapsed = time.perf_counter() - started
+    return {
+        "engine": engine,
+        "seconds": round(elapsed, 2),
+        "articles": result["stats"]["total_articles"],
+        "fetch_cache_hits": result["stats"]["fetch_cache"]["hits"],
+        "host_wait_ms": round(sum(entry["wait_ms_total"] for entry in result["stats"]["host_waits"].values())),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=31, help="Range length ending yesterday (max 31)")
+    parser.add_argument("--sources", nargs="*", help="Source IDs (default: all)")
+    parser.add_argument("--engines", nargs="*", default=["threads", "asyncio"], choices=["threads", "asyncio"])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=util.resolve_env_var("LOG_LEVEL", "WARNING"))
+    _disable_storage()
+
+    end = dt.datetime.now(util.PACIFIC_TZ).date() - dt.timedelta(days=1)
+    start = end - dt.timedelta(days=min(args.days, 31) - 1)
+    print(f"range={start}..{end} sources={args.sources or 'all'}")
+
+    for _ in range(args.repeat):
+        for engine in args.engines:
+            row = run_once(engine, start.isoformat(), end.isoformat(), args.sources)
+            print(
+                f"{row['engine']:>8}  {row['seconds']:>7}s  articles={row['articles']}"
+                f"  fetch_cache_hits={row['fetch_cache_hits']}  host_wait_ms={row['host_wait_ms']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,23 @@
 TLDR Newsletter Scraper backend with a proxy.
 """
 
+import contextlib
 import datetime
 import importlib
+import json
 import logging
 import os
 import pathlib
+import select
+import socket
 import sys
+import threading
 
-from flask import Flask, Response, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
 import requests
 
 import podcast_service
+import scrape_executor
 import util
 import tldr_app
 import storage_service
@@ -124,9 +130,224 @@ def index():
 
 
 
+_SCRAPE_STREAM_MIMETYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+def _resolve_scrape_stream_format(stream_value) -> str | None:
+    """Map the request's "stream" field to a stream format, or None for a single JSON response.
+
+    >>> _resolve_scrape_stream_format(True), _resolve_scrape_stream_format("sse"), _resolve_scrape_stream_format(None)
+    ('ndjson', 'sse', None)
+    """
+    if stream_value in (None, False):
+        return None
+    if stream_value is True:
+        return "ndjson"
+    if stream_value in _SCRAPE_STREAM_MIMETYPES:
+        return stream_value
+    raise ValueError(f"stream must be one of: {', '.join(_SCRAPE_STREAM_MIMETYPES)}")
+
+
+def _encode_scrape_events(events, stream_format: str):
+    """Serialize scrape events as NDJSON lines or SSE messages. Failures become a final error record.
+
+    When the client disconnects the server closes this generator, which closes events and
+    so cancels the scrape's remaining work.
+    """
+    try:
+        for event in events:
+            yield _encode_scrape_event(event, stream_format)
+    except Exception as error:
+        logger.exception("Failed to stream scrape: %s", error)
+        yield _encode_scrape_event({"type": "error", "error": str(error)}, stream_format)
+    finally:
+        events.close()
+
+
+def _encode_scrape_event(event: dict, stream_format: str) -> str:
+    encoded = json.dumps(event)
+    if stream_format == "sse":
+        return f"event: {event['type']}\ndata: {encoded}\n\n"
+    return f"{encoded}\n"
+
+
+def _resolve_scrape_deadline_ms(deadline_value) -> int | None:
+    """Validate the optional deadline_ms body field.
+
+    >>> _resolve_scrape_deadline_ms(None) is None
+    True
+    >>> _resolve_scrape_deadline_ms(2500)
+    2500
+    >>> _resolve_scrape_deadline_ms(0)
+    Traceback (most recent call last):
+    ...
+    ValueError: deadline_ms must be a positive integer
+    """
+    if deadline_value is None:
+        return None
+    if isinstance(deadline_value, bool) or not isinstance(deadline_value, int) or deadline_value <= 0:
+        raise ValueError("deadline_ms must be a positive integer")
+    return deadline_value
+
+
+def _resolve_scrape_supersede_key(supersede_value) -> str | None:
+    """Validate the optional supersede_key body field.
+
+    >>> _resolve_scrape_supersede_key("tab-1"), _resolve_scrape_supersede_key(None)
+    ('tab-1', None)
+    >>> _resolve_scrape_supersede_key(7)
+    Traceback (most recent call last):
+    ...
+    ValueError: supersede_key must be a non-empty string
+    """
+    if supersede_value is None:
+        return None
+    if not isinstance(supersede_value, str) or not supersede_value:
+        raise ValueError("supersede_key must be a non-empty string")
+    return supersede_value
+
+
+_SCRAPE_MODES = ("live", "swr")
+
+
+def _resolve_scrape_mode(mode_value) -> str:
+    """Validate the optional mode body field: "live" (default) or "swr" (stale-while-revalidate).
+
+    >>> _resolve_scrape_mode(None), _resolve_scrape_mode("swr")
+    ('live', 'swr')
+    >>> _resolve_scrape_mode("eventually")
+    Traceback (most recent call last):
+    ...
+    ValueError: mode must be one of: live, swr
+    """
+    if mode_value is None:
+        return "live"
+    if mode_value not in _SCRAPE_MODES:
+        raise ValueError(f"mode must be one of: {', '.join(_SCRAPE_MODES)}")
+    return mode_value
+
+
+def _resolve_excluded_urls(excluded_value) -> list[str]:
+    """Validate a list of canonical URLs to exclude.
+
+    >>> _resolve_excluded_urls(None), _resolve_excluded_urls(["a.com/1"])
+    ([], ['a.com/1'])
+    >>> _resolve_excluded_urls("a.com/1")
+    Traceback (most recent call last):
+    ...
+    ValueError: excluded_urls must be an array of URLs
+    """
+    if excluded_value is None:
+        return []
+    if not isinstance(excluded_value, list) or not all(isinstance(url, str) for url in excluded_value):
+        raise ValueError("excluded_urls must be an array of URLs")
+    return excluded_value
+
+
+def _resolve_exclusion_set_id(set_id_value) -> str | None:
+    """Validate the optional exclusion_set_id body field.
+
+    >>> _resolve_exclusion_set_id(None)
+    >>> _resolve_exclusion_set_id(42)
+    Traceback (most recent call last):
+    ...
+    ValueError: exclusion_set_id must be a non-empty string
+    """
+    if set_id_value is None:
+        return None
+    if not isinstance(set_id_value, str) or not set_id_value:
+        raise ValueError("exclusion_set_id must be a non-empty string")
+    return set_id_value
+
+
+def _resolve_revalidation_cursor(cursor_value) -> int:
+    """Parse the cursor query parameter of a revalidation poll.
+
+    >>> _resolve_revalidation_cursor(None), _resolve_revalidation_cursor("3")
+    (0, 3)
+    """
+    if cursor_value is None:
+        return 0
+    try:
+        cursor = int(cursor_value)
+    except ValueError:
+        cursor = -1
+    if cursor < 0:
+        raise ValueError("cursor must be a non-negative integer")
+    return cursor
+
+
+def _client_disconnected(client_socket) -> bool:
+    """Return True once the peer has closed client_socket, without consuming pending bytes."""
+    try:
+        readable, _, _ = select.select([client_socket], [], [], 0)
+        if not readable:
+            return False
+        return client_socket.recv(1, socket.MSG_PEEK) == b""
+    except ValueError:
+        # TLS sockets cannot peek; assume the client is still there
+        return False
+    except OSError:
+        return True
+
+
+@contextlib.contextmanager
+def _cancel_on_client_disconnect(cancel_token: util.CancelToken, poll_seconds: float = 0.5):
+    """Cancel cancel_token if the client of the current request disconnects inside this block.
+
+    Only works when the WSGI server exposes the client socket (gunicorn, werkzeug);
+    elsewhere the scrape simply runs to completion.
+    """
+    client_socket = request.environ.get("gunicorn.socket") or request.environ.get("werkzeug.socket")
+    if client_socket is None:
+        yield
+        return
+
+    finished = threading.Event()
+
+    def watch():
+        while not finished.wait(poll_seconds):
+            if _client_disconnected(client_socket):
+                cancel_token.cancel("client_disconnected")
+                return
+
+    threading.Thread(target=watch, name="scrape-disconnect-watch", daemon=True).start()
+    try:
+        yield
+    finally:
+        finished.set()
+
+
 @app.route("/api/scrape", methods=["POST"])
 def scrape_newsletters_in_date_range():
-    """Backend proxy to scrape newsletters. Expects start_date, end_date, excluded_urls, and optionally sources in the request body."""
+    """Backend proxy to scrape newsletters. Expects start_date, end_date, excluded_urls, and optionally sources in the request body.
+
+    With "stream": "ndjson" (or true) or "sse", per-date payloads are streamed as they complete:
+    one {"type": "payload", ...} record per date, then a final {"type": "stats", ...} record.
+
+    With "deadline_ms", the response is sent once the budget runs out even if some sources are
+    still running; those (date, source) pairs are listed in stats.unfinished.
+
+    Remaining work is cancelled when the client disconnects, or when a newer scrape arrives
+    with the same "supersede_key" (e.g. one per browser tab); stats.cancelled says why.
+
+    "priority" ({"dates": "newest" | "oldest" | "none", "sources": [...]}) sets the dispatch
+    order; by default the newest dates go first. stats.timing reports time to first results.
+
+    With "mode": "swr" the cached payloads come first, with stats.cache_age_seconds and
+    stats.stale_dates. Streamed, the stale dates are then refreshed within the same response.
+    As plain JSON they are refreshed in the background and read back from
+    /api/scrape/revalidation/<revalidation_token>; that needs a long-running server and is
+    off on Vercel (SCRAPE_BACKGROUND_REVALIDATION). The background refresh outlives the
+    request, so "deadline_ms" and "supersede_key" answer 400 with JSON swr.
+
+    "exclusion_set_id" references a set stored with POST /api/exclusion-sets; its URLs are
+    excluded together with any inline excluded_urls. An unknown id answers 404, and the
+    client should upload the set again.
+    """
     try:
         data = request.get_json(silent=True)
         if data is None:
@@ -142,16 +363,84 @@ def scrape_newsletters_in_date_range():
                 400,
             )
 
-        result = tldr_app.scrape_newsletters(
+        stream_format = _resolve_scrape_stream_format(data.get("stream"))
+        deadline_ms = _resolve_scrape_deadline_ms(data.get("deadline_ms"))
+        supersede_key = _resolve_scrape_supersede_key(data.get("supersede_key"))
+        excluded_urls = tldr_app.resolve_excluded_urls(
+            _resolve_excluded_urls(data.get("excluded_urls")),
+            _resolve_exclusion_set_id(data.get("exclusion_set_id")),
+        )
+        if _resolve_scrape_mode(data.get("mode")) == "swr":
+            if stream_format is not None:
+                events = tldr_app.iter_scrape_newsletters_stale_while_revalidate(
+                    data.get("start_date"),
+                    data.get("end_date"),
+                    source_ids=sources,
+                    excluded_urls=excluded_urls,
+                    deadline_ms=deadline_ms,
+                    supersede_key=supersede_key,
+                    priority=data.get("priority"),
+                )
+                return Response(
+                    stream_with_context(_encode_scrape_events(events, stream_format)),
+                    mimetype=_SCRAPE_STREAM_MIMETYPES[stream_format],
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+                )
+            if deadline_ms is not None or supersede_key is not None:
+                # The JSON form revalidates in the background, shared by every request for the
+                # same range, so one request's budget or tab key cannot bound or cancel it
+                return (
+                    jsonify(
+                        {
+                            "success": False,
+                            "error": "deadline_ms and supersede_key need a stream with mode swr",
+                        }
+                    ),
+                    400,
+                )
+            return jsonify(
+                tldr_app.scrape_newsletters_stale_while_revalidate(
+                    data.get("start_date"),
+                    data.get("end_date"),
+                    source_ids=sources,
+                    excluded_urls=excluded_urls,
+                    priority=data.get("priority"),
+                )
+            )
+        if stream_format is None:
+            cancel_token = util.CancelToken()
+            with _cancel_on_client_disconnect(cancel_token):
+                result = tldr_app.scrape_newsletters(
+                    data.get("start_date"),
+                    data.get("end_date"),
+                    source_ids=sources,
+                    excluded_urls=excluded_urls,
+                    deadline_ms=deadline_ms,
+                    cancel_token=cancel_token,
+                    supersede_key=supersede_key,
+                    priority=data.get("priority"),
+                )
+            return jsonify(result)
+
+        events = tldr_app.iter_scrape_newsletters(
             data.get("start_date"),
             data.get("end_date"),
             source_ids=sources,
-            excluded_urls=data.get("excluded_urls", []),
+            excluded_urls=excluded_urls,
+            deadline_ms=deadline_ms,
+            supersede_key=supersede_key,
+            priority=data.get("priority"),
+        )
+        return Response(
+            stream_with_context(_encode_scrape_events(events, stream_format)),
+            mimetype=_SCRAPE_STREAM_MIMETYPES[stream_format],
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
-        return jsonify(result)
 
     except ValueError as error:
         return jsonify({"success": False, "error": str(error)}), 400
+    except tldr_app.UnknownExclusionSet as error:
+        return jsonify({"success": False, "error": f"Unknown exclusion_set_id {error}"}), 404
     except Exception as error:
         logger.exception(
             "Failed to scrape newsletters: %s",
@@ -159,6 +448,53 @@ def scrape_newsletters_in_date_range():
         )
         return jsonify({"success": False, "error": str(error)}), 500
 
+@app.route("/api/exclusion-sets", methods=["POST"])
+def create_exclusion_set():
+    """Store a set of canonical URLs to exclude from later scrapes. Expects "urls".
+
+    Returns its exclusion_set_id (the SHA-256 of the sorted, de-duplicated URLs joined by
+    newlines) for /api/scrape. Uploading the same set again returns the same id.
+    """
+    data = request.get_json(silent=True)
+    if data is None:
+        return jsonify({"success": False, "error": "No JSON data received"}), 400
+    urls = data.get("urls")
+    if not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+        return jsonify({"success": False, "error": "urls must be an array of URLs"}), 400
+    return jsonify(tldr_app.create_exclusion_set(urls))
+
+
+@app.route("/api/scrape/revalidation/<token>", methods=["GET"])
+def get_scrape_revalidation(token):
+    """Read a mode=swr background revalidation.
+
+    Poll with ?cursor=N: returns the events from index N on, the next cursor, and whether
+    the revalidation is done. With ?stream=ndjson or ?stream=sse, subscribe instead: events
+    from the cursor on are streamed as they arrive, with heartbeat records while idle.
+    """
+    try:
+        revalidation = tldr_app.get_scrape_revalidation(token)
+        if revalidation is None:
+            return jsonify({"success": False, "error": "Unknown or expired revalidation token"}), 404
+
+        cursor = _resolve_revalidation_cursor(request.args.get("cursor"))
+        stream_format = _resolve_scrape_stream_format(request.args.get("stream"))
+        if stream_format is None:
+            events, done = revalidation.events_after(cursor)
+            return jsonify({"success": True, "events": events, "cursor": cursor + len(events), "done": done})
+
+        events = (
+            {"type": "heartbeat"} if event is None else event for event in revalidation.iter_events(cursor)
+        )
+        return Response(
+            stream_with_context(_encode_scrape_events(events, stream_format)),
+            mimetype=_SCRAPE_STREAM_MIMETYPES[stream_format],
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+    except ValueError as error:
+        return jsonify({"success": False, "error": str(error)}), 400
+
+
 @app.route("/api/summarize-url", methods=["POST"])
 def summarize_url_endpoint(model: str = DEFAULT_MODEL):
     """Create a summary of the content at a URL.
@@ -622,6 +958,16 @@ def debug_supabase_url():
         return jsonify({"success": False, "error": repr(error)}), 500
 
 
+@app.route("/api/debug/executor", methods=["GET"])
+def debug_executor():
+    """Return live gauges of the shared scrape executor: queue depth and active workers per lane."""
+    try:
+        return jsonify({"success": True, "executor": scrape_executor.stats()})
+    except Exception as error:
+        logger.exception("debug_executor failed: %s", error)
+        return jsonify({"success": False, "error": repr(error)}), 500
+
+
 @app.route("/api/debug/clear-daily-cache", methods=["POST"])
 def debug_clear_daily_cache():
     """Delete daily_cache rows in [start_date, end_date]. Manual-test setup helper."""
@@ -129,6 +129,29 @@ def get_daily_payloads_range(start_date, end_date):
         for row in result.data
     ]
 
+def get_source_meta_range(start_date, end_date):
+    """
+    Get only each cached date's sourceMeta in date range (inclusive).
+
+    Selects payload->sourceMeta server-side, so readers that only need per-source
+    scrape bookkeeping do not download article payloads.
+
+    >>> get_source_meta_range('2025-11-07', '2025-11-09')
+    [{'date': '2025-11-09', 'sourceMeta': {'tldr_tech': {...}}}, ...]
+    """
+    supabase = supabase_client.get_supabase_client()
+    result = supabase.table('daily_cache') \
+        .select('date, source_meta:payload->sourceMeta') \
+        .gte('date', start_date) \
+        .lte('date', end_date) \
+        .order('date', desc=True) \
+        .execute()
+
+    return [
+        {'date': row['date'], 'sourceMeta': row.get('source_meta') or {}}
+        for row in result.data
+    ]
+
 def delete_daily_payloads_range(start_date, end_date):
     """Delete cached daily payloads in [start_date, end_date]. Returns deleted row count."""
     supabase = supabase_client.get_supabase_client()
@@ -276,6 +299,40 @@ def set_digest(
         )
 
 
+def get_exclusion_set(set_id: str) -> list[str] | None:
+    """Return the URLs of a stored exclusion set, or None on miss or error."""
+    try:
+        supabase = supabase_client.get_supabase_client()
+        result = supabase.table('exclusion_sets').select('urls').eq('set_id', set_id).execute()
+        return result.data[0]['urls'] if result.data else None
+    except Exception as error:
+        logger.warning(
+            "get_exclusion_set failed; treating as miss set_id_prefix=%s error=%s",
+            set_id[:12],
+            repr(error),
+        )
+        return None
+
+
+def set_exclusion_set(set_id: str, urls: list[str]) -> bool:
+    """Persist an exclusion set (upsert). Returns False when it could not be stored."""
+    try:
+        supabase = supabase_client.get_supabase_client()
+        supabase.table('exclusion_sets').upsert({
+            'set_id': set_id,
+            'urls': urls,
+            'url_count': len(urls),
+        }).execute()
+        return True
+    except Exception as error:
+        logger.warning(
+            "set_exclusion_set failed; set only held in memory set_id_prefix=%s error=%s",
+            set_id[:12],
+            repr(error),
+        )
+        return False
+
+
 def get_podcast_episode(canonical_url: str) -> str | None:
     """Return cached base64-encoded mp3 for canonical_url, or None on miss."""
     supabase = supabase_client.get_supabase_client()
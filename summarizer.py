@@ -6,10 +6,11 @@ from requests.models import Response
 from typing import Optional
 
 import requests
-from curl_cffi import requests as curl_requests
 import html2text
 from bs4 import BeautifulSoup
 
+import fetch_cache
+import http_sessions
 import util
 import urllib.parse as urlparse
 
@@ -96,7 +97,7 @@ def _build_jina_reader_url(url: str) -> str:
 def _scrape_with_curl_cffi(
     url: str, *, timeout: int = 10, allow_redirects: bool = True
 ) -> requests.Response:
-    response = curl_requests.get(
+    response = http_sessions.curl_get(
         url,
         impersonate="chrome131",
         timeout=timeout,
@@ -120,7 +121,7 @@ def _scrape_with_jina_reader(url: str, *, timeout: int) -> requests.Response:
     logger.info(
         f"Scraping with Jina reader url={url}",
     )
-    response = requests.get(
+    response = http_sessions.get_requests_session().get(
         reader_url,
         timeout=timeout,
         headers={"User-Agent": "Mozilla/5.0 (compatible; TLDR-Newsletter/1.0)"},
@@ -144,7 +145,7 @@ def _scrape_with_firecrawl(url: str, *, timeout: int) -> requests.Response:
         f"Scraping with Firecrawl url={url}",
     )
 
-    response = requests.post(
+    response = http_sessions.get_requests_session().post(
         "https://api.firecrawl.dev/v1/scrape",
         headers={
             "Authorization": f"Bearer {api_key}",
@@ -190,6 +191,25 @@ def _scrape_with_firecrawl(url: str, *, timeout: int) -> requests.Response:
 
 @util.retry()
 def scrape_url(url: str, *, timeout: int = 10) -> Response:
+    """Scrape url through the curl_cffi → Jina → Firecrawl cascade.
+
+    Inside a fetch_cache.scrape_scope(), concurrent and repeated scrapes of the same
+    URL share one cascade run. Inside a util.deadline_scope(), each attempt's timeout
+    is cut to the time left, and the cascade raises DeadlineExceeded instead of
+    starting another fallback once the deadline has passed. A util.cancel_scope()
+    token is checked between attempts the same way, raising ScrapeCancelled.
+    """
+    active_fetch_cache = fetch_cache.get_active_fetch_cache()
+    if active_fetch_cache is None:
+        return _scrape_url_with_fallbacks(url, timeout=timeout)
+
+    return active_fetch_cache.get_or_fetch(
+        fetch_cache.build_fetch_key("scrape_url", url),
+        lambda: _scrape_url_with_fallbacks(url, timeout=timeout),
+    )
+
+
+def _scrape_url_with_fallbacks(url: str, *, timeout: int) -> Response:
     scraping_methods = [
         ("curl_cffi", _scrape_with_curl_cffi),
         ("jina_reader", _scrape_with_jina_reader),
@@ -204,9 +224,10 @@ def scrape_url(url: str, *, timeout: int = 10) -> Response:
     errors = []
 
     for name, scrape in scraping_methods:
+        # Use extended timeout for Firecrawl since it does full browser rendering,
+        # clamped so a fallback never outlives the active scrape
+        method_timeout = util.clamp_timeout_to_deadline(60 if name == "firecrawl" else timeout)
         try:
-            # Use extended timeout for Firecrawl since it does full browser rendering
-            method_timeout = 60 if name == "firecrawl" else timeout
             result = scrape(url, timeout=method_timeout)
             # Only log intermediate failures if all methods fail
             if errors:
@@ -214,6 +235,10 @@ def scrape_url(url: str, *, timeout: int = 10) -> Response:
                     f"{name} succeeded after {len(errors)} failed attempts for url={url}",
                 )
             return result
+        except util.DeadlineExceeded:
+            # The scrape was cancelled or ran out of time mid-attempt; that is not a
+            # reason to try the next method
+            raise
         except requests.HTTPError as status_error:
             last_status_error = status_error
             errors.append(f"{name}: {status_error}")
@@ -255,9 +280,9 @@ def _fetch_github_readme(url: str) -> str:
     }
 
     try:
-        response = requests.get(
+        response = http_sessions.get_requests_session().get(
             raw_url,
-            timeout=10,
+            timeout=util.clamp_timeout_to_deadline(10),
             headers=auth_headers,
         )
         response.raise_for_status()
@@ -274,9 +299,9 @@ def _fetch_github_readme(url: str) -> str:
                 f"Main branch not found, trying master: {master_url}",
             )
             try:
-                response = requests.get(
+                response = http_sessions.get_requests_session().get(
                     master_url,
-                    timeout=10,
+                    timeout=util.clamp_timeout_to_deadline(10),
                     headers=auth_headers,
                 )
                 response.raise_for_status()
@@ -300,7 +325,10 @@ def _fetch_github_readme(url: str) -> str:
 
 
 def url_to_markdown(url: str) -> str:
-    """Fetch URL and convert to markdown. For GitHub repos, fetches README.md."""
+    """Fetch URL and convert to markdown. For GitHub repos, fetches README.md.
+
+    Every request is bounded by the active util.deadline_scope(), like util.fetch.
+    """
     logger.info(
         f"Fetching and converting to markdown {url}",
     )
@@ -421,7 +449,7 @@ def _fetch_prompt(
     if token:
         headers["Authorization"] = f"token {token}"
 
-    response = requests.get(url, headers=headers, timeout=10)
+    response = http_sessions.get_requests_session().get(url, headers=headers, timeout=10)
 
     if response.status_code == 200:
         globals()[cache_attr] = response.text
@@ -443,7 +471,7 @@ def _fetch_prompt(
             "Accept": "application/vnd.github.v3.raw",
             "User-Agent": "Mozilla/5.0 (compatible; TLDR-Newsletter/1.0)",
         }
-        response_no_auth = requests.get(url, headers=headers_no_auth, timeout=10)
+        response_no_auth = http_sessions.get_requests_session().get(url, headers=headers_no_auth, timeout=10)
         if response_no_auth.status_code == 200:
             globals()[cache_attr] = response_no_auth.text
             return response_no_auth.text
@@ -557,7 +585,7 @@ def _call_llm_via_openrouter(prompt: str, model: str, thinking_effort: str) -> s
     effort = normalize_summarize_effort(thinking_effort)
     openrouter_effort = "low" if effort == "minimal" else effort
 
-    resp = requests.post(
+    resp = http_sessions.get_requests_session().post(
         f"{OPENROUTER_BASE_URL}/chat/completions",
         headers={
             "Authorization": f"Bearer {api_key}",
@@ -602,7 +630,7 @@ def _call_llm(prompt: str, thinking_effort: str = DEFAULT_THINKING_EFFORT, model
     }
 
     try:
-        resp = requests.post(url, headers=headers, data=json.dumps(body), timeout=600)
+        resp = http_sessions.get_requests_session().post(url, headers=headers, data=json.dumps(body), timeout=600)
         resp.raise_for_status()
         data = resp.json()
     except requests.exceptions.ConnectionError as e:
@@ -0,0 +1,37 @@
+import pytest
+
+import newsletter_scraper
+from newsletter_config import NEWSLETTER_CONFIGS
+
+
+@pytest.fixture(autouse=True)
+def _isolated_missing_issue_store(monkeypatch, tmp_path):
+    """Keep misses recorded on this machine from dropping work items in tests."""
+    monkeypatch.setenv("MISSING_ISSUE_STORE_PATH", str(tmp_path / "missing-issues.sqlite3"))
+
+
+@pytest.fixture(autouse=True)
+def _closed_source_breakers():
+    """Start every test with closed breakers; they are shared process-wide."""
+    newsletter_scraper.reset_source_health()
+    yield
+    newsletter_scraper.reset_source_health()
+
+
+@pytest.fixture(autouse=True)
+def _unrestricted_publish_calendar(monkeypatch):
+    """Scrape every source on every date unless a test opts into publish-calendar rules.
+
+    Orchestration tests use registered sources as stand-ins on arbitrary dates, and fake
+    daily_cache rows must not be learned as cadence.
+    """
+    monkeypatch.setenv("PUBLISH_CALENDAR_LOOKBACK_DAYS", "0")
+    for config in NEWSLETTER_CONFIGS.values():
+        monkeypatch.setattr(config, "publish_weekdays", None)
+
+
+@pytest.fixture(autouse=True)
+def _listing_pages_without_sitemaps(monkeypatch):
+    """Keep listing-page adapters off the network for sitemap discovery unless a test opts in."""
+    for config in NEWSLETTER_CONFIGS.values():
+        monkeypatch.setattr(config, "sitemap_url", None)
@@ -8,6 +8,7 @@ from werkzeug.serving import make_server
 import serve
 import storage_service
 import tldr_service
+import util
 
 
 def _build_payload(date_text, *, url, title, tldr_status="unknown", removed=False, is_read=False):
@@ -315,6 +316,61 @@ def test_scrape_unions_stale_cache_with_new_articles(monkeypatch):
     assert new_article["tldr"]["status"] == "unknown"
 
 
+def test_scrape_stream_emits_cached_dates_first_then_live_dates_then_stats(monkeypatch):
+    import json
+    from datetime import datetime, timezone
+    store, cached_at_store = _stub_storage(monkeypatch)
+    cached_date = (date_type.today() - timedelta(days=3)).isoformat()
+    live_date = (date_type.today() - timedelta(days=2)).isoformat()
+    store[cached_date] = _build_payload(cached_date, url="https://example.com/cached", title="Cached")
+    cached_at_store[cached_date] = (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
+
+    def scrape_stub(date_value, source_id, _excluded):
+        date_text = util.format_date_for_url(date_value)
+        return (
+            date_text,
+            {
+                "articles": [
+                    {
+                        "url": f"https://example.com/{date_text}",
+                        "title": "Live",
+                        "article_meta": "",
+                        "date": date_text,
+                        "category": "Newsletter",
+                        "source_id": source_id,
+                    }
+                ],
+                "network_articles": 1,
+                "error": None,
+                "source_id": source_id,
+            },
+        )
+
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech"])
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+
+    server, thread = _start_server()
+    try:
+        response = requests.post(
+            f"http://127.0.0.1:{server.server_port}/api/scrape",
+            json={"start_date": cached_date, "end_date": live_date, "stream": "ndjson"},
+            timeout=5,
+        )
+        events = [json.loads(line) for line in response.text.splitlines()]
+    finally:
+        server.shutdown()
+        thread.join()
+
+    assert response.headers["Content-Type"].startswith("application/x-ndjson")
+    assert [(event["type"], event.get("date"), event["source"]) for event in events] == [
+        ("payload", cached_date, "cache"),
+        ("payload", live_date, "live"),
+        ("stats", None, "live"),
+    ], f"Unexpected event sequence. Got {events=!r}"
+    assert events[-1]["stats"]["dates_processed"] == 2
+    assert live_date in store
+
+
 def test_get_storage_daily_returns_updated_at(monkeypatch):
     from datetime import datetime, timezone
     store, cached_at_store = _stub_storage(monkeypatch)
@@ -0,0 +1,45 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from adapters import registry as adapter_registry
+from adapters.tldr_adapter import TLDRAdapter
+from newsletter_config import NEWSLETTER_CONFIGS
+
+
+def test_every_configured_source_has_a_registered_adapter():
+    for source_id in NEWSLETTER_CONFIGS:
+        module_name, class_name = adapter_registry.resolve_adapter_class_path(source_id).split(":")
+        assert module_name.startswith("adapters."), f"Unexpected module for {source_id=}: {module_name=}"
+        assert class_name.endswith("Adapter")
+
+
+def test_get_adapter_builds_one_instance_per_source_across_threads(monkeypatch):
+    monkeypatch.setattr(adapter_registry, "_instances", {})
+    monkeypatch.setattr(adapter_registry, "_timings", {})
+    config = NEWSLETTER_CONFIGS["tldr_tech"]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        adapters = list(executor.map(lambda _: adapter_registry.get_adapter(config), range(16)))
+
+    assert isinstance(adapters[0], TLDRAdapter)
+    assert all(adapter is adapters[0] for adapter in adapters)
+    assert set(adapter_registry.stats()) == {"tldr_tech"}
+    assert set(adapter_registry.stats()["tldr_tech"]) == {"import_ms", "construct_ms"}
+
+
+def test_shared_adapter_gives_each_thread_its_own_html_converter(monkeypatch):
+    monkeypatch.setattr(adapter_registry, "_instances", {})
+    adapter = adapter_registry.get_adapter(NEWSLETTER_CONFIGS["tldr_tech"])
+    converters = {}
+
+    def grab_converter(name):
+        converters[name] = adapter.h
+
+    threads = [threading.Thread(target=grab_converter, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert converters["a"] is not converters["b"]
+    assert adapter.h is adapter.h
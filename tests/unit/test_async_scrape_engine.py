@@ -0,0 +1,62 @@
+import asyncio
+import time
+
+from adapters.newsletter_adapter import NewsletterAdapter
+from newsletter_config import NEWSLETTER_CONFIGS
+import storage_service
+import tldr_service
+
+
+def _stub_storage(monkeypatch) -> dict:
+    store = {}
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    monkeypatch.setattr(
+        storage_service,
+        "set_daily_payload_from_scrape",
+        lambda date_text, payload: store.__setitem__(date_text, payload),
+    )
+    return store
+
+
+def test_asyncio_engine_keeps_many_scrapes_in_flight(monkeypatch):
+    store = _stub_storage(monkeypatch)
+    monkeypatch.setenv("SCRAPE_ENGINE", "asyncio")
+    monkeypatch.setenv("MAX_PARALLEL_SCRAPES", "2")
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech", "tldr_ai", "hackernews"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+
+    def fail_sync_scrape(*args):
+        raise AssertionError("asyncio engine must not call the threaded scrape function")
+
+    async def async_scrape_stub(date, source_id, excluded_urls):
+        await asyncio.sleep(0.2)
+        date_str = date.strftime("%Y-%m-%d")
+        return date_str, {
+            "articles": [{"url": f"example.com/{source_id}/{date_str}", "title": source_id, "date": date_str}],
+            "network_articles": 1,
+            "error": None,
+            "source_id": source_id,
+        }
+
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", fail_sync_scrape)
+    monkeypatch.setattr(tldr_service, "async_scrape_single_source_for_date", async_scrape_stub)
+
+    started = time.monotonic()
+    result = tldr_service.scrape_newsletters_in_date_range("2026-03-01", "2026-03-10")
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.5, f"Expected 30 concurrent 200ms scrapes to overlap. Got {elapsed=}"
+    assert result["stats"]["total_articles"] == 30
+    assert len(store) == 10
+
+
+def test_default_async_hook_bridges_sync_scrape_date_to_a_worker_thread():
+    class SyncOnlyAdapter(NewsletterAdapter):
+        def scrape_date(self, date, excluded_urls):
+            return self._normalize_response([{"url": "https://example.com/a", "title": "A"}])
+
+    adapter = SyncOnlyAdapter(NEWSLETTER_CONFIGS["tldr_tech"])
+
+    result = asyncio.run(adapter.async_scrape_date("2026-03-01", []))
+
+    assert result == adapter.scrape_date("2026-03-01", [])
@@ -118,3 +118,34 @@ class TestCanonicalizeUrl:
 
         assert canonicalize_url("https://github.com/user/repo/") == \
             "github.com/user/repo"
+
+
+class TestMemoizedAndBulkCanonicalization:
+    """The memoized and bulk APIs must match the uncached canonicalizer exactly."""
+
+    URLS = [
+        "http://example.com",
+        "https://www.example.com/",
+        "example.com/",
+        "www.example.com",
+        "https://Example.Com/Path",
+        "https://example.com/path?query=1",
+        "https://example.com/path#fragment",
+        "https://news.ycombinator.com/item?id=123456",
+        "//cdn.example.com/a/b/",
+        "https://github.com/user/repo/",
+    ]
+
+    def test_memoized_matches_uncached(self):
+        from util import canonicalize_url as memoized
+
+        for url in self.URLS:
+            assert memoized(url) == memoized.__wrapped__(url), f"Mismatch for {url=}"
+            assert memoized(url) == memoized.__wrapped__(url), f"Mismatch on cache hit for {url=}"
+
+    def test_bulk_matches_per_url_in_order(self):
+        from util import canonicalize_urls
+
+        urls = self.URLS + list(reversed(self.URLS))
+        assert canonicalize_urls(urls) == [canonicalize_url.__wrapped__(url) for url in urls]
+        assert canonicalize_urls(iter(urls)) == canonicalize_urls(urls)
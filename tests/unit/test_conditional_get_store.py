@@ -0,0 +1,64 @@
+import conditional_get_store
+import http_sessions
+import util
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, content: bytes, headers: dict | None = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+
+
+def test_not_modified_response_serves_stored_body(monkeypatch, tmp_path):
+    monkeypatch.setenv("HTTP_VALIDATOR_STORE_PATH", str(tmp_path / "validators.sqlite3"))
+    sent_headers = []
+    responses = iter(
+        [
+            _FakeResponse(200, b"<rss>v1</rss>", {"ETag": '"v1"', "Content-Type": "application/rss+xml"}),
+            _FakeResponse(304, b""),
+        ]
+    )
+
+    def fake_get(url, **kwargs):
+        sent_headers.append(kwargs["headers"])
+        return next(responses)
+
+    monkeypatch.setattr(http_sessions, "curl_get", fake_get)
+
+    first = util.fetch("https://example.com/feed", conditional=True)
+    second = util.fetch("https://example.com/feed", conditional=True)
+
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"v1"', f"Expected stored ETag to be sent. Got {sent_headers[1]=!r}"
+    assert first.content == second.content == b"<rss>v1</rss>"
+    assert second.status_code == 200
+    assert second.headers["Content-Type"] == "application/rss+xml"
+
+
+def test_unconditional_fetch_does_not_touch_store(monkeypatch, tmp_path):
+    monkeypatch.setenv("HTTP_VALIDATOR_STORE_PATH", str(tmp_path / "validators.sqlite3"))
+    monkeypatch.setattr(
+        http_sessions,
+        "curl_get",
+        lambda url, **kwargs: _FakeResponse(200, b"body", {"ETag": '"v1"'}),
+    )
+
+    util.fetch("https://example.com/feed")
+
+    assert conditional_get_store.get_entry("https://example.com/feed") is None
+
+
+def test_memoize_parsed_reparses_only_when_body_changes():
+    parse_calls = []
+
+    def parse(body):
+        parse_calls.append(body)
+        return {"body": body}
+
+    conditional_get_store.memoize_parsed("test", b"a", parse)
+    conditional_get_store.memoize_parsed("test", b"a", parse)
+    conditional_get_store.memoize_parsed("test", b"b", parse)
+
+    assert parse_calls == [b"a", b"b"]
@@ -0,0 +1,81 @@
+import pytest
+
+import exclusion_sets
+import serve
+import storage_service
+import tldr_service
+
+
+@pytest.fixture(autouse=True)
+def stored_sets(monkeypatch):
+    stored = {}
+    monkeypatch.setattr(storage_service, "set_exclusion_set", lambda set_id, urls: stored.__setitem__(set_id, urls))
+    monkeypatch.setattr(storage_service, "get_exclusion_set", stored.get)
+    exclusion_sets.clear()
+    return stored
+
+
+def test_upload_once_then_scrape_by_id_shares_one_set_per_date(monkeypatch):
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", lambda date_text, payload: None)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech", "tldr_ai"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    received = {}
+
+    def scrape_stub(date, source_id, excluded_urls):
+        date_str = date.strftime("%Y-%m-%d")
+        received[(date_str, source_id)] = excluded_urls
+        return date_str, {
+            "articles": [
+                {"url": url, "title": url, "date": date_str}
+                for url in (f"example.com/{source_id}", "example.com/seen")
+                if url not in excluded_urls
+            ],
+            "network_articles": 2,
+            "error": None,
+            "source_id": source_id,
+        }
+
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+    client = serve.app.test_client()
+
+    upload = client.post("/api/exclusion-sets", json={"urls": ["example.com/seen", "example.com/seen"]}).get_json()
+    assert upload["url_count"] == 1
+    assert upload["exclusion_set_id"] == exclusion_sets.compute_set_id(["example.com/seen"])
+
+    result = client.post(
+        "/api/scrape",
+        json={"start_date": "2026-03-01", "end_date": "2026-03-02", "exclusion_set_id": upload["exclusion_set_id"]},
+    ).get_json()
+
+    assert result["success"], result
+    urls = sorted(article["url"] for payload in result["payloads"] for article in payload["articles"])
+    assert "example.com/seen" not in urls
+    for date_str in ("2026-03-01", "2026-03-02"):
+        tech, ai = received[(date_str, "tldr_tech")], received[(date_str, "tldr_ai")]
+        assert tech is ai, "Expected every task of a date to share one frozen set"
+        assert tech is exclusion_sets.get(upload["exclusion_set_id"]), "Expected uncached dates to use the stored set as-is"
+
+
+def test_set_uploaded_on_another_instance_resolves_from_storage():
+    client = serve.app.test_client()
+    body = {"start_date": "2026-03-01", "end_date": "2026-03-01"}
+    set_id = exclusion_sets.compute_set_id(["a.com/1"])
+
+    # Never uploaded anywhere: the client gets 404 and re-uploads the full list
+    assert client.post("/api/scrape", json={**body, "exclusion_set_id": set_id}).status_code == 404
+    assert client.post("/api/exclusion-sets", json={"urls": ["a.com/1"]}).get_json()["exclusion_set_id"] == set_id
+
+    # A fresh instance holds nothing in memory but loads the set from storage
+    exclusion_sets.clear()
+    assert exclusion_sets.resolve(["b.com/2"], set_id) == {"a.com/1", "b.com/2"}
+
+
+def test_sets_evicted_from_memory_are_reloaded(monkeypatch, stored_sets):
+    monkeypatch.setenv("EXCLUSION_SET_MAX_URLS", "3")
+    first_id, _ = exclusion_sets.put(["a.com/1", "a.com/2"])
+    second_id, _ = exclusion_sets.put(["b.com/1", "b.com/2"])
+
+    assert first_id not in exclusion_sets._sets, "Expected the least recently used set to leave memory"
+    assert exclusion_sets.get(first_id) == {"a.com/1", "a.com/2"}
+    assert sorted(stored_sets) == sorted([first_id, second_id])
@@ -0,0 +1,104 @@
+from adapters.lucumr_adapter import LucumrAdapter
+from newsletter_config import NEWSLETTER_CONFIGS
+import newsletter_scraper
+
+
+def _atom_feed(entries: list[tuple[str, str, str]]) -> bytes:
+    entry_xml = "".join(
+        f"""
+        <entry>
+            <title>{title}</title>
+            <link href="{link}" />
+            <id>{link}</id>
+            <published>{published}</published>
+            <summary>Summary of {title}</summary>
+        </entry>
+        """
+        for title, link, published in entries
+    )
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+    <feed xmlns="http://www.w3.org/2005/Atom">
+        <title>Armin Ronacher's Thoughts and Writings</title>
+        {entry_xml}
+    </feed>
+    """.encode("utf-8")
+
+
+def _build_adapter(monkeypatch, feed_content: bytes) -> tuple[LucumrAdapter, dict]:
+    adapter = LucumrAdapter(NEWSLETTER_CONFIGS["lucumr"])
+    fetch_counter = {"value": 0}
+
+    def fake_fetch_feed():
+        fetch_counter["value"] += 1
+        return feed_content
+
+    monkeypatch.setattr(adapter, "_fetch_feed", fake_fetch_feed)
+    return adapter, fetch_counter
+
+
+def test_scrape_range_fetches_feed_once_and_indexes_by_date(monkeypatch):
+    adapter, fetch_counter = _build_adapter(
+        monkeypatch,
+        _atom_feed(
+            [
+                ("First post", "https://lucumr.pocoo.org/2026/3/2/first/", "2026-03-02T10:00:00Z"),
+                ("Second post", "https://lucumr.pocoo.org/2026/3/4/second/", "2026-03-04T10:00:00Z"),
+                ("Out of range", "https://lucumr.pocoo.org/2026/2/1/old/", "2026-02-01T10:00:00Z"),
+            ]
+        ),
+    )
+
+    results_by_date = adapter.scrape_range("2026-03-01", "2026-03-04", excluded_urls=[])
+
+    assert fetch_counter["value"] == 1, f"Expected a single feed fetch. Got {fetch_counter['value']=}"
+    assert list(results_by_date) == ["2026-03-01", "2026-03-02", "2026-03-03", "2026-03-04"], (
+        f"Expected one entry per date in range. Got {list(results_by_date)=!r}"
+    )
+    assert results_by_date["2026-03-01"]["articles"] == []
+    assert [article["title"] for article in results_by_date["2026-03-02"]["articles"]] == ["First post"]
+    assert [article["title"] for article in results_by_date["2026-03-04"]["articles"]] == ["Second post"]
+    assert results_by_date["2026-03-04"]["source_id"] == "lucumr"
+
+
+def test_scrape_range_matches_scrape_date_per_date(monkeypatch):
+    adapter, _ = _build_adapter(
+        monkeypatch,
+        _atom_feed(
+            [
+                ("Kept", "https://lucumr.pocoo.org/2026/3/2/kept/", "2026-03-02T10:00:00Z"),
+                ("Excluded", "https://lucumr.pocoo.org/2026/3/2/excluded/", "2026-03-02T12:00:00Z"),
+            ]
+        ),
+    )
+    excluded_urls = ["lucumr.pocoo.org/2026/3/2/excluded"]
+
+    range_result = adapter.scrape_range("2026-03-02", "2026-03-02", excluded_urls)["2026-03-02"]
+    date_result = adapter.scrape_date("2026-03-02", excluded_urls)
+
+    assert range_result == date_result, f"Expected identical results. Got {range_result=!r} {date_result=!r}"
+    assert [article["title"] for article in date_result["articles"]] == ["Kept"]
+
+
+def test_scrape_single_source_for_range_canonicalizes_each_date(monkeypatch):
+    class FakeRangeAdapter:
+        supports_range_scrape = True
+
+        def scrape_range(self, start_date, end_date, excluded_urls):
+            return {
+                "2026-03-02": {"articles": [{"url": "https://www.example.com/a/", "title": "A"}]},
+                "2026-03-03": {"articles": []},
+            }
+
+    monkeypatch.setattr(newsletter_scraper, "_get_adapter_for_source", lambda config: FakeRangeAdapter())
+
+    from datetime import datetime
+
+    results = newsletter_scraper.scrape_single_source_for_range(
+        datetime(2026, 3, 2), datetime(2026, 3, 3), "lucumr", []
+    )
+
+    assert [date_str for date_str, _ in results] == ["2026-03-02", "2026-03-03"]
+    assert results[0][1]["articles"][0]["url"] == "example.com/a"
+    assert results[0][1]["network_articles"] == 1
+    assert results[1][1]["articles"] == []
+    assert all(result["error"] is None for _, result in results)
@@ -0,0 +1,101 @@
+from datetime import date
+
+from adapters import feed_stream
+from adapters.danluu_adapter import DanLuuAdapter
+from adapters.react_status_adapter import ReactStatusAdapter
+from newsletter_config import NEWSLETTER_CONFIGS
+
+
+def _rss_item(title: str, pub_date: str) -> str:
+    return (
+        f"<item><title>{title}</title><link>https://danluu.com/{title.lower()}/</link>"
+        f"<pubDate>{pub_date}</pubDate><description>&lt;p&gt;About {title}&lt;/p&gt;</description></item>"
+    )
+
+
+def _rss_feed(*items: str, tail: str = "") -> bytes:
+    return f"<rss><channel><title>Feed</title>{''.join(items)}{tail}</channel></rss>".encode("utf-8")
+
+
+def test_parsing_stops_once_entries_are_older_than_since():
+    body = _rss_feed(
+        _rss_item("Newest", "Wed, 04 Mar 2026 10:00:00 +0000"),
+        _rss_item("Pinned", "Mon, 05 Jan 2026 10:00:00 +0000"),
+        _rss_item("Window", "Tue, 03 Mar 2026 10:00:00 +0000"),
+        *[_rss_item(f"Old{index}", "Sun, 01 Feb 2026 10:00:00 +0000") for index in range(3)],
+        # Never reached: parsing it would raise
+        tail="<item><title>broken</item>",
+    )
+
+    entries = list(feed_stream.iter_feed_entries(body, since=date(2026, 3, 3)))
+
+    assert [entry.title for entry in entries] == ["Newest", "Window"], (
+        f"Expected a single stale entry to be skipped without ending the walk. Got {entries=!r}"
+    )
+    assert entries[0].summary == "<p>About Newest</p>"
+
+
+def test_malformed_feed_falls_back_to_feedparser():
+    body = _rss_feed(
+        _rss_item("Clean", "Wed, 04 Mar 2026 10:00:00 +0000"),
+        # &nbsp; is not an XML entity, so iterparse rejects the document here
+        _rss_item("Tom&nbsp;&amp;&nbsp;Jerry", "Tue, 03 Mar 2026 10:00:00 +0000"),
+        _rss_item("After", "Mon, 02 Mar 2026 10:00:00 +0000"),
+    )
+
+    entries = list(feed_stream.iter_feed_entries(body, since=date(2026, 3, 2)))
+
+    assert [entry.title for entry in entries] == ["Clean", "Tom\xa0&\xa0Jerry", "After"], f"Expected every entry of a malformed feed, read once each. Got {entries=!r}"
+    assert feed_stream.utc_date_str(entries[1].published) == "2026-03-03"
+    assert entries[2].summary == "<p>About After</p>"
+
+
+def test_atom_entries_are_normalized():
+    body = b"""<feed xmlns="http://www.w3.org/2005/Atom">
+        <entry>
+            <title>Post</title>
+            <link rel="replies" href="https://example.com/post/comments" />
+            <link href="https://example.com/post/" />
+            <updated>2026-03-02T23:30:00-08:00</updated>
+            <content type="html">&lt;p&gt;Body&lt;/p&gt;</content>
+            <category term="python" />
+        </entry>
+    </feed>"""
+
+    (entry,) = feed_stream.iter_feed_entries(body)
+
+    assert entry.link == "https://example.com/post/"
+    assert entry.published == entry.updated
+    assert feed_stream.utc_date_str(entry.published) == "2026-03-03"
+    assert (entry.summary, entry.content, entry.categories) == ("", "<p>Body</p>", ("python",))
+
+
+def test_rss_adapter_keeps_dates_in_the_feed_offset(monkeypatch):
+    adapter = DanLuuAdapter(NEWSLETTER_CONFIGS["danluu"])
+    body = _rss_feed(_rss_item("Late", "Mon, 02 Mar 2026 23:30:00 -0800"))
+    monkeypatch.setattr(adapter, "_fetch_rss_feed", lambda: body)
+
+    result = adapter.scrape_range("2026-03-02", "2026-03-03", excluded_urls=[])
+
+    assert [article["title"] for article in result["2026-03-02"]["articles"]] == ["Late"]
+    assert result["2026-03-03"]["articles"] == []
+
+
+def test_react_status_matches_the_issue_for_the_target_date(monkeypatch):
+    adapter = ReactStatusAdapter(NEWSLETTER_CONFIGS["react_status"])
+    issue_html = (
+        '&lt;p&gt;&lt;span style="font-weight: 600"&gt;&lt;a href="https://tracking.example/1" '
+        'title="react.dev"&gt;React Compiler RC&lt;/a&gt;&lt;/span&gt;&lt;/p&gt;'
+    )
+    body = _rss_feed(
+        f"<item><title>Issue 2</title><link>https://react.statuscode.com/issues/2</link>"
+        f"<pubDate>Wed, 04 Mar 2026 15:00:00 +0000</pubDate><description>{issue_html}</description></item>",
+        _rss_item("Issue1", "Wed, 25 Feb 2026 15:00:00 +0000"),
+    )
+    monkeypatch.setattr(adapter, "_fetch_feed", lambda: body)
+    monkeypatch.setattr(adapter, "_resolve_tracking_link", lambda url: "https://react.dev/blog/compiler-rc")
+
+    articles = adapter.scrape_date("2026-03-04", excluded_urls=[])["articles"]
+
+    assert [article["title"] for article in articles] == ["React Compiler RC"]
+    assert adapter.scrape_date("2026-03-03", excluded_urls=[])["articles"] == []
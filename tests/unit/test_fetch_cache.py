@@ -0,0 +1,65 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import fetch_cache
+import http_sessions
+import util
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+
+
+def test_concurrent_fetches_share_one_in_flight_request(monkeypatch):
+    request_counter = {"value": 0}
+    counter_lock = threading.Lock()
+
+    def fake_get(url, **kwargs):
+        with counter_lock:
+            request_counter["value"] += 1
+        time.sleep(0.05)
+        return _FakeResponse(200, b"listing-page")
+
+    monkeypatch.setattr(http_sessions, "curl_get", fake_get)
+
+    cache = fetch_cache.FetchCache()
+    with fetch_cache.scrape_scope(cache), ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            fetch_cache.submit_in_context(executor, util.fetch, "https://deepmind.google/discover/blog/")
+            for _ in range(8)
+        ]
+        bodies = [future.result().content for future in futures]
+
+    assert request_counter["value"] == 1, f"Expected a single network request. Got {request_counter['value']=}"
+    assert bodies == [b"listing-page"] * 8
+    assert cache.stats() == {"hits": 7, "misses": 1, "bytes_saved": 7 * len(b"listing-page")}
+
+
+def test_fetch_bypasses_cache_outside_scope_and_for_server_errors(monkeypatch):
+    responses = iter([_FakeResponse(503, b""), _FakeResponse(200, b"ok"), _FakeResponse(200, b"again")])
+    monkeypatch.setattr(http_sessions, "curl_get", lambda url, **kwargs: next(responses))
+
+    with fetch_cache.scrape_scope() as cache:
+        assert util.fetch("https://example.com").status_code == 503
+        assert util.fetch("https://example.com").content == b"ok"
+        assert util.fetch("https://example.com").content == b"ok"
+
+    assert cache.stats()["hits"] == 1
+    assert util.fetch("https://example.com").content == b"again"
+
+
+def test_differing_headers_are_cached_separately(monkeypatch):
+    monkeypatch.setattr(
+        http_sessions,
+        "curl_get",
+        lambda url, **kwargs: _FakeResponse(200, kwargs["headers"]["User-Agent"].encode()),
+    )
+
+    with fetch_cache.scrape_scope():
+        first = util.fetch("https://example.com", headers={"User-Agent": "a"})
+        second = util.fetch("https://example.com", headers={"User-Agent": "b"})
+
+    assert (first.content, second.content) == (b"a", b"b")
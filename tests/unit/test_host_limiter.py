@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import fetch_cache
+import host_limiter
+import http_sessions
+import util
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+
+
+def test_fetch_caps_in_flight_requests_per_host_and_records_waits(monkeypatch):
+    monkeypatch.setattr(host_limiter, "_limiters", {})
+    monkeypatch.setattr(
+        host_limiter,
+        "_configured_limits",
+        {"throttled.example": host_limiter.HostLimit(max_concurrency=2)},
+    )
+    in_flight = {"throttled.example": 0, "open.example": 0}
+    peak_in_flight = {"throttled.example": 0, "open.example": 0}
+    counter_lock = threading.Lock()
+
+    def fake_get(url, **kwargs):
+        host = host_limiter.resolve_host_key(url)
+        with counter_lock:
+            in_flight[host] += 1
+            peak_in_flight[host] = max(peak_in_flight[host], in_flight[host])
+        time.sleep(0.05)
+        with counter_lock:
+            in_flight[host] -= 1
+        return _FakeResponse(200, b"ok")
+
+    monkeypatch.setattr(http_sessions, "curl_get", fake_get)
+
+    urls = [f"https://throttled.example/page/{index}" for index in range(6)]
+    urls += [f"https://open.example/page/{index}" for index in range(6)]
+    with host_limiter.wait_stats_scope() as wait_stats, ThreadPoolExecutor(max_workers=12) as executor:
+        futures = [fetch_cache.submit_in_context(executor, util.fetch, url) for url in urls]
+        for future in futures:
+            future.result()
+
+    assert peak_in_flight["throttled.example"] == 2, f"Expected at most 2 in flight. Got {peak_in_flight=!r}"
+    assert peak_in_flight["open.example"] == 6, f"Expected unthrottled host to run fully parallel. Got {peak_in_flight=!r}"
+    stats = wait_stats.stats()
+    assert stats["throttled.example"]["requests"] == 6
+    assert stats["throttled.example"]["wait_ms_max"] >= 50
+
+
+def test_token_bucket_spaces_requests_to_configured_rate():
+    limiter = host_limiter.HostLimiter("rated.example", host_limiter.HostLimit(max_concurrency=4, requests_per_second=20.0))
+
+    started = time.monotonic()
+    for _ in range(5):
+        with limiter.slot():
+            pass
+    elapsed = time.monotonic() - started
+
+    assert elapsed >= 0.15, f"Expected 4 rate-limited waits of ~50ms. Got {elapsed=}"
+
+
+def _full_limiter() -> tuple[host_limiter.HostLimiter, threading.Event]:
+    limiter = host_limiter.HostLimiter("slow.example", host_limiter.HostLimit(max_concurrency=1))
+    holding, release = threading.Event(), threading.Event()
+
+    def hold_slot():
+        with limiter.slot():
+            holding.set()
+            release.wait(5)
+
+    threading.Thread(target=hold_slot, daemon=True).start()
+    assert holding.wait(5)
+    return limiter, release
+
+
+def test_slot_waiters_stop_on_cancel_and_deadline():
+    limiter, release = _full_limiter()
+    cancel_token = util.CancelToken()
+    threading.Timer(0.05, cancel_token.cancel, args=("client_disconnected",)).start()
+
+    started = time.monotonic()
+    with util.cancel_scope(cancel_token), pytest.raises(util.ScrapeCancelled):
+        with limiter.slot():
+            pass
+    with util.deadline_scope(time.monotonic() + 0.05), pytest.raises(util.DeadlineExceeded):
+        with limiter.slot():
+            pass
+    release.set()
+
+    assert time.monotonic() - started < 1, "Expected waiters to give up instead of waiting for the slow host"
+
+
+def test_async_slot_waiter_is_woken_by_release():
+    limiter, release = _full_limiter()
+    threading.Timer(0.02, release.set).start()
+
+    async def wait_for_slot():
+        started = time.monotonic()
+        async with limiter.async_slot():
+            return time.monotonic() - started
+
+    waited = asyncio.run(wait_for_slot())
+
+    assert waited < 0.09, f"Expected a wakeup on release rather than a poll interval. Got {waited=}"
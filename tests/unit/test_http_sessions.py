@@ -0,0 +1,73 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import http_sessions
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _CookieHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = (self.headers.get("Cookie") or "none").encode("utf-8")
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=site-a; Path=/")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_server(handler=_KeepAliveHandler) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_pooled_sessions_reuse_connections(monkeypatch):
+    monkeypatch.setattr(http_sessions, "_curl_session", None)
+    monkeypatch.setattr(http_sessions, "_requests_session", None)
+    monkeypatch.setattr(http_sessions, "_curl_stats", {"requests": 0, "new_connections": 0})
+    server = _start_server()
+    url = f"http://127.0.0.1:{server.server_port}/feed"
+    try:
+        for _ in range(4):
+            assert http_sessions.curl_get(url, timeout=5).content == b"ok"
+            assert http_sessions.get_requests_session().get(url, timeout=5).content == b"ok"
+    finally:
+        server.shutdown()
+
+    stats = http_sessions.stats()
+    assert stats["curl"] == {"requests": 4, "new_connections": 1, "reuse_ratio": 0.75}, f"Got {stats=!r}"
+    assert stats["requests"] == {"requests": 4, "new_connections": 1, "reuse_ratio": 0.75}, f"Got {stats=!r}"
+
+
+def test_pooled_sessions_do_not_carry_cookies_between_requests(monkeypatch):
+    monkeypatch.setattr(http_sessions, "_curl_session", None)
+    monkeypatch.setattr(http_sessions, "_requests_session", None)
+    server = _start_server(_CookieHandler)
+    url = f"http://127.0.0.1:{server.server_port}/"
+    try:
+        for _ in range(2):
+            assert http_sessions.curl_get(url, timeout=5).content == b"none"
+            assert http_sessions.get_requests_session().get(url, timeout=5).content == b"none"
+    finally:
+        server.shutdown()
+
+    assert not http_sessions.get_curl_session().cookies
+    assert not http_sessions.get_requests_session().cookies
@@ -0,0 +1,88 @@
+import threading
+import time
+
+import storage_service
+import tldr_service
+
+
+def _stub_sources(monkeypatch, scrape_stub):
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+
+
+def _result(date, source_id):
+    date_str = date.strftime("%Y-%m-%d")
+    return date_str, {
+        "articles": [{"url": f"example.com/{date_str}", "title": date_str, "date": date_str}],
+        "network_articles": 1,
+        "error": None,
+        "source_id": source_id,
+    }
+
+
+def test_finished_dates_are_persisted_while_the_range_is_still_scraping(monkeypatch):
+    newest_written = threading.Event()
+    writes = []
+
+    def record_write(date_str, payload):
+        writes.append(date_str)
+        if date_str == "2026-03-03":
+            newest_written.set()
+
+    def scrape_stub(date, source_id, excluded_urls):
+        if date.strftime("%Y-%m-%d") == "2026-03-01":
+            # The oldest date only finishes once the newest one is already stored
+            assert newest_written.wait(5), "Expected the newest date to be written before the range finished"
+        return _result(date, source_id)
+
+    _stub_sources(monkeypatch, scrape_stub)
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", record_write)
+
+    result = tldr_service.scrape_newsletters_in_date_range("2026-03-01", "2026-03-03")
+
+    assert writes.index("2026-03-03") < writes.index("2026-03-01") and sorted(writes) == ["2026-03-01", "2026-03-02", "2026-03-03"]
+    assert result["stats"]["writes"] == {"persisted": 3, "failed": []}
+
+
+def test_a_failed_write_does_not_discard_the_other_dates(monkeypatch):
+    writes = []
+
+    def flaky_write(date_str, payload):
+        if date_str == "2026-03-02":
+            raise RuntimeError("daily_cache unavailable")
+        writes.append(date_str)
+
+    _stub_sources(monkeypatch, lambda date, source_id, excluded_urls: _result(date, source_id))
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", flaky_write)
+
+    result = tldr_service.scrape_newsletters_in_date_range("2026-03-01", "2026-03-03")
+
+    assert result["success"]
+    assert len(result["payloads"]) == 3
+    assert sorted(writes) == ["2026-03-01", "2026-03-03"]
+    assert result["stats"]["writes"] == {"persisted": 2, "failed": ["2026-03-02"]}
+
+
+def test_a_disconnected_stream_still_stores_the_dates_it_finalized(monkeypatch):
+    writes = []
+
+    def slow_write(date_str, payload):
+        time.sleep(0.2)
+        writes.append(date_str)
+
+    def scrape_stub(date, source_id, excluded_urls):
+        if date.strftime("%Y-%m-%d") != "2026-03-03":
+            time.sleep(0.5)
+        return _result(date, source_id)
+
+    _stub_sources(monkeypatch, scrape_stub)
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", slow_write)
+
+    events = tldr_service.iter_scrape_newsletters_in_date_range("2026-03-01", "2026-03-03")
+    first = next(events)
+    events.close()
+
+    assert (first["date"], first["source"]) == ("2026-03-03", "live")
+    assert writes == ["2026-03-03"], "Expected the finalized date to be stored before the closed stream returned"
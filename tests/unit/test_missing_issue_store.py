@@ -0,0 +1,68 @@
+import time
+
+from adapters import registry as adapter_registry
+import http_sessions
+import missing_issue_store
+from newsletter_config import NEWSLETTER_CONFIGS
+import storage_service
+import tldr_service
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, text: str = ""):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode()
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400 and self.status_code != 404:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+def test_redirected_tldr_issue_is_recorded_and_final_once_the_day_is_over(monkeypatch):
+    monkeypatch.setattr(http_sessions, "curl_get", lambda url, **kwargs: _FakeResponse(302))
+    adapter = adapter_registry.get_adapter(NEWSLETTER_CONFIGS["tldr_tech"])
+
+    assert adapter.fetch_issue("2026-03-07", "tech") is None
+
+    entries = missing_issue_store.load_entries(["tldr_tech"])
+    entry = entries[("tldr_tech", "2026-03-07/tech")]
+    assert entry["reason"] == "redirect 302"
+    assert missing_issue_store.is_skippable(entry)
+    assert missing_issue_store.is_skippable(entry, now=time.time() + 10 * 365 * 86400)
+
+
+def test_miss_recorded_on_its_own_date_is_retried_after_the_retry_interval(monkeypatch):
+    monkeypatch.setenv("MISSING_ISSUE_RETRY_SECONDS", "60")
+    entry = {"issue_date": "2026-03-07", "checked_at": 0.0}
+    monkeypatch.setattr(missing_issue_store.util, "should_rescrape", lambda date, checked_at: True)
+
+    assert missing_issue_store.is_skippable(entry, now=30.0)
+    assert not missing_issue_store.is_skippable(entry, now=61.0)
+
+
+def test_known_missing_work_items_never_reach_the_executor(monkeypatch):
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", lambda date_text, payload: None)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech", "tldr_ai"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    missing_issue_store.record_missing("tldr_tech", "2026-03-07/tech", "2026-03-07", "404")
+    scraped = []
+
+    def scrape_stub(date, source_id, excluded_urls):
+        date_str = date.strftime("%Y-%m-%d")
+        scraped.append((date_str, source_id))
+        return date_str, {"articles": [], "network_articles": 0, "error": None, "source_id": source_id}
+
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+
+    result = tldr_service.scrape_newsletters_in_date_range("2026-03-06", "2026-03-07")
+
+    assert sorted(scraped) == [
+        ("2026-03-06", "tldr_ai"),
+        ("2026-03-06", "tldr_tech"),
+        ("2026-03-07", "tldr_ai"),
+    ], f"Expected the known-missing issue to be skipped. Got {scraped=!r}"
+    assert result["stats"]["missing_issue_skips"] == 1
+    assert [payload["date"] for payload in result["payloads"]] == ["2026-03-07", "2026-03-06"]
@@ -0,0 +1,139 @@
+import threading
+from datetime import date, timedelta
+
+from newsletter_config import NEWSLETTER_CONFIGS
+import publish_calendar
+import storage_service
+import tldr_service
+
+
+def _run_scrape(monkeypatch, source_ids, start_date, end_date, history_rows=()):
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    monkeypatch.setattr(storage_service, "get_source_meta_range", lambda start, end: list(history_rows))
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", lambda date_text, payload: None)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: source_ids)
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    publish_calendar.reset_learned_cadence()
+    scraped = []
+
+    def scrape_stub(date, source_id, excluded_urls):
+        date_str = date.strftime("%Y-%m-%d")
+        scraped.append((date_str, source_id))
+        return date_str, {"articles": [], "network_articles": 0, "error": None, "source_id": source_id}
+
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+    result = tldr_service.scrape_newsletters_in_date_range(start_date, end_date)
+    return sorted(scraped), result
+
+
+def test_static_publish_weekdays_prune_work_items(monkeypatch):
+    monkeypatch.setattr(NEWSLETTER_CONFIGS["tldr_tech"], "publish_weekdays", (0, 1, 2, 3, 4))
+    monkeypatch.setattr(NEWSLETTER_CONFIGS["softwareleadweekly"], "publish_weekdays", (4,))
+
+    # 2026-03-06 is a Friday
+    scraped, result = _run_scrape(monkeypatch, ["tldr_tech", "softwareleadweekly"], "2026-03-05", "2026-03-08")
+
+    assert scraped == [
+        ("2026-03-05", "tldr_tech"),
+        ("2026-03-06", "softwareleadweekly"),
+        ("2026-03-06", "tldr_tech"),
+    ], f"Expected weekend and non-Friday items to be pruned. Got {scraped=!r}"
+    assert result["stats"]["calendar_skips"] == 5
+    assert len(result["payloads"]) == 4
+
+
+def _history_rows(start: date, weeks: int, publishes) -> list[dict]:
+    rows = []
+    for offset in range(weeks * 7):
+        current = start + timedelta(days=offset)
+        date_str = current.isoformat()
+        scraped_at = (current + timedelta(days=3)).isoformat() + "T12:00:00+00:00"
+        source_meta = {}
+        for source_id, published in publishes(current).items():
+            source_meta[source_id] = {
+                "lastSuccessAt": scraped_at,
+                "lastErrorAt": None,
+                "lastError": None,
+                "articleCount": int(published),
+            }
+        rows.append({"date": date_str, "sourceMeta": source_meta})
+    return rows
+
+
+def test_learned_cadence_prunes_only_confident_empty_weekdays(monkeypatch):
+    monkeypatch.setenv("PUBLISH_CALENDAR_LOOKBACK_DAYS", "56")
+    history = _history_rows(
+        date(2026, 1, 5),
+        weeks=8,
+        publishes=lambda current: {
+            "hackernews": current.weekday() < 5,
+            # Rare and bursty: two posts in eight weeks is too little to learn a calendar from
+            "deepmind": current in (date(2026, 1, 14), date(2026, 2, 18)),
+        },
+    )
+
+    # Saturday through Monday
+    scraped, result = _run_scrape(monkeypatch, ["hackernews", "deepmind"], "2026-03-07", "2026-03-09", history)
+
+    assert scraped == [
+        ("2026-03-07", "deepmind"),
+        ("2026-03-08", "deepmind"),
+        ("2026-03-09", "deepmind"),
+        ("2026-03-09", "hackernews"),
+    ], f"Expected only the learned weekend gap to be pruned. Got {scraped=!r}"
+    assert result["stats"]["calendar_skips"] == 2
+
+
+def test_learning_needs_enough_observations(monkeypatch):
+    monkeypatch.setenv("PUBLISH_CALENDAR_LOOKBACK_DAYS", "56")
+    history = _history_rows(date(2026, 2, 9), weeks=3, publishes=lambda current: {"hackernews": current.weekday() < 5})
+
+    scraped, result = _run_scrape(monkeypatch, ["hackernews"], "2026-03-07", "2026-03-08", history)
+
+    assert scraped == [("2026-03-07", "hackernews"), ("2026-03-08", "hackernews")]
+    assert result["stats"]["calendar_skips"] == 0
+
+
+def test_cached_date_with_only_skipped_sources_takes_the_cache_fast_path(monkeypatch):
+    monkeypatch.setattr(NEWSLETTER_CONFIGS["tldr_tech"], "publish_weekdays", (0, 1, 2, 3, 4))
+    # 2026-03-07 is a Saturday, cached after its day ended without a tldr_tech entry
+    cached_row = {
+        "date": "2026-03-07",
+        "payload": {"date": "2026-03-07", "articles": [], "sourceMeta": {}},
+        "cached_at": "2026-03-09T12:00:00+00:00",
+    }
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [cached_row])
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    monkeypatch.setattr(
+        tldr_service, "scrape_single_source_for_date", lambda *args: (_ for _ in ()).throw(AssertionError(args))
+    )
+    publish_calendar.reset_learned_cadence()
+
+    result = tldr_service.scrape_newsletters_in_date_range("2026-03-07", "2026-03-07")
+    swr = tldr_service.scrape_stale_while_revalidate("2026-03-07", "2026-03-07")
+
+    assert result["source"] == "cache", f"Expected the cache fast path. Got {result['stats']=!r}"
+    assert swr["stats"]["stale_dates"] == [] and swr["revalidation_token"] is None
+
+
+def test_learning_does_not_block_other_requests(monkeypatch):
+    monkeypatch.setenv("PUBLISH_CALENDAR_LOOKBACK_DAYS", "56")
+    publish_calendar.reset_learned_cadence()
+    read_started, release = threading.Event(), threading.Event()
+
+    def slow_read(start, end):
+        read_started.set()
+        assert release.wait(5)
+        return _history_rows(date(2026, 1, 5), weeks=8, publishes=lambda current: {"hackernews": current.weekday() < 5})
+
+    monkeypatch.setattr(storage_service, "get_source_meta_range", slow_read)
+    learner = threading.Thread(target=publish_calendar.get_learned_cadence)
+    learner.start()
+    assert read_started.wait(5)
+
+    assert publish_calendar.get_learned_cadence() == {}, "Expected a concurrent caller not to wait on the read"
+
+    release.set()
+    learner.join(5)
+    assert publish_calendar.get_learned_cadence()["hackernews"]["published"][0] == 8
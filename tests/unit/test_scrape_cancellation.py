@@ -0,0 +1,179 @@
+import logging
+import socket
+import threading
+import time
+
+import pytest
+
+import http_sessions
+import serve
+import storage_service
+import summarizer
+import tldr_service
+import util
+
+
+class _FakeResponse:
+    status_code = 200
+    text = "ok"
+    content = b"ok"
+    headers = {}
+
+
+def _prepare(monkeypatch, source_ids):
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    fresh_writes = {}
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", fresh_writes.__setitem__)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: source_ids)
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    monkeypatch.setattr(http_sessions, "curl_get", lambda url, **kwargs: (time.sleep(0.01), _FakeResponse())[1])
+    return fresh_writes
+
+
+def _source_result(date, source_id):
+    date_str = date.strftime("%Y-%m-%d")
+    return date_str, {
+        "articles": [{"url": f"example.com/{source_id}/{date_str}", "title": source_id, "date": date_str}],
+        "network_articles": 1,
+        "error": None,
+        "source_id": source_id,
+    }
+
+
+class _PagingAdapter:
+    """Fetches page after page until told to stop, like an archive walk on a slow site."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.stopped = threading.Event()
+        self.fetches_after_stop = 0
+        self.calls = 0
+
+    def scrape(self, date, source_id, excluded_urls):
+        self.calls += 1
+        if self.calls > 1:
+            return _source_result(date, source_id)
+        self.started.set()
+        try:
+            for page in range(500):
+                util.fetch(f"https://example.com/archive?page={page}")
+        except util.ScrapeCancelled:
+            # Adapters log and swallow fetch errors; the scrape must still count as cancelled
+            return _source_result(date, source_id)
+        finally:
+            self.stopped.set()
+        raise AssertionError("expected the paging adapter to be cancelled")
+
+
+def test_newer_scrape_with_same_supersede_key_cancels_the_running_one(monkeypatch):
+    fresh_writes = _prepare(monkeypatch, ["hackernews"])
+    adapter = _PagingAdapter()
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", adapter.scrape)
+    results = {}
+
+    first = threading.Thread(
+        target=lambda: results.setdefault(
+            "first", tldr_service.scrape_newsletters_in_date_range("2026-03-01", "2026-03-01", supersede_key="tab-1")
+        )
+    )
+    first.start()
+    assert adapter.started.wait(5)
+    results["second"] = tldr_service.scrape_newsletters_in_date_range(
+        "2026-03-01", "2026-03-01", supersede_key="tab-1"
+    )
+    first.join(5)
+
+    assert adapter.stopped.wait(5), "Expected the running adapter to stop at its next fetch"
+    assert results["first"]["stats"]["cancelled"] == {"reason": "superseded", "work_items": 1}
+    assert results["first"]["stats"]["unfinished"] == [{"date": "2026-03-01", "source_id": "hackernews"}]
+    assert results["second"]["stats"]["cancelled"] is None
+    assert results["second"]["stats"]["coalesced"]["work_items"] == 0, "Expected no attach to a cancelled flight"
+    assert [article["title"] for article in fresh_writes["2026-03-01"]["articles"]] == ["hackernews"]
+
+
+def test_closing_the_event_stream_cancels_remaining_work(monkeypatch, caplog):
+    fresh_writes = _prepare(monkeypatch, ["hackernews"])
+    monkeypatch.setenv("MAX_PARALLEL_SCRAPES", "3")
+    adapter = _PagingAdapter()
+
+    def scrape_stub(date, source_id, excluded_urls):
+        if date.day == 1:
+            return adapter.scrape(date, source_id, excluded_urls)
+        # Newest dates are dispatched first; hold their results until the slow date is running
+        assert adapter.started.wait(5)
+        return _source_result(date, source_id)
+
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+    events = tldr_service.iter_scrape_newsletters_in_date_range("2026-03-01", "2026-03-03")
+
+    with caplog.at_level(logging.WARNING, logger="tldr_service"):
+        first_event = next(events)
+        events.close()
+
+    assert first_event["date"] in ("2026-03-02", "2026-03-03")
+    assert adapter.stopped.wait(5), "Expected the running adapter to stop at its next fetch"
+    assert "2026-03-01" not in fresh_writes
+    assert any(
+        "cancelled reason=client_disconnected" in record.getMessage() for record in caplog.records
+    ), f"Expected the cancel to be logged. Got {[record.getMessage() for record in caplog.records]!r}"
+
+
+def test_client_disconnect_is_detected_without_consuming_pipelined_bytes():
+    server_side, client_side = socket.socketpair()
+    try:
+        assert not serve._client_disconnected(server_side)
+        client_side.sendall(b"GET /next HTTP/1.1\r\n")
+        assert not serve._client_disconnected(server_side)
+        assert server_side.recv(3) == b"GET"
+    finally:
+        client_side.close()
+
+    try:
+        server_side.recv(1024)
+        assert serve._client_disconnected(server_side)
+    finally:
+        server_side.close()
+
+
+def test_scrape_url_cascade_stops_between_attempts_once_cancelled(monkeypatch):
+    monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
+    cancel_token = util.CancelToken()
+    attempts = []
+
+    def curl_cffi_cancelled_mid_request(url, *, timeout):
+        attempts.append("curl_cffi")
+        cancel_token.cancel("client disconnected")
+        raise RuntimeError("connection reset")
+
+    def jina_reader(url, *, timeout):
+        attempts.append("jina_reader")
+        raise AssertionError("no fallback should start after the scrape was cancelled")
+
+    monkeypatch.setattr(summarizer, "_scrape_with_curl_cffi", curl_cffi_cancelled_mid_request)
+    monkeypatch.setattr(summarizer, "_scrape_with_jina_reader", jina_reader)
+    monkeypatch.setattr(summarizer, "_scrape_with_firecrawl", jina_reader)
+
+    with util.cancel_scope(cancel_token), pytest.raises(util.ScrapeCancelled):
+        summarizer.scrape_url("https://example.com/post")
+    assert attempts == ["curl_cffi"]
+
+
+def test_scrape_url_cascade_does_not_swallow_a_cancel_raised_inside_an_attempt(monkeypatch):
+    monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
+    attempts = []
+
+    def curl_cffi_failure(url, *, timeout):
+        attempts.append("curl_cffi")
+        raise RuntimeError("blocked")
+
+    def jina_reader_cancelled(url, *, timeout):
+        attempts.append("jina_reader")
+        raise util.ScrapeCancelled("scrape cancelled: client disconnected")
+
+    monkeypatch.setattr(summarizer, "_scrape_with_curl_cffi", curl_cffi_failure)
+    monkeypatch.setattr(summarizer, "_scrape_with_jina_reader", jina_reader_cancelled)
+
+    with pytest.raises(util.ScrapeCancelled):
+        summarizer.scrape_url("https://example.com/post")
+    # scrape_url's retry does not run the cascade again either
+    assert attempts == ["curl_cffi", "jina_reader"]
@@ -0,0 +1,83 @@
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+
+import scrape_daemon
+import storage_service
+import tldr_service
+
+
+def _record_scrapes(monkeypatch) -> list[tuple]:
+    calls = []
+
+    def fake_scrape(start_date, end_date, source_ids=None, excluded_urls=None):
+        calls.append((start_date, end_date, source_ids))
+        return {"success": True, "payloads": [], "stats": {"total_articles": 0}, "source": "live"}
+
+    monkeypatch.setattr(tldr_service, "scrape_newsletters_in_date_range", fake_scrape)
+    monkeypatch.setattr(scrape_daemon, "_pacific_today_and_yesterday", lambda: ("2026-03-05", "2026-03-04"))
+    return calls
+
+
+def test_pass_scrapes_unfinished_yesterday_with_all_sources_and_today_with_due_sources(monkeypatch):
+    calls = _record_scrapes(monkeypatch)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech", "lucumr"])
+    stale_cached_at = datetime(2026, 3, 4, 18, 0, tzinfo=timezone.utc).isoformat()
+    monkeypatch.setattr(
+        storage_service,
+        "get_daily_payloads_range",
+        lambda start, end: [{"date": start, "payload": {}, "cached_at": stale_cached_at}],
+    )
+
+    scrape_daemon.run_pass(["tldr_tech"])
+
+    assert calls == [
+        ("2026-03-04", "2026-03-04", ["tldr_tech", "lucumr"]),
+        ("2026-03-05", "2026-03-05", ["tldr_tech"]),
+    ], f"Unexpected scrape calls. Got {calls=!r}"
+
+
+def test_pass_rescrapes_yesterday_only_for_sources_without_a_final_scrape(monkeypatch):
+    calls = _record_scrapes(monkeypatch)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech", "lucumr"])
+    final_at = (datetime(2026, 3, 5, 12, 0, tzinfo=timezone.utc) + timedelta(days=1)).isoformat()
+    source_meta = {
+        "tldr_tech": {"lastSuccessAt": final_at, "lastErrorAt": None, "lastError": None, "articleCount": 3},
+        # The final scrape failed for this source, even though the date-level cached_at is final
+        "lucumr": {"lastSuccessAt": None, "lastErrorAt": final_at, "lastError": "timeout", "articleCount": 0},
+    }
+    monkeypatch.setattr(
+        storage_service,
+        "get_daily_payloads_range",
+        lambda start, end: [{"date": start, "payload": {"sourceMeta": source_meta}, "cached_at": final_at}],
+    )
+
+    scrape_daemon.run_pass([])
+
+    assert calls == [("2026-03-04", "2026-03-04", ["lucumr"])], f"Unexpected scrape calls. Got {calls=!r}"
+
+
+def test_pass_skips_yesterday_once_it_is_final(monkeypatch):
+    calls = _record_scrapes(monkeypatch)
+    final_cached_at = (datetime(2026, 3, 5, 12, 0, tzinfo=timezone.utc) + timedelta(days=1)).isoformat()
+    monkeypatch.setattr(
+        storage_service,
+        "get_daily_payloads_range",
+        lambda start, end: [{"date": start, "payload": {}, "cached_at": final_cached_at}],
+    )
+
+    scrape_daemon.run_pass([])
+
+    assert calls == []
+
+
+def test_run_once_refreshes_every_source_and_honours_interval_overrides(monkeypatch):
+    calls = _record_scrapes(monkeypatch)
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech", "lucumr"])
+    monkeypatch.setenv("DAEMON_SOURCE_INTERVALS", "lucumr=5")
+
+    scrape_daemon.run_daemon(threading.Event(), once=True, rng=random.Random(0))
+
+    assert calls[-1] == ("2026-03-05", "2026-03-05", ["tldr_tech", "lucumr"])
+    assert scrape_daemon.resolve_refresh_intervals(["tldr_tech", "lucumr"]) == {"tldr_tech": 1800.0, "lucumr": 300.0}
@@ -0,0 +1,101 @@
+import threading
+import time
+
+import pytest
+
+import storage_service
+import summarizer
+import tldr_service
+import util
+
+
+def _source_result(date, source_id):
+    date_str = date.strftime("%Y-%m-%d")
+    return date_str, {
+        "articles": [{"url": f"example.com/{source_id}/{date_str}", "title": source_id, "date": date_str}],
+        "network_articles": 1,
+        "error": None,
+        "source_id": source_id,
+    }
+
+
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_deadline_returns_partial_results_and_does_not_mark_them_fresh(monkeypatch, engine):
+    cached_payload = {"date": "2026-03-01", "articles": []}
+    monkeypatch.setattr(
+        storage_service,
+        "get_daily_payloads_range",
+        lambda start, end: [{"date": "2026-03-01", "payload": cached_payload, "cached_at": None}],
+    )
+    fresh_writes, stale_writes = {}, {}
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", fresh_writes.__setitem__)
+    monkeypatch.setattr(storage_service, "set_daily_payload", stale_writes.__setitem__)
+    monkeypatch.setenv("SCRAPE_ENGINE", engine)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech", "hackernews"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    release = threading.Event()
+
+    def scrape_stub(date, source_id, excluded_urls):
+        if source_id == "hackernews" and date.day == 1:
+            release.wait(5)
+        return _source_result(date, source_id)
+
+    async def async_scrape_stub(date, source_id, excluded_urls):
+        import asyncio
+
+        if source_id == "hackernews" and date.day == 1:
+            await asyncio.sleep(5)
+        return _source_result(date, source_id)
+
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+    monkeypatch.setattr(tldr_service, "async_scrape_single_source_for_date", async_scrape_stub)
+
+    started = time.monotonic()
+    try:
+        result = tldr_service.scrape_newsletters_in_date_range("2026-03-01", "2026-03-02", deadline_ms=300)
+    finally:
+        release.set()
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 2, f"Expected the deadline to cut the hung source short. Got {elapsed=}"
+    assert result["stats"]["unfinished"] == [{"date": "2026-03-01", "source_id": "hackernews"}]
+    assert set(fresh_writes) == {"2026-03-02"}
+    assert [article["title"] for article in stale_writes["2026-03-01"]["articles"]] == ["tldr_tech"]
+    assert len(result["payloads"]) == 2
+
+
+def test_without_deadline_nothing_is_unfinished(monkeypatch):
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", lambda date_text, payload: None)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", _source_result)
+
+    result = tldr_service.scrape_newsletters_in_date_range("2026-03-01", "2026-03-02")
+
+    assert result["stats"]["unfinished"] == []
+
+
+def test_scrape_url_cascade_clamps_timeouts_and_stops_at_the_deadline(monkeypatch):
+    monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
+    attempts = []
+
+    def slow_failure(name):
+        def scrape(url, *, timeout):
+            attempts.append((name, timeout))
+            time.sleep(0.2)
+            raise RuntimeError(f"{name} failed")
+
+        return scrape
+
+    monkeypatch.setattr(summarizer, "_scrape_with_curl_cffi", slow_failure("curl_cffi"))
+    monkeypatch.setattr(summarizer, "_scrape_with_jina_reader", slow_failure("jina_reader"))
+    monkeypatch.setattr(summarizer, "_scrape_with_firecrawl", slow_failure("firecrawl"))
+
+    with util.deadline_scope(time.monotonic() + 0.3):
+        with pytest.raises(util.DeadlineExceeded):
+            summarizer.scrape_url("https://example.com/post")
+
+    # Firecrawl (and scrape_url's retry) never start once the deadline has passed
+    assert [name for name, _ in attempts] == ["curl_cffi", "jina_reader"]
+    assert all(timeout <= 0.3 for _, timeout in attempts)
@@ -0,0 +1,131 @@
+import threading
+import time
+
+import pytest
+
+import host_limiter
+import http_sessions
+import scrape_executor
+import util
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+
+
+def _blocked_first_task(executor, lane):
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    future = lane.submit(block)
+    assert started.wait(5)
+    return release, future
+
+
+def test_lanes_are_served_round_robin_on_a_fixed_pool():
+    executor = scrape_executor.SharedExecutor(workers=1, max_queued=100)
+    wide, narrow = executor.lane("wide", max_active=10), executor.lane("narrow", max_active=10)
+    order = []
+    release, _ = _blocked_first_task(executor, wide)
+    futures = [wide.submit(order.append, f"wide-{index}") for index in range(4)]
+    futures += [narrow.submit(order.append, f"narrow-{index}") for index in range(2)]
+
+    gauges = executor.stats()
+    assert (gauges["active"], gauges["queued"]) == (1, 6)
+    assert {lane["name"]: lane["queued"] for lane in gauges["lanes"]} == {"wide": 4, "narrow": 2}
+
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+
+    assert order == ["wide-0", "narrow-0", "wide-1", "narrow-1", "wide-2", "wide-3"]
+    assert executor.stats()["threads"] == 1
+
+
+def test_lane_never_runs_more_than_max_active_tasks():
+    executor = scrape_executor.SharedExecutor(workers=4, max_queued=100)
+    lane = executor.lane("digest-fetch", max_active=2)
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def task():
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        time.sleep(0.02)
+        with lock:
+            running["now"] -= 1
+
+    with lane:
+        futures = [lane.submit(task) for _ in range(8)]
+    assert all(future.done() for future in futures)
+    assert running["peak"] == 2
+
+
+def test_full_queue_blocks_submit_until_the_deadline():
+    executor = scrape_executor.SharedExecutor(workers=1, max_queued=1)
+    lane = executor.lane("scrape", max_active=1)
+    release, _ = _blocked_first_task(executor, lane)
+    lane.submit(lambda: None)
+
+    with util.deadline_scope(time.monotonic() + 0.1):
+        with pytest.raises(util.DeadlineExceeded):
+            lane.submit(lambda: None)
+    assert executor.stats()["backpressure_waits"] == 1
+
+    lane.shutdown(wait=False, cancel_futures=True)
+    release.set()
+
+
+def test_shutdown_cancels_queued_work_only():
+    executor = scrape_executor.SharedExecutor(workers=1, max_queued=100)
+    lane = executor.lane("scrape", max_active=1)
+    release, running = _blocked_first_task(executor, lane)
+    queued = [lane.submit(lambda: None) for _ in range(3)]
+
+    lane.shutdown(wait=False, cancel_futures=True)
+    release.set()
+
+    assert all(future.cancelled() for future in queued)
+    assert running.result(timeout=5) is None
+    assert executor.stats()["queued"] == 0
+
+
+def test_saturated_host_does_not_delay_another_hosts_fetches(monkeypatch):
+    monkeypatch.setattr(host_limiter, "_limiters", {})
+    monkeypatch.setattr(
+        host_limiter, "_configured_limits", {"throttled.example": host_limiter.HostLimit(max_concurrency=1)}
+    )
+    release_throttled = threading.Event()
+
+    def fake_get(url, **kwargs):
+        if host_limiter.resolve_host_key(url) == "throttled.example":
+            release_throttled.wait(5)
+        return _FakeResponse(200, b"ok")
+
+    monkeypatch.setattr(http_sessions, "curl_get", fake_get)
+    executor = scrape_executor.SharedExecutor(workers=3, max_queued=100)
+    lane = executor.lane("scrape", max_active=10)
+    throttled = [
+        lane.submit_to_host(url, util.fetch, url)
+        for url in (f"https://throttled.example/page/{index}" for index in range(4))
+    ]
+    open_url = "https://open.example/page"
+    open_fetch = lane.submit_to_host(open_url, util.fetch, open_url)
+
+    # Workers skip the throttled host's deferred fetches instead of parking on its slot
+    assert open_fetch.result(timeout=2).status_code == 200
+    gauges = executor.stats()
+    assert gauges["hosts"] == {"throttled.example": 1}
+    assert gauges["queued"] == 3
+
+    release_throttled.set()
+    for future in throttled:
+        assert future.result(timeout=5).status_code == 200
+    assert executor.stats()["hosts"] == {}
@@ -0,0 +1,63 @@
+import pytest
+
+import storage_service
+import tldr_service
+
+
+def _run_scrape(monkeypatch, engine, priority=None):
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", lambda date_text, payload: None)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech", "tldr_ai"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    monkeypatch.setenv("SCRAPE_ENGINE", engine)
+    monkeypatch.setenv("MAX_PARALLEL_SCRAPES", "1")
+    monkeypatch.setenv("ASYNC_MAX_IN_FLIGHT", "1")
+    dispatched = []
+
+    def scrape_stub(date, source_id, excluded_urls):
+        date_str = date.strftime("%Y-%m-%d")
+        dispatched.append((date_str, source_id))
+        return date_str, {"articles": [], "network_articles": 0, "error": None, "source_id": source_id}
+
+    async def async_scrape_stub(date, source_id, excluded_urls):
+        return scrape_stub(date, source_id, excluded_urls)
+
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+    monkeypatch.setattr(tldr_service, "async_scrape_single_source_for_date", async_scrape_stub)
+    result = tldr_service.scrape_newsletters_in_date_range("2026-03-02", "2026-03-04", priority=priority)
+    return dispatched, result
+
+
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_newest_dates_and_lowest_sort_order_are_dispatched_first(monkeypatch, engine):
+    dispatched, result = _run_scrape(monkeypatch, engine)
+
+    assert dispatched == [
+        ("2026-03-04", "tldr_ai"),
+        ("2026-03-04", "tldr_tech"),
+        ("2026-03-03", "tldr_ai"),
+        ("2026-03-03", "tldr_tech"),
+        ("2026-03-02", "tldr_ai"),
+        ("2026-03-02", "tldr_tech"),
+    ]
+    timing = result["stats"]["timing"]
+    assert set(timing) == {"first_result_ms", "first_payload_ms", "newest_date_ms", "total_ms"}
+    assert timing["first_payload_ms"] == timing["newest_date_ms"] <= timing["total_ms"]
+
+
+def test_request_priority_overrides_the_default_order(monkeypatch):
+    dispatched, _ = _run_scrape(monkeypatch, "threads", priority={"dates": "oldest", "sources": ["tldr_tech"]})
+
+    assert dispatched == [
+        ("2026-03-02", "tldr_tech"),
+        ("2026-03-02", "tldr_ai"),
+        ("2026-03-03", "tldr_tech"),
+        ("2026-03-03", "tldr_ai"),
+        ("2026-03-04", "tldr_tech"),
+        ("2026-03-04", "tldr_ai"),
+    ]
+
+
+def test_invalid_priority_is_rejected_before_scraping():
+    with pytest.raises(ValueError, match="priority.sources"):
+        tldr_service.iter_scrape_newsletters_in_date_range("2026-03-02", "2026-03-04", priority={"sources": "x"})
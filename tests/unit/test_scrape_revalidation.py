@@ -0,0 +1,124 @@
+import json
+import threading
+import time
+from datetime import datetime, timezone
+
+import serve
+import storage_service
+import tldr_service
+import util
+
+
+def _final_cached_row(date_str: str) -> dict:
+    scraped_at = datetime.fromtimestamp(
+        util.next_day_midnight_pacific_epoch_seconds(date_str) + 86400, tz=timezone.utc
+    ).isoformat()
+    meta = {"lastSuccessAt": scraped_at, "lastErrorAt": None, "lastError": None, "articleCount": 1}
+    payload = {
+        "date": date_str,
+        "articles": [{"url": "tldr.tech/cached", "title": "Cached", "sourceId": "tldr_tech"}],
+        "sourceMeta": {"tldr_tech": meta},
+    }
+    return {"date": date_str, "payload": payload, "cached_at": scraped_at}
+
+
+def _prepare(monkeypatch):
+    monkeypatch.setattr(
+        storage_service,
+        "get_daily_payloads_range",
+        lambda start, end: [row for row in [_final_cached_row("2026-03-01")] if start <= row["date"] <= end],
+    )
+    fresh_writes = {}
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", fresh_writes.__setitem__)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    release = threading.Event()
+    scraped = []
+
+    def scrape_stub(date, source_id, excluded_urls):
+        date_str = date.strftime("%Y-%m-%d")
+        scraped.append(date_str)
+        assert release.wait(5)
+        return date_str, {
+            "articles": [{"url": f"tldr.tech/{date_str}", "title": "Fresh", "date": date_str}],
+            "network_articles": 1,
+            "error": None,
+            "source_id": source_id,
+        }
+
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+    return release, scraped, fresh_writes
+
+
+def _post_swr(client):
+    return client.post(
+        "/api/scrape", json={"start_date": "2026-03-01", "end_date": "2026-03-02", "mode": "swr"}
+    ).get_json()
+
+
+def test_swr_answers_from_cache_and_revalidates_stale_dates_in_background(monkeypatch):
+    release, scraped, fresh_writes = _prepare(monkeypatch)
+    client = serve.app.test_client()
+
+    response = _post_swr(client)
+    joined = _post_swr(client)
+
+    assert [payload["date"] for payload in response["payloads"]] == ["2026-03-01"]
+    assert response["stats"]["stale_dates"] == ["2026-03-02"]
+    assert response["stats"]["cache_age_seconds"]["2026-03-01"] > 0
+    assert joined["revalidation_token"] == response["revalidation_token"], "Expected the running revalidation to be shared"
+
+    release.set()
+    url = f"/api/scrape/revalidation/{response['revalidation_token']}"
+    for _ in range(100):
+        poll = client.get(url).get_json()
+        if poll["done"]:
+            break
+        time.sleep(0.02)
+
+    assert scraped == ["2026-03-02"]
+    assert [event["type"] for event in poll["events"]] == ["payload", "stats"]
+    assert poll["events"][0]["date"] == "2026-03-02" and poll["events"][0]["source"] == "live"
+    assert "2026-03-02" in fresh_writes, "Expected the refreshed date to go through the normal persist path"
+    assert client.get(f"{url}?cursor={poll['cursor']}").get_json()["events"] == []
+
+    streamed = [json.loads(line) for line in client.get(f"{url}?stream=ndjson").get_data(as_text=True).splitlines()]
+    assert streamed == poll["events"]
+
+
+def test_json_swr_rejects_deadline_and_supersede_key():
+    client = serve.app.test_client()
+    body = {"start_date": "2026-03-01", "end_date": "2026-03-02", "mode": "swr"}
+
+    for extra in ({"deadline_ms": 5000}, {"supersede_key": "tab-1"}):
+        response = client.post("/api/scrape", json={**body, **extra})
+        assert response.status_code == 400, f"Expected {extra} to be rejected without a stream"
+        assert "stream" in response.get_json()["error"]
+
+
+def test_unknown_token_is_404():
+    assert serve.app.test_client().get("/api/scrape/revalidation/nope").status_code == 404
+
+
+def test_serverless_swr_revalidates_inside_the_streamed_response(monkeypatch):
+    monkeypatch.setenv("VERCEL", "1")
+    release, scraped, fresh_writes = _prepare(monkeypatch)
+    release.set()
+    client = serve.app.test_client()
+    body = {"start_date": "2026-03-01", "end_date": "2026-03-02", "mode": "swr"}
+
+    assert client.post("/api/scrape", json=body).status_code == 400, "Expected no background revalidation on Vercel"
+
+    response = client.post("/api/scrape", json={**body, "stream": "ndjson"})
+    events = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert [(event["type"], event.get("date"), event.get("source")) for event in events] == [
+        ("payload", "2026-03-01", "cache"),
+        ("revalidating", None, None),
+        ("payload", "2026-03-02", "live"),
+        ("stats", None, "live"),
+    ]
+    assert events[1]["stale_dates"] == ["2026-03-02"]
+    assert events[-1]["stats"]["stale_dates"] == ["2026-03-02"]
+    assert "2026-03-01" in events[-1]["stats"]["cache_age_seconds"]
+    assert scraped == ["2026-03-02"] and "2026-03-02" in fresh_writes
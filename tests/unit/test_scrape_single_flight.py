@@ -0,0 +1,192 @@
+import threading
+from collections import Counter
+
+import pytest
+
+import scrape_flights
+import storage_service
+import tldr_service
+import util
+
+
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_overlapping_scrapes_share_in_flight_work_and_write_once(monkeypatch, engine):
+    monkeypatch.setenv("SCRAPE_ENGINE", engine)
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    writes = Counter()
+    monkeypatch.setattr(
+        storage_service, "set_daily_payload_from_scrape", lambda date_text, payload: writes.update([date_text])
+    )
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    scrape_calls = Counter()
+    first_scrape_started = threading.Event()
+    release = threading.Event()
+
+    def scrape_stub(date, source_id, excluded_urls):
+        date_str = date.strftime("%Y-%m-%d")
+        scrape_calls.update([date_str])
+        first_scrape_started.set()
+        release.wait(5)
+        return date_str, {
+            "articles": [{"url": f"example.com/{date_str}", "title": date_str}],
+            "network_articles": 1,
+            "error": None,
+            "source_id": source_id,
+        }
+
+    async def async_scrape_stub(date, source_id, excluded_urls):
+        import asyncio
+
+        return await asyncio.to_thread(scrape_stub, date, source_id, excluded_urls)
+
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+    monkeypatch.setattr(tldr_service, "async_scrape_single_source_for_date", async_scrape_stub)
+    results = {}
+
+    def run(name, start_date, end_date):
+        results[name] = tldr_service.scrape_newsletters_in_date_range(start_date, end_date)
+
+    first = threading.Thread(target=run, args=("first", "2026-03-01", "2026-03-02"))
+    first.start()
+    assert first_scrape_started.wait(5)
+    second = threading.Thread(target=run, args=("second", "2026-03-02", "2026-03-03"))
+    second.start()
+    release_timer = threading.Timer(0.2, release.set)
+    release_timer.start()
+    first.join(10)
+    second.join(10)
+
+    assert scrape_calls == {"2026-03-01": 1, "2026-03-02": 1, "2026-03-03": 1}, f"Got {scrape_calls=}"
+    assert writes == {"2026-03-01": 1, "2026-03-02": 1, "2026-03-03": 1}, f"Got {writes=}"
+    assert results["second"]["stats"]["coalesced"] == {"work_items": 1, "writes_skipped": 1}
+    second_titles = {payload["date"]: [a["title"] for a in payload["articles"]] for payload in results["second"]["payloads"]}
+    assert second_titles["2026-03-02"] == ["2026-03-02"]
+
+
+def test_attached_scrape_writes_the_date_when_its_leader_stops_first(monkeypatch):
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    writes = Counter()
+    monkeypatch.setattr(
+        storage_service, "set_daily_payload_from_scrape", lambda date_text, payload: writes.update([date_text])
+    )
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    tldr_started, release_tldr, release_hackernews = threading.Event(), threading.Event(), threading.Event()
+
+    def scrape_stub(date, source_id, excluded_urls):
+        date_str = date.strftime("%Y-%m-%d")
+        if source_id == "tldr_tech":
+            tldr_started.set()
+            assert release_tldr.wait(5)
+        else:
+            # Outlives the leader's deadline, so the leader never finalizes the date
+            release_hackernews.wait(5)
+        return date_str, {
+            "articles": [{"url": f"example.com/{source_id}", "title": source_id}],
+            "network_articles": 1,
+            "error": None,
+            "source_id": source_id,
+        }
+
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+    follower_attached = threading.Event()
+    claim = scrape_flights.claim
+
+    def recording_claim(*args):
+        flight, is_leader = claim(*args)
+        if not is_leader:
+            follower_attached.set()
+        return flight, is_leader
+
+    monkeypatch.setattr(scrape_flights, "claim", recording_claim)
+    results = {}
+
+    def run(name, source_ids, deadline_ms=None):
+        results[name] = tldr_service.scrape_newsletters_in_date_range(
+            "2026-03-02", "2026-03-02", source_ids=source_ids, deadline_ms=deadline_ms
+        )
+
+    leader = threading.Thread(target=run, args=("leader", ["tldr_tech", "hackernews"], 300))
+    leader.start()
+    assert tldr_started.wait(5)
+    follower = threading.Thread(target=run, args=("follower", ["tldr_tech"]))
+    follower.start()
+    assert follower_attached.wait(5)
+    release_tldr.set()
+    leader.join(5)
+    follower.join(5)
+    release_hackernews.set()
+
+    assert results["leader"]["stats"]["unfinished"] == [{"date": "2026-03-02", "source_id": "hackernews"}]
+    assert results["follower"]["stats"]["coalesced"] == {"work_items": 1, "writes_skipped": 0}
+    assert writes == {"2026-03-02": 1}, f"Expected the attached scrape to persist the date. Got {writes=}"
+
+
+@pytest.mark.parametrize("engine", ["threads", "asyncio"])
+def test_attached_scrape_rescrapes_the_pair_when_its_leader_is_cancelled(monkeypatch, engine):
+    monkeypatch.setenv("SCRAPE_ENGINE", engine)
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    writes = {}
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", writes.__setitem__)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    leader_started, release_leader = threading.Event(), threading.Event()
+    scrape_calls = []
+
+    def scrape_stub(date, source_id, excluded_urls):
+        date_str = date.strftime("%Y-%m-%d")
+        scrape_calls.append(date_str)
+        if len(scrape_calls) == 1:
+            leader_started.set()
+            release_leader.wait(5)
+        return date_str, {
+            "articles": [{"url": f"example.com/{date_str}", "title": date_str}],
+            "network_articles": 1,
+            "error": None,
+            "source_id": source_id,
+        }
+
+    async def async_scrape_stub(date, source_id, excluded_urls):
+        import asyncio
+
+        return await asyncio.to_thread(scrape_stub, date, source_id, excluded_urls)
+
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+    monkeypatch.setattr(tldr_service, "async_scrape_single_source_for_date", async_scrape_stub)
+    follower_attached = threading.Event()
+    claim = scrape_flights.claim
+
+    def recording_claim(*args):
+        flight, is_leader = claim(*args)
+        if not is_leader:
+            follower_attached.set()
+        return flight, is_leader
+
+    monkeypatch.setattr(scrape_flights, "claim", recording_claim)
+    leader_token = util.CancelToken()
+    results = {}
+
+    def run(name, cancel_token=None):
+        results[name] = tldr_service.scrape_newsletters_in_date_range(
+            "2026-03-02", "2026-03-02", cancel_token=cancel_token
+        )
+
+    leader = threading.Thread(target=run, args=("leader", leader_token))
+    leader.start()
+    assert leader_started.wait(5)
+    follower = threading.Thread(target=run, args=("follower",))
+    follower.start()
+    assert follower_attached.wait(5)
+    leader_token.cancel("client_disconnected")
+    follower.join(5)
+    release_leader.set()
+    leader.join(5)
+
+    (payload,) = results["follower"]["payloads"]
+    assert [article["title"] for article in payload["articles"]] == ["2026-03-02"], (
+        f"Expected the follower to scrape the pair itself. Got {payload=!r}"
+    )
+    meta = payload["sourceMeta"]["tldr_tech"]
+    assert meta["lastError"] is None and meta["lastSuccessAt"] is not None
+    assert scrape_calls == ["2026-03-02", "2026-03-02"]
+    assert "2026-03-02" in writes
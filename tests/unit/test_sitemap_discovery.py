@@ -0,0 +1,134 @@
+import functools
+from datetime import date
+
+from adapters import sitemap_discovery
+from adapters.claude_blog_adapter import ClaudeBlogAdapter
+from adapters.deepmind_adapter import DeepMindAdapter
+from newsletter_config import NEWSLETTER_CONFIGS
+import summarizer
+import util
+
+
+# Noon Pacific on 2026-03-04: that date is still open, so its scrape is not final
+OPEN_DAY_NOW = util.next_day_midnight_pacific_epoch_seconds("2026-03-04") - 12 * 3600
+
+
+def _urlset(*urls: tuple[str, str]) -> bytes:
+    entries = "".join(f"<url><loc>{loc}</loc><lastmod>{lastmod}</lastmod></url>" for loc, lastmod in urls)
+    return f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>'.encode("utf-8")
+
+
+def _serve_sitemaps(monkeypatch, config_key: str, bodies: dict[str, bytes], now: float = OPEN_DAY_NOW) -> list[str]:
+    config = NEWSLETTER_CONFIGS[config_key]
+    monkeypatch.setattr(config, "sitemap_url", next(iter(bodies)))
+    monkeypatch.setattr(
+        sitemap_discovery,
+        "_is_final_scrape",
+        functools.partial(sitemap_discovery._is_final_scrape, now_epoch_seconds=now),
+    )
+    fetched = []
+
+    def fake_fetch_sitemap(url):
+        fetched.append(url)
+        return bodies[url]
+
+    monkeypatch.setattr(sitemap_discovery, "_fetch_sitemap", fake_fetch_sitemap)
+    return fetched
+
+
+def test_index_children_older_than_the_window_are_not_fetched(monkeypatch):
+    fetched = _serve_sitemaps(
+        monkeypatch,
+        "claude_blog",
+        {
+            "https://claude.com/sitemap.xml": b"""<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+                <sitemap><loc>https://claude.com/sitemap-blog.xml</loc><lastmod>2026-03-04T08:00:00Z</lastmod></sitemap>
+                <sitemap><loc>https://claude.com/sitemap-2025.xml</loc><lastmod>2025-12-31</lastmod></sitemap>
+            </sitemapindex>""",
+            "https://claude.com/sitemap-blog.xml": _urlset(
+                ("https://claude.com/blog", "2026-03-04"),
+                ("https://claude.com/blog/new-post", "2026-03-04T08:00:00Z"),
+                ("https://claude.com/blog/old-post", "2026-01-10"),
+                ("https://claude.com/pricing", "2026-03-04"),
+            ),
+        },
+    )
+
+    post_urls = sitemap_discovery.discover_post_urls(NEWSLETTER_CONFIGS["claude_blog"], date(2026, 3, 4))
+
+    assert post_urls == {"claude.com/blog/new-post"}, f"Expected only the fresh post. Got {post_urls=!r}"
+    assert fetched == ["https://claude.com/sitemap.xml", "https://claude.com/sitemap-blog.xml"]
+
+
+def test_no_fresh_post_skips_the_listing_page(monkeypatch):
+    _serve_sitemaps(
+        monkeypatch,
+        "claude_blog",
+        {"https://claude.com/sitemap.xml": _urlset(("https://claude.com/blog/old-post", "2026-01-10"))},
+    )
+    monkeypatch.setattr(summarizer, "url_to_markdown", lambda url: (_ for _ in ()).throw(AssertionError(url)))
+
+    result = ClaudeBlogAdapter(NEWSLETTER_CONFIGS["claude_blog"]).scrape_date("2026-03-04", excluded_urls=[])
+
+    assert result["articles"] == []
+
+
+def test_final_scrape_reads_the_listing_even_when_the_sitemap_lags(monkeypatch):
+    fetched = _serve_sitemaps(
+        monkeypatch,
+        "claude_blog",
+        {"https://claude.com/sitemap.xml": _urlset(("https://claude.com/blog/old-post", "2026-01-10"))},
+        now=util.next_day_midnight_pacific_epoch_seconds("2026-03-04") + 3600,
+    )
+    monkeypatch.setattr(
+        summarizer,
+        "url_to_markdown",
+        lambda url: "March 4, 2026\n[New post](</blog/new-post>)",
+    )
+
+    result = ClaudeBlogAdapter(NEWSLETTER_CONFIGS["claude_blog"]).scrape_date("2026-03-04", excluded_urls=[])
+
+    assert fetched == [], "Expected the sitemap gate to be skipped for a final scrape"
+    assert [article["title"] for article in result["articles"]] == ["New post"]
+
+
+def test_unreadable_sitemap_falls_back_to_the_listing_page(monkeypatch):
+    _serve_sitemaps(monkeypatch, "claude_blog", {"https://claude.com/sitemap.xml": b"<html>not a sitemap"})
+    monkeypatch.setattr(
+        summarizer,
+        "url_to_markdown",
+        lambda url: "March 4, 2026\n[New post](</blog/new-post>)",
+    )
+
+    result = ClaudeBlogAdapter(NEWSLETTER_CONFIGS["claude_blog"]).scrape_date("2026-03-04", excluded_urls=[])
+
+    assert [article["title"] for article in result["articles"]] == ["New post"]
+
+
+def test_deepmind_fetches_only_article_pages_modified_since_the_date(monkeypatch):
+    _serve_sitemaps(
+        monkeypatch,
+        "deepmind",
+        {
+            "https://deepmind.google/sitemap.xml": _urlset(
+                ("https://deepmind.google/discover/blog/fresh/", "2026-03-05"),
+                ("https://deepmind.google/discover/blog/stale/", "2025-11-02"),
+            )
+        },
+    )
+    adapter = DeepMindAdapter(NEWSLETTER_CONFIGS["deepmind"])
+    cards = "".join(
+        f'<article class="card-blog"><h3 class="card__title">{slug}</h3>'
+        f'<a class="button" href="/discover/blog/{slug}/">Read</a></article>'
+        for slug in ("fresh", "stale")
+    )
+    monkeypatch.setattr(adapter, "_fetch_page", lambda: f"<html>{cards}</html>".encode("utf-8"))
+    article_pages = []
+    monkeypatch.setattr(
+        adapter, "_fetch_article_publish_date", lambda url: article_pages.append(url) or "2026-03-04"
+    )
+
+    result = adapter.scrape_date("2026-03-04", excluded_urls=[])
+
+    assert article_pages == ["https://deepmind.google/discover/blog/fresh/"]
+    assert [article["title"] for article in result["articles"]] == ["fresh"]
@@ -0,0 +1,108 @@
+import asyncio
+from datetime import date
+
+from adapters.newsletter_adapter import NewsletterAdapter
+from newsletter_config import NEWSLETTER_CONFIGS
+import newsletter_scraper
+import storage_service
+import tldr_service
+import util
+
+
+class _DownAdapter(NewsletterAdapter):
+    calls = 0
+
+    def scrape_date(self, date, excluded_urls):
+        type(self).calls += 1
+        raise ConnectionError("source is down")
+
+    def scrape_range(self, start_date, end_date, excluded_urls):
+        type(self).calls += 1
+        raise ConnectionError("source is down")
+
+
+def _run_scrape(monkeypatch, start_date: str, end_date: str) -> dict:
+    monkeypatch.setattr(storage_service, "get_daily_payloads_range", lambda start, end: [])
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", lambda date_text, payload: None)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    return tldr_service.scrape_newsletters_in_date_range(start_date, end_date)
+
+
+def test_open_breaker_skips_the_rest_of_a_down_source(monkeypatch):
+    monkeypatch.setenv("MAX_PARALLEL_SCRAPES", "1")
+    monkeypatch.setenv("SOURCE_BREAKER_FAILURE_THRESHOLD", "2")
+    _DownAdapter.calls = 0
+    adapter = _DownAdapter(NEWSLETTER_CONFIGS["tldr_tech"])
+    monkeypatch.setattr(newsletter_scraper, "_get_adapter_for_source", lambda config: adapter)
+
+    result = _run_scrape(monkeypatch, "2026-03-01", "2026-03-10")
+
+    assert _DownAdapter.calls == 2, f"Expected the breaker to stop calls after 2 failures. Got {_DownAdapter.calls=}"
+    assert result["stats"]["circuit_breaker"]["skipped"] == {"tldr_tech": 8}
+    health = result["stats"]["circuit_breaker"]["sources"]["tldr_tech"]
+    assert health["state"] == "open"
+    assert health["failures"] == 2
+    assert len(result["payloads"]) == 10
+
+
+def test_breaker_state_is_shared_with_the_next_request(monkeypatch):
+    monkeypatch.setenv("SOURCE_BREAKER_FAILURE_THRESHOLD", "1")
+    _DownAdapter.calls = 0
+    adapter = _DownAdapter(NEWSLETTER_CONFIGS["tldr_tech"])
+    monkeypatch.setattr(newsletter_scraper, "_get_adapter_for_source", lambda config: adapter)
+
+    _run_scrape(monkeypatch, "2026-03-01", "2026-03-01")
+    second = _run_scrape(monkeypatch, "2026-03-02", "2026-03-03")
+
+    assert _DownAdapter.calls == 1
+    assert second["stats"]["circuit_breaker"]["skipped"] == {"tldr_tech": 2}
+
+
+class _CancelledAdapter(NewsletterAdapter):
+    def scrape_date(self, date, excluded_urls):
+        raise util.ScrapeCancelled("scrape cancelled")
+
+
+def test_cancelled_half_open_probe_is_given_back(monkeypatch):
+    monkeypatch.setenv("SOURCE_BREAKER_FAILURE_THRESHOLD", "1")
+    monkeypatch.setenv("SOURCE_BREAKER_COOLDOWN_SECONDS", "0")
+    breaker = newsletter_scraper.get_source_breaker("tldr_tech")
+    breaker.record(False, 50.0)
+    adapter = _CancelledAdapter(NEWSLETTER_CONFIGS["tldr_tech"])
+    monkeypatch.setattr(newsletter_scraper, "_get_adapter_for_source", lambda config: adapter)
+    cancel_token = util.CancelToken()
+    cancel_token.cancel("client_disconnected")
+
+    with util.cancel_scope(cancel_token):
+        _, result = newsletter_scraper.scrape_single_source_for_date(date(2026, 3, 1), "tldr_tech", [])
+
+    assert result["error"]
+    assert breaker.snapshot()["failures"] == 1, "Expected the cancelled probe not to count as a failure"
+    assert breaker.state == "half_open" and not breaker.is_open()
+    assert breaker.allow(), "Expected the next task to be allowed to probe"
+
+
+def test_sync_and_async_scrapes_report_failures_the_same_way(monkeypatch):
+    monkeypatch.setenv("SOURCE_BREAKER_FAILURE_THRESHOLD", "100")
+    _DownAdapter.calls = 0
+    adapter = _DownAdapter(NEWSLETTER_CONFIGS["tldr_tech"])
+    monkeypatch.setattr(newsletter_scraper, "_get_adapter_for_source", lambda config: adapter)
+    start, end = date(2026, 3, 1), date(2026, 3, 2)
+
+    sync_results = [
+        newsletter_scraper.scrape_single_source_for_date(start, "tldr_tech", []),
+        *newsletter_scraper.scrape_single_source_for_range(start, end, "tldr_tech", []),
+    ]
+    async_results = [
+        asyncio.run(newsletter_scraper.async_scrape_single_source_for_date(start, "tldr_tech", [])),
+        *asyncio.run(newsletter_scraper.async_scrape_single_source_for_range(start, end, "tldr_tech", [])),
+    ]
+
+    assert sync_results == async_results
+    assert [(date_str, result["error"]) for date_str, result in sync_results] == [
+        ("2026-03-01", "source is down"),
+        ("2026-03-01", "source is down"),
+        ("2026-03-02", "source is down"),
+    ]
+    assert newsletter_scraper.get_source_breaker("tldr_tech").snapshot()["failures"] == 4 == _DownAdapter.calls
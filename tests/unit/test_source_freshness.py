@@ -0,0 +1,121 @@
+import time
+from datetime import datetime, timezone
+
+from newsletter_config import NEWSLETTER_CONFIGS
+
+import storage_service
+import tldr_service
+import util
+
+
+def _iso(epoch_seconds: float) -> str:
+    return datetime.fromtimestamp(epoch_seconds, tz=timezone.utc).isoformat()
+
+
+def _run_scrape(
+    monkeypatch, cached_payload: dict, date_str: str = "2026-03-02", cached_at: str = _iso(0)
+) -> tuple[list, dict, dict]:
+    monkeypatch.setattr(
+        storage_service,
+        "get_daily_payloads_range",
+        lambda start, end: [{"date": date_str, "payload": cached_payload, "cached_at": cached_at}],
+    )
+    writes = {}
+    monkeypatch.setattr(storage_service, "set_daily_payload_from_scrape", writes.__setitem__)
+    monkeypatch.setattr(tldr_service, "get_default_source_ids", lambda: ["tldr_tech", "hackernews"])
+    monkeypatch.setattr(tldr_service, "source_supports_range_scrape", lambda source_id: False)
+    scraped = []
+
+    def scrape_stub(date, source_id, excluded_urls):
+        scraped.append(source_id)
+        return date_str, {
+            "articles": [{"url": "news.ycombinator.com/item?id=1", "title": "HN", "source_id": source_id}],
+            "network_articles": 1,
+            "error": None,
+            "source_id": source_id,
+        }
+
+    monkeypatch.setattr(tldr_service, "scrape_single_source_for_date", scrape_stub)
+    result = tldr_service.scrape_newsletters_in_date_range(date_str, date_str)
+    return scraped, writes, result
+
+
+def test_only_failed_source_is_rescraped_and_merged_into_cached_payload(monkeypatch):
+    final_at = _iso(util.next_day_midnight_pacific_epoch_seconds("2026-03-02") + 60)
+    cached_payload = {
+        "date": "2026-03-02",
+        "articles": [{"url": "tldr.tech/a", "title": "A", "sourceId": "tldr_tech"}],
+        "sourceMeta": {
+            "tldr_tech": {"lastSuccessAt": final_at, "lastErrorAt": None, "lastError": None, "articleCount": 1},
+            "hackernews": {"lastSuccessAt": None, "lastErrorAt": final_at, "lastError": "boom", "articleCount": 0},
+        },
+    }
+
+    scraped, writes, _ = _run_scrape(monkeypatch, cached_payload)
+
+    assert scraped == ["hackernews"], f"Expected only the failed source to be queued. Got {scraped=!r}"
+    payload = writes["2026-03-02"]
+    assert [article["sourceId"] for article in payload["articles"]] == ["hackernews", "tldr_tech"]
+    assert payload["sourceMeta"]["hackernews"]["lastError"] is None
+    assert payload["sourceMeta"]["hackernews"]["articleCount"] == 1
+    assert payload["sourceMeta"]["tldr_tech"]["lastSuccessAt"] == final_at
+
+
+def test_settle_time_keeps_fast_moving_source_stale_after_midnight(monkeypatch):
+    just_after_midnight = _iso(util.next_day_midnight_pacific_epoch_seconds("2026-03-02") + 3600)
+    meta = {"lastSuccessAt": just_after_midnight, "lastErrorAt": None, "lastError": None, "articleCount": 0}
+    cached_payload = {
+        "date": "2026-03-02",
+        "articles": [],
+        "sourceMeta": {"tldr_tech": dict(meta), "hackernews": dict(meta)},
+    }
+
+    scraped, _, _ = _run_scrape(monkeypatch, cached_payload)
+
+    assert scraped == ["hackernews"]
+
+
+def test_fully_fresh_per_source_meta_serves_from_cache(monkeypatch):
+    settled_at = _iso(util.next_day_midnight_pacific_epoch_seconds("2026-03-02") + 2 * 86400)
+    meta = {"lastSuccessAt": settled_at, "lastErrorAt": None, "lastError": None, "articleCount": 0}
+    cached_payload = {
+        "date": "2026-03-02",
+        "articles": [],
+        "sourceMeta": {"tldr_tech": dict(meta), "hackernews": dict(meta)},
+    }
+
+    scraped, writes, result = _run_scrape(monkeypatch, cached_payload)
+
+    assert scraped == []
+    assert writes == {}
+    assert result["source"] == "cache"
+
+
+def _today_scraped_minutes_ago(minutes: float) -> tuple[str, str, dict]:
+    today = datetime.now(util.PACIFIC_TZ).date().isoformat()
+    scraped_at = _iso(time.time() - minutes * 60)
+    meta = {"lastSuccessAt": scraped_at, "lastErrorAt": None, "lastError": None, "articleCount": 0}
+    cached_payload = {"date": today, "articles": [], "sourceMeta": {"tldr_tech": dict(meta), "hackernews": dict(meta)}}
+    return today, scraped_at, cached_payload
+
+
+def test_today_inside_the_cooldown_is_served_from_cache(monkeypatch):
+    monkeypatch.setenv("RESCRAPE_COOLDOWN_MINUTES", "10")
+    today, scraped_at, cached_payload = _today_scraped_minutes_ago(3)
+
+    scraped, writes, result = _run_scrape(monkeypatch, cached_payload, today, scraped_at)
+
+    assert (scraped, writes, result["source"]) == ([], {}, "cache")
+    cache_age = result["stats"]["cache_age_seconds"][today]
+    assert 170 <= cache_age <= 190, f"Expected the served cache to be about 3 minutes old. Got {cache_age=!r}"
+
+
+def test_per_source_cooldown_overrides_the_global_one(monkeypatch):
+    monkeypatch.setenv("RESCRAPE_COOLDOWN_MINUTES", "10")
+    monkeypatch.setattr(NEWSLETTER_CONFIGS["hackernews"], "rescrape_cooldown_minutes", 2)
+    today, scraped_at, cached_payload = _today_scraped_minutes_ago(3)
+
+    scraped, _, result = _run_scrape(monkeypatch, cached_payload, today, scraped_at)
+
+    assert scraped == ["hackernews"]
+    assert result["stats"]["cache_age_seconds"] == {}, "Expected no date to be served purely from cache"
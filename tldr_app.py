@@ -1,14 +1,25 @@
 import logging
 from typing import Optional
 
+import exclusion_sets
+import scrape_revalidation
 import tldr_service
 from summarizer import DEFAULT_MODEL, DEFAULT_THINKING_EFFORT
 
 logger = logging.getLogger("tldr_app")
 
+UnknownExclusionSet = exclusion_sets.UnknownExclusionSet
+
 
 def scrape_newsletters(
-    start_date_text: str, end_date_text: str, source_ids: list[str] | None = None, excluded_urls: list[str] | None = None
+    start_date_text: str,
+    end_date_text: str,
+    source_ids: list[str] | None = None,
+    excluded_urls: list[str] | None = None,
+    deadline_ms: int | None = None,
+    cancel_token=None,
+    supersede_key: str | None = None,
+    priority: dict | None = None,
 ) -> dict:
     """Scrape newsletters in date range.
 
@@ -17,15 +28,144 @@ def scrape_newsletters(
         end_date_text: End date in ISO format
         source_ids: Optional list of source IDs to scrape. Defaults to all configured sources.
         excluded_urls: List of canonical URLs to exclude from results
+        deadline_ms: Optional time budget; sources still running when it expires are left unfinished
+        cancel_token: Optional util.CancelToken; cancelling it stops the remaining work
+        supersede_key: Optional key; a newer scrape with the same key cancels this one
+        priority: Optional dispatch priority {"dates": "newest" | "oldest" | "none", "sources": [...]}
 
     Returns:
         Response dictionary with articles and issues
     """
     return tldr_service.scrape_newsletters_in_date_range(
-        start_date_text, end_date_text, source_ids=source_ids, excluded_urls=excluded_urls
+        start_date_text,
+        end_date_text,
+        source_ids=source_ids,
+        excluded_urls=excluded_urls,
+        deadline_ms=deadline_ms,
+        cancel_token=cancel_token,
+        supersede_key=supersede_key,
+        priority=priority,
+    )
+
+
+def iter_scrape_newsletters(
+    start_date_text: str,
+    end_date_text: str,
+    source_ids: list[str] | None = None,
+    excluded_urls: list[str] | None = None,
+    deadline_ms: int | None = None,
+    supersede_key: str | None = None,
+    priority: dict | None = None,
+):
+    """Scrape newsletters in date range, yielding per-date payload events as they complete.
+
+    Args:
+        start_date_text: Start date in ISO format
+        end_date_text: End date in ISO format
+        source_ids: Optional list of source IDs to scrape. Defaults to all configured sources.
+        excluded_urls: List of canonical URLs to exclude from results
+        deadline_ms: Optional time budget; sources still running when it expires are left unfinished
+        supersede_key: Optional key; a newer scrape with the same key cancels this one
+        priority: Optional dispatch priority {"dates": "newest" | "oldest" | "none", "sources": [...]}
+
+    Returns:
+        Iterator of payload events followed by a final stats event. Closing it early cancels
+        the remaining work
+    """
+    return tldr_service.iter_scrape_newsletters_in_date_range(
+        start_date_text,
+        end_date_text,
+        source_ids=source_ids,
+        excluded_urls=excluded_urls,
+        deadline_ms=deadline_ms,
+        supersede_key=supersede_key,
+        priority=priority,
+    )
+
+
+def scrape_newsletters_stale_while_revalidate(
+    start_date_text: str,
+    end_date_text: str,
+    source_ids: list[str] | None = None,
+    excluded_urls: list[str] | None = None,
+    priority: dict | None = None,
+) -> dict:
+    """Return cached payloads immediately and refresh stale dates in the background.
+
+    Args:
+        start_date_text: Start date in ISO format
+        end_date_text: End date in ISO format
+        source_ids: Optional list of source IDs to scrape. Defaults to all configured sources.
+        excluded_urls: List of canonical URLs to exclude from results
+        priority: Optional dispatch priority {"dates": "newest" | "oldest" | "none", "sources": [...]}
+
+    Returns:
+        Response dictionary with the cached payloads, their ages and stale dates in stats,
+        and a revalidation_token for reading the refreshed payloads (None if nothing was stale)
+    """
+    return tldr_service.scrape_stale_while_revalidate(
+        start_date_text,
+        end_date_text,
+        source_ids=source_ids,
+        excluded_urls=excluded_urls,
+        priority=priority,
     )
 
 
+def iter_scrape_newsletters_stale_while_revalidate(
+    start_date_text: str,
+    end_date_text: str,
+    source_ids: list[str] | None = None,
+    excluded_urls: list[str] | None = None,
+    deadline_ms: int | None = None,
+    supersede_key: str | None = None,
+    priority: dict | None = None,
+):
+    """Yield cached payloads at once, then refresh the stale dates within the same request.
+
+    Args:
+        start_date_text: Start date in ISO format
+        end_date_text: End date in ISO format
+        source_ids: Optional list of source IDs to scrape. Defaults to all configured sources.
+        excluded_urls: List of canonical URLs to exclude from results
+        deadline_ms: Optional time budget for the refresh
+        supersede_key: Optional key; a newer scrape with the same key cancels this one
+        priority: Optional dispatch priority {"dates": "newest" | "oldest" | "none", "sources": [...]}
+
+    Returns:
+        Iterator of cached payload events, a revalidating event listing the stale dates,
+        then the refresh's payload events and a final stats event
+    """
+    return tldr_service.iter_scrape_stale_while_revalidate(
+        start_date_text,
+        end_date_text,
+        source_ids=source_ids,
+        excluded_urls=excluded_urls,
+        deadline_ms=deadline_ms,
+        supersede_key=supersede_key,
+        priority=priority,
+    )
+
+
+def get_scrape_revalidation(token: str):
+    """Return the background revalidation for token, or None if it is unknown or expired."""
+    return scrape_revalidation.get(token)
+
+
+def create_exclusion_set(urls: list[str]) -> dict:
+    """Store an exclusion set and shape the response for the HTTP layer."""
+    set_id, url_set = exclusion_sets.put(urls)
+    return {"success": True, "exclusion_set_id": set_id, "url_count": len(url_set)}
+
+
+def resolve_excluded_urls(excluded_urls: list[str], exclusion_set_id: str | None) -> frozenset[str]:
+    """Return a scrape's exclusions: the referenced stored set plus any inline URLs.
+
+    Raises UnknownExclusionSet when exclusion_set_id is not stored.
+    """
+    return exclusion_sets.resolve(excluded_urls, exclusion_set_id)
+
+
 def generate_digest(articles: list[dict], effort: str = "low") -> dict:
     """Generate a multi-article digest and return the shaped response payload."""
     result = tldr_service.generate_digest(articles, effort)
@@ -1,20 +1,43 @@
+import asyncio
+import contextvars
+import functools
 import html as html_module
 import logging
+import queue
 import re
+import threading
+import time
 import urllib.parse as urlparse
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, as_completed, wait
 from datetime import date as date_type
-from datetime import datetime
+from datetime import datetime, timezone
 
 import requests
 
+import fetch_cache
+import host_limiter
+import http_sessions
+import missing_issue_store
+import payload_writer
+import publish_calendar
+import scrape_executor
+import scrape_flights
+import scrape_revalidation
 import storage_service
 import util
+from newsletter_config import NEWSLETTER_CONFIGS
 from newsletter_scraper import (
+    async_scrape_single_source_for_date,
+    async_scrape_single_source_for_range,
     get_default_source_ids,
+    get_missing_issue_keys,
+    get_source_breaker,
     merge_source_results_for_date,
     scrape_single_source_for_date,
+    scrape_single_source_for_range,
+    source_health_stats,
+    source_supports_range_scrape,
 )
 import summarizer
 from summarizer import (
@@ -148,11 +171,778 @@ def _build_stats_from_payloads(payloads: list[dict], total_network_fetches: int)
     }
 
 
+def _load_cached_range(start_date_text: str, end_date_text: str) -> tuple[dict[str, dict], dict[str, float | None]]:
+    """Fetch the range's cached payloads in one query: ({date: payload}, {date: cached_at epoch})."""
+    cache_map: dict[str, dict] = {}
+    cached_at_epoch_map: dict[str, float | None] = {}
+    for row in storage_service.get_daily_payloads_range(start_date_text, end_date_text):
+        date_key = row['date']
+        cache_map[date_key] = row['payload']
+        cached_at_iso = row['cached_at']
+        if cached_at_iso is None:
+            cached_at_epoch_map[date_key] = None
+        else:
+            cached_at_epoch_map[date_key] = util.parse_cached_at_epoch_seconds(cached_at_iso)
+    return cache_map, cached_at_epoch_map
+
+
+def _stale_source_ids_by_date(
+    dates, source_ids: list[str], cache_map: dict[str, dict], cached_at_epoch_map: dict[str, float | None]
+) -> dict[str, list[str]]:
+    """Only sources whose own scrape of a date is stale or failed get rescraped."""
+    stale_source_ids_by_date: dict[str, list[str]] = {}
+    for current_date in dates:
+        date_str = util.format_date_for_url(current_date)
+        stale_source_ids_by_date[date_str] = [
+            source_id
+            for source_id in source_ids
+            if _source_needs_rescrape(
+                date_str, cache_map.get(date_str), cached_at_epoch_map.get(date_str), source_id
+            )
+        ]
+    return stale_source_ids_by_date
+
+
+def _plan_source_work(
+    stale_source_ids_by_date: dict[str, list[str]], source_ids: list[str]
+) -> tuple[dict[str, list[str]], dict]:
+    """Drop the stale sources a scrape would skip anyway, returning ({date: source_ids to scrape}, skips).
+
+    Open breakers, the publish calendar and the missing-issue cache predict that a scrape
+    of (date, source) finds nothing, so such pairs are not work, and a cached date whose
+    stale sources are all skipped counts as fresh. Range (feed) sources are only skipped
+    for an open breaker. skips is {"calendar": n, "missing_issue": n, "breaker": {source_id: n}}.
+    """
+    skips = {"calendar": 0, "missing_issue": 0, "breaker": defaultdict(int)}
+    work_source_ids_by_date: dict[str, list[str]] = {date_str: [] for date_str in stale_source_ids_by_date}
+    if not any(stale_source_ids_by_date.values()):
+        return work_source_ids_by_date, skips
+
+    stale_source_ids = {source_id for ids in stale_source_ids_by_date.values() for source_id in ids}
+    range_source_ids = {source_id for source_id in stale_source_ids if source_supports_range_scrape(source_id)}
+    missing_issue_entries = missing_issue_store.load_entries(
+        [source_id for source_id in source_ids if source_id in stale_source_ids and source_id not in range_source_ids]
+    )
+    publish_cadence = publish_calendar.get_learned_cadence()
+    # Sources whose breaker is open are skipped up front; tasks re-check when they start
+    open_source_ids = {source_id for source_id in stale_source_ids if get_source_breaker(source_id).is_open()}
+    for date_str, stale_source_ids in stale_source_ids_by_date.items():
+        for source_id in stale_source_ids:
+            if source_id in open_source_ids:
+                skips["breaker"][source_id] += 1
+                continue
+            if source_id in range_source_ids:
+                work_source_ids_by_date[date_str].append(source_id)
+                continue
+            # Days the source does not publish on, by its static or learned calendar
+            if not publish_calendar.can_publish_on(source_id, date_str, publish_cadence):
+                skips["calendar"] += 1
+                continue
+            # Weekends, holidays and unpublished issues already answered 404/redirect
+            if missing_issue_store.all_known_missing(
+                missing_issue_entries, source_id, get_missing_issue_keys(source_id, date_str)
+            ):
+                skips["missing_issue"] += 1
+                continue
+            work_source_ids_by_date[date_str].append(source_id)
+    return work_source_ids_by_date, skips
+
+
+def _cache_ages(served_payloads: dict[str, dict], cached_at_epoch_map: dict[str, float | None]) -> dict:
+    """Return {date: seconds since its served cached payload was written}, newest date first.
+
+    >>> _cache_ages({"2026-03-01": {}, "2026-03-02": {}}, {"2026-03-01": time.time() - 90, "2026-03-02": None})
+    {'2026-03-02': None, '2026-03-01': 90.0}
+    """
+    now = time.time()
+    ages = {}
+    for date_str in sorted(served_payloads, reverse=True):
+        cached_at_epoch = cached_at_epoch_map.get(date_str)
+        ages[date_str] = None if cached_at_epoch is None else round(now - cached_at_epoch, 1)
+    return ages
+
+
+def _source_scraped_at_epoch(
+    cached_payload: dict | None, cached_at_epoch: float | None, source_id: str
+) -> float | None:
+    """Return when source_id last scraped this date successfully, from the payload's sourceMeta.
+
+    Payloads written before sourceMeta existed fall back to the date-level cached_at. A
+    source whose latest attempt failed counts as never scraped.
+
+    >>> _source_scraped_at_epoch({"articles": []}, 100.0, "hackernews")
+    100.0
+    >>> meta = {"hackernews": {"lastSuccessAt": "2025-01-01T00:00:00+00:00", "lastErrorAt": None}}
+    >>> _source_scraped_at_epoch({"sourceMeta": meta}, 100.0, "hackernews")
+    1735689600.0
+    >>> _source_scraped_at_epoch({"sourceMeta": meta}, 100.0, "tldr_tech") is None
+    True
+    """
+    if cached_payload is None:
+        return None
+    if "sourceMeta" not in cached_payload:
+        return cached_at_epoch
+
+    meta = cached_payload["sourceMeta"].get(source_id)
+    if meta is None or meta.get("lastSuccessAt") is None:
+        return None
+    last_success_epoch = util.parse_cached_at_epoch_seconds(meta["lastSuccessAt"])
+    if meta.get("lastErrorAt") and util.parse_cached_at_epoch_seconds(meta["lastErrorAt"]) > last_success_epoch:
+        return None
+    return last_success_epoch
+
+
+def _rescrape_cooldown_seconds(source_id: str) -> float:
+    """Minimum age of a source's scrape of an in-progress date before it is rescraped.
+
+    The source's rescrape_cooldown_minutes wins over RESCRAPE_COOLDOWN_MINUTES (default 10).
+    """
+    config = NEWSLETTER_CONFIGS.get(source_id)
+    if config is not None and config.rescrape_cooldown_minutes is not None:
+        return config.rescrape_cooldown_minutes * 60.0
+    return float(util.resolve_env_var("RESCRAPE_COOLDOWN_MINUTES", "10")) * 60.0
+
+
+def _source_needs_rescrape(
+    date_str: str, cached_payload: dict | None, cached_at_epoch: float | None, source_id: str
+) -> bool:
+    """Apply the source's freshness policy (util.should_rescrape plus its settle time and cooldown) to one date."""
+    config = NEWSLETTER_CONFIGS.get(source_id)
+    settle_hours = config.rescrape_settle_hours if config else 0
+    return util.should_rescrape(
+        date_str,
+        _source_scraped_at_epoch(cached_payload, cached_at_epoch, source_id),
+        settle_seconds=settle_hours * 3600,
+        cooldown_seconds=_rescrape_cooldown_seconds(source_id),
+    )
+
+
+def _build_source_meta(
+    cached_payload: dict | None, payload: dict, source_results: list[tuple[str, dict]], scraped_at_iso: str
+) -> dict:
+    """Return the payload's sourceMeta updated with this scrape's per-source outcomes.
+
+    Sources skipped by an open circuit breaker keep their previous entry.
+    """
+    source_meta = {
+        source_id: dict(meta) for source_id, meta in (cached_payload or {}).get("sourceMeta", {}).items()
+    }
+    article_counts: dict[str, int] = defaultdict(int)
+    for article in payload.get("articles", []):
+        article_counts[article.get("sourceId")] += 1
+
+    for source_id, result in source_results:
+        if result.get("circuit_open"):
+            continue
+        meta = source_meta.setdefault(
+            source_id, {"lastSuccessAt": None, "lastErrorAt": None, "lastError": None, "articleCount": 0}
+        )
+        if result.get("error"):
+            meta["lastErrorAt"] = scraped_at_iso
+            meta["lastError"] = result["error"]
+        else:
+            meta["lastSuccessAt"] = scraped_at_iso
+            meta["lastError"] = None
+        meta["articleCount"] = article_counts.get(source_id, 0)
+    return source_meta
+
+
+def _log_cancelled_scrape(
+    start_date_text: str,
+    end_date_text: str,
+    cancel_token: util.CancelToken,
+    pending_sources_by_date: dict[str, set[str]],
+) -> None:
+    pending_dates = [date_str for date_str, source_ids in pending_sources_by_date.items() if source_ids]
+    logger.warning(
+        "cancelled reason=%s start_date=%s end_date=%s cancelled_work_items=%s dates_incomplete=%s",
+        cancel_token.reason,
+        start_date_text,
+        end_date_text,
+        sum(len(pending_sources_by_date[date_str]) for date_str in pending_dates),
+        len(pending_dates),
+    )
+
+
+def _build_failed_source_result(source_id: str, error: Exception) -> dict:
+    return {
+        "articles": [],
+        "network_articles": 0,
+        "error": str(error),
+        "source_id": source_id,
+    }
+
+
+_DATE_PRIORITIES = ("newest", "oldest", "none")
+
+
+def _resolve_scrape_priority(priority: dict | None) -> dict:
+    """Validate a request's dispatch priority and fill in the defaults.
+
+    "dates" orders work items by date ("newest" first by default, "oldest", or "none" for
+    date order). "sources" lists source ids to dispatch ahead of the rest, which follow
+    their configured sort_order.
+
+    >>> _resolve_scrape_priority(None)
+    {'dates': 'newest', 'sources': []}
+    >>> _resolve_scrape_priority({"dates": "sideways"})
+    Traceback (most recent call last):
+    ...
+    ValueError: priority.dates must be one of: newest, oldest, none
+    """
+    if priority is None:
+        priority = {}
+    if not isinstance(priority, dict):
+        raise ValueError("priority must be an object")
+    dates_priority = priority.get("dates", "newest")
+    if dates_priority not in _DATE_PRIORITIES:
+        raise ValueError(f"priority.dates must be one of: {', '.join(_DATE_PRIORITIES)}")
+    sources_priority = priority.get("sources", [])
+    if not isinstance(sources_priority, list) or not all(isinstance(item, str) for item in sources_priority):
+        raise ValueError("priority.sources must be an array of source IDs")
+    return {"dates": dates_priority, "sources": list(sources_priority)}
+
+
+def _task_priority_key(task_key: tuple, priority: dict) -> tuple:
+    """Sort key dispatching range tasks first, then dates and sources by priority.
+
+    A range task feeds every date, so no date can complete before it does.
+
+    >>> priority = _resolve_scrape_priority({"sources": ["hackernews"]})
+    >>> keys = [("date", "2026-03-01", "tldr_ai"), ("date", "2026-03-02", "tldr_tech"),
+    ...         ("date", "2026-03-02", "hackernews"), ("range", None, "lucumr")]
+    >>> sorted(keys, key=lambda key: _task_priority_key(key, priority))  # doctest: +NORMALIZE_WHITESPACE
+    [('range', None, 'lucumr'), ('date', '2026-03-02', 'hackernews'),
+     ('date', '2026-03-02', 'tldr_tech'), ('date', '2026-03-01', 'tldr_ai')]
+    """
+    task_kind, date_str, source_id = task_key
+    if source_id in priority["sources"]:
+        source_rank = (0, priority["sources"].index(source_id))
+    else:
+        config = NEWSLETTER_CONFIGS.get(source_id)
+        source_rank = (1, config.sort_order if config else float("inf"))
+    if task_kind == "range":
+        return (0, 0, source_rank)
+    date_rank = date_type.fromisoformat(date_str).toordinal()
+    if priority["dates"] == "newest":
+        date_rank = -date_rank
+    elif priority["dates"] == "none":
+        date_rank = 0
+    return (1, date_rank, source_rank)
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.monotonic() - started) * 1000)
+
+
+def _resolve_scrape_engine() -> str:
+    """Return the configured scrape engine: "threads" (default) or "asyncio"."""
+    engine = util.resolve_env_var("SCRAPE_ENGINE", "threads").lower()
+    if engine not in ("threads", "asyncio"):
+        logger.warning("Unknown SCRAPE_ENGINE=%s, falling back to threads", engine)
+        return "threads"
+    return engine
+
+
+def _seconds_until(deadline: float | None) -> float | None:
+    """Seconds left before a time.monotonic() deadline (never negative), or None without one."""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def _submit_scrape_task(executor, task_key: tuple, fn, *args) -> Future:
+    """Submit fn(*args) in a copy of the caller's context, deferred while the task's source host is saturated."""
+    config = NEWSLETTER_CONFIGS.get(task_key[2])
+    context = contextvars.copy_context()
+    return executor.submit_to_host(config.base_url if config else None, context.run, fn, *args)
+
+
+def _start_threaded_tasks(
+    tasks: list[tuple],
+    deadline: float | None = None,
+    attached: list[tuple] = (),
+    cancel_token: util.CancelToken | None = None,
+):
+    """Submit every (task_key, sync_fn, async_fn, args) task to a lane of the shared executor right away.
+
+    A task waits in the queue while its source's host already has as many tasks running
+    as host_limiter allows it, so a throttled host does not hold workers other hosts could use.
+
+    attached holds (task_key, future, sync_rescrape, async_rescrape) pairs led by another
+    scrape; their outcomes are reported alongside this scrape's own tasks without using a
+    worker. When that leader stopped before finishing the pair, sync_rescrape is
+    submitted instead and its outcome is reported.
+
+    Returns an iterator of (task_key, outcome, error) in completion order. When the
+    deadline passes or cancel_token is cancelled, the iterator stops and tasks that have
+    not started are cancelled.
+    """
+    max_workers = int(util.resolve_env_var("MAX_PARALLEL_SCRAPES", default="20"))
+    executor = scrape_executor.get_executor().lane("scrape", max_active=max_workers)
+    # Re-scrapes are submitted later, from the consumer's context, so keep the scopes active here
+    scrape_context = contextvars.copy_context()
+    future_to_task_key = {}
+    for task_key, sync_fn, _, args in tasks:
+        try:
+            future_to_task_key[_submit_scrape_task(executor, task_key, sync_fn, *args)] = task_key
+        except util.DeadlineExceeded:
+            # The shared queue stayed full until the deadline; the rest are left unfinished
+            break
+    rescrapes = {}
+    for task_key, future, sync_rescrape, _ in attached:
+        future_to_task_key[future] = task_key
+        rescrapes[future] = sync_rescrape
+    task_count = len(future_to_task_key)
+    cancelled_future: Future = Future()
+    if cancel_token is not None:
+        # Completes on cancel, so waiting on the tasks wakes up right away
+        cancel_token.on_cancel(lambda: cancelled_future.set_result(None))
+
+    def iter_completions():
+        pending = set(future_to_task_key) | {cancelled_future}
+        completed = 0
+        try:
+            while completed < task_count:
+                done, pending = wait(pending, timeout=_seconds_until(deadline), return_when=FIRST_COMPLETED)
+                if not done or cancelled_future in done:
+                    return
+                for future in done:
+                    task_key = future_to_task_key[future]
+                    error = future.exception()
+                    sync_rescrape = rescrapes.pop(future, None)
+                    if sync_rescrape is not None and scrape_flights.is_leader_stop(error):
+                        try:
+                            retry = scrape_context.run(_submit_scrape_task, executor, task_key, sync_rescrape)
+                        except util.DeadlineExceeded:
+                            return
+                        future_to_task_key[retry] = task_key
+                        pending.add(retry)
+                        continue
+                    completed += 1
+                    if error is None:
+                        yield task_key, future.result(), None
+                    else:
+                        yield task_key, None, error
+        finally:
+            # Running tasks finish on their own; their fetches are bounded by the deadline
+            # and stop at the next fetch once the scrape is cancelled
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return iter_completions()
+
+
+_ASYNC_ENGINE_DONE = object()
+_ASYNC_ENGINE_CANCELLED = object()
+
+
+def _start_asyncio_tasks(
+    tasks: list[tuple],
+    deadline: float | None = None,
+    attached: list[tuple] = (),
+    cancel_token: util.CancelToken | None = None,
+):
+    """Run every task's async_fn on a dedicated event loop thread, started right away.
+
+    Up to ASYNC_MAX_IN_FLIGHT tasks are awaited concurrently and share one curl_cffi
+    AsyncSession. Sync adapters reach the loop through asyncio.to_thread, bridged onto
+    a lane of the shared executor running up to MAX_PARALLEL_SCRAPES of them. Returns an iterator of (task_key, outcome,
+    error) in completion order. When the deadline passes or cancel_token is cancelled, the
+    iterator stops and the remaining coroutines are cancelled. attached (task_key, future, sync_rescrape,
+    async_rescrape) pairs led by another scrape are awaited outside the in-flight limit; when that leader
+    stopped first, async_rescrape runs inside it.
+    """
+    max_in_flight = max(1, int(util.resolve_env_var("ASYNC_MAX_IN_FLIGHT", default="200")))
+    bridge_workers = max(1, int(util.resolve_env_var("MAX_PARALLEL_SCRAPES", default="20")))
+    completions: queue.Queue = queue.Queue()
+    engine_errors: list[BaseException] = []
+    running: dict = {}
+
+    async def run_task(task_key, async_fn, args, in_flight: asyncio.Semaphore):
+        async with in_flight:
+            try:
+                completions.put((task_key, await async_fn(*args), None))
+            except Exception as error:
+                completions.put((task_key, None, error))
+
+    async def await_attached(task_key, future, async_rescrape, in_flight: asyncio.Semaphore):
+        try:
+            try:
+                outcome = await asyncio.wrap_future(future)
+            except util.DeadlineExceeded as error:
+                if not scrape_flights.is_leader_stop(error):
+                    raise
+                async with in_flight:
+                    outcome = await async_rescrape()
+            completions.put((task_key, outcome, None))
+        except Exception as error:
+            completions.put((task_key, None, error))
+
+    async def run_all():
+        running["loop"] = asyncio.get_running_loop()
+        running["task"] = asyncio.current_task()
+        asyncio.get_running_loop().set_default_executor(
+            scrape_executor.get_executor().thread_pool_lane("scrape-bridge", max_active=bridge_workers)
+        )
+        in_flight = asyncio.Semaphore(max_in_flight)
+        async with util.async_session_scope(max_clients=max_in_flight):
+            await asyncio.gather(
+                *(run_task(task_key, async_fn, args, in_flight) for task_key, _, async_fn, args in tasks),
+                *(
+                    await_attached(task_key, future, async_rescrape, in_flight)
+                    for task_key, future, _, async_rescrape in attached
+                ),
+            )
+
+    def run_loop():
+        try:
+            asyncio.run(run_all())
+        except BaseException as error:
+            engine_errors.append(error)
+        finally:
+            completions.put(_ASYNC_ENGINE_DONE)
+
+    context = contextvars.copy_context()
+    loop_thread = threading.Thread(target=context.run, args=(run_loop,), name="scrape-asyncio", daemon=True)
+    loop_thread.start()
+    if cancel_token is not None:
+        cancel_token.on_cancel(lambda: completions.put(_ASYNC_ENGINE_CANCELLED))
+
+    def stop_loop():
+        if "task" in running:
+            running["loop"].call_soon_threadsafe(running["task"].cancel)
+
+    def iter_completions():
+        while True:
+            try:
+                item = completions.get(timeout=_seconds_until(deadline))
+            except queue.Empty:
+                stop_loop()
+                return
+            if item is _ASYNC_ENGINE_CANCELLED:
+                stop_loop()
+                return
+            if item is _ASYNC_ENGINE_DONE:
+                break
+            yield item
+        loop_thread.join()
+        if engine_errors:
+            raise engine_errors[0]
+
+    return iter_completions()
+
+
 def scrape_newsletters_in_date_range(
-    start_date_text: str, end_date_text: str, source_ids: list[str] | None = None, excluded_urls: list[str] | None = None
+    start_date_text: str,
+    end_date_text: str,
+    source_ids: list[str] | None = None,
+    excluded_urls: list[str] | None = None,
+    deadline_ms: int | None = None,
+    cancel_token: util.CancelToken | None = None,
+    supersede_key: str | None = None,
+    priority: dict | None = None,
 ) -> dict:
     """Scrape newsletters in date range with server-side cache integration."""
+    payloads_by_date: dict[str, dict] = {}
+    final_event: dict = {}
+    for event in iter_scrape_newsletters_in_date_range(
+        start_date_text,
+        end_date_text,
+        source_ids=source_ids,
+        excluded_urls=excluded_urls,
+        deadline_ms=deadline_ms,
+        cancel_token=cancel_token,
+        supersede_key=supersede_key,
+        priority=priority,
+    ):
+        if event["type"] == "payload":
+            payloads_by_date[event["date"]] = event["payload"]
+        else:
+            final_event = event
+
+    return {
+        "success": True,
+        "payloads": [payloads_by_date[date_str] for date_str in sorted(payloads_by_date, reverse=True)],
+        "stats": final_event["stats"],
+        "source": final_event["source"],
+    }
+
+
+def _load_stale_while_revalidate_snapshot(start_date_text: str, end_date_text: str, source_ids: list[str] | None):
+    """Return (cached payloads newest first, swr stats, stale dates newest first) for a range.
+
+    Stale dates are the uncached ones and those with a stale source that would be scraped.
+    """
+    start_date, end_date = _parse_date_range(start_date_text, end_date_text)
+    dates = util.get_date_range(start_date, end_date)
+    resolved_source_ids = source_ids or get_default_source_ids()
+
+    cache_map, cached_at_epoch_map = _load_cached_range(start_date_text, end_date_text)
+    work_source_ids_by_date, _ = _plan_source_work(
+        _stale_source_ids_by_date(dates, resolved_source_ids, cache_map, cached_at_epoch_map),
+        resolved_source_ids,
+    )
+    stale_dates = [
+        util.format_date_for_url(current_date)
+        for current_date in reversed(dates)
+        if util.format_date_for_url(current_date) not in cache_map
+        or work_source_ids_by_date[util.format_date_for_url(current_date)]
+    ]
+    cached_payloads = [
+        cache_map[util.format_date_for_url(current_date)]
+        for current_date in reversed(dates)
+        if util.format_date_for_url(current_date) in cache_map
+    ]
+    stats = _build_stats_from_payloads(cached_payloads, 0)
+    stats["cache_age_seconds"] = _cache_ages(cache_map, cached_at_epoch_map)
+    stats["stale_dates"] = stale_dates
+    return cached_payloads, stats, stale_dates
+
+
+def scrape_stale_while_revalidate(
+    start_date_text: str,
+    end_date_text: str,
+    source_ids: list[str] | None = None,
+    excluded_urls: list[str] | None = None,
+    priority: dict | None = None,
+) -> dict:
+    """Return the range's cached payloads now, and revalidate its stale dates in the background.
+
+    Every cached date is returned as is, with its age in stats["cache_age_seconds"].
+    Dates that are uncached or have a stale source are listed in stats["stale_dates"]
+    and scraped by a background revalidation covering them, through the same
+    merge/persist path as a live scrape. Its token reads the refreshed events back
+    (see scrape_revalidation); it is None when nothing was stale.
+
+    Raises ValueError where background revalidation is disabled (see
+    scrape_revalidation.background_enabled); iter_scrape_stale_while_revalidate works everywhere.
+    """
+    if not scrape_revalidation.background_enabled():
+        raise ValueError("background revalidation is disabled here; stream mode swr instead")
+    resolved_priority = _resolve_scrape_priority(priority)
+    cached_payloads, stats, stale_dates = _load_stale_while_revalidate_snapshot(
+        start_date_text, end_date_text, source_ids
+    )
+
+    revalidation = None
+    if stale_dates:
+        revalidation_start, revalidation_end = stale_dates[-1], stale_dates[0]
+        revalidation, started = scrape_revalidation.start(
+            (
+                revalidation_start,
+                revalidation_end,
+                tuple(source_ids or get_default_source_ids()),
+                frozenset(excluded_urls or []),
+            ),
+            lambda cancel_token: iter_scrape_newsletters_in_date_range(
+                revalidation_start,
+                revalidation_end,
+                source_ids=source_ids,
+                excluded_urls=excluded_urls,
+                cancel_token=cancel_token,
+                priority=resolved_priority,
+            ),
+        )
+        logger.info(
+            "swr start_date=%s end_date=%s cached_dates=%s stale_dates=%s revalidation=%s %s",
+            start_date_text,
+            end_date_text,
+            len(cached_payloads),
+            len(stale_dates),
+            revalidation.token,
+            "started" if started else "joined",
+        )
+
+    return {
+        "success": True,
+        "payloads": cached_payloads,
+        "stats": stats,
+        "source": "cache",
+        "revalidation_token": revalidation.token if revalidation else None,
+    }
+
+
+def iter_scrape_stale_while_revalidate(
+    start_date_text: str,
+    end_date_text: str,
+    source_ids: list[str] | None = None,
+    excluded_urls: list[str] | None = None,
+    deadline_ms: int | None = None,
+    supersede_key: str | None = None,
+    priority: dict | None = None,
+):
+    """Yield the range's cached payloads at once, then revalidate its stale dates within this request.
+
+    Events:
+        {"type": "payload", ..., "source": "cache"} for every cached date, newest first
+        {"type": "revalidating", "stale_dates": [...]}
+        the events of iter_scrape_newsletters_in_date_range over the stale dates, without
+        repeating cached dates already sent; its stats event (always last) also carries
+        stats["stale_dates"] and the cache_age_seconds of every cached date
+
+    Nothing outlives the response, so this works on serverless hosts where
+    scrape_stale_while_revalidate's background revalidation cannot. Validation runs eagerly.
+    """
+    _parse_date_range(start_date_text, end_date_text)
+    resolved_priority = _resolve_scrape_priority(priority)
+    return _iter_stale_while_revalidate_events(
+        start_date_text, end_date_text, source_ids, excluded_urls, deadline_ms, supersede_key, resolved_priority
+    )
+
+
+def _iter_stale_while_revalidate_events(
+    start_date_text, end_date_text, source_ids, excluded_urls, deadline_ms, supersede_key, priority
+):
+    cached_payloads, cache_stats, stale_dates = _load_stale_while_revalidate_snapshot(
+        start_date_text, end_date_text, source_ids
+    )
+    for payload in cached_payloads:
+        yield {"type": "payload", "date": payload["date"], "payload": payload, "source": "cache"}
+    if not stale_dates:
+        yield {"type": "stats", "stats": cache_stats, "source": "cache"}
+        return
+
+    logger.info(
+        "swr stream start_date=%s end_date=%s cached_dates=%s stale_dates=%s",
+        start_date_text,
+        end_date_text,
+        len(cached_payloads),
+        len(stale_dates),
+    )
+    yield {"type": "revalidating", "stale_dates": stale_dates}
+    sent_dates = {payload["date"] for payload in cached_payloads}
+    events = iter_scrape_newsletters_in_date_range(
+        stale_dates[-1],
+        stale_dates[0],
+        source_ids=source_ids,
+        excluded_urls=excluded_urls,
+        deadline_ms=deadline_ms,
+        supersede_key=supersede_key,
+        priority=priority,
+    )
+    try:
+        for event in events:
+            if event["type"] == "payload" and event["source"] == "cache" and event["date"] in sent_dates:
+                continue
+            if event["type"] == "stats":
+                event["stats"]["stale_dates"] = stale_dates
+                event["stats"]["cache_age_seconds"] = cache_stats["cache_age_seconds"]
+            yield event
+    finally:
+        # Closing this generator early (client gone) cancels the revalidation
+        events.close()
+
+
+def iter_scrape_newsletters_in_date_range(
+    start_date_text: str,
+    end_date_text: str,
+    source_ids: list[str] | None = None,
+    excluded_urls: list[str] | None = None,
+    deadline_ms: int | None = None,
+    cancel_token: util.CancelToken | None = None,
+    supersede_key: str | None = None,
+    priority: dict | None = None,
+):
+    """Yield per-date payload events as soon as each date is ready, then one stats event.
+
+    Fresh cached dates are yielded first. Each stale date is merged, persisted and
+    yielded once every source for that date has finished, so a slow adapter on one
+    day no longer holds back the others.
+
+    Events:
+        {"type": "payload", "date": "YYYY-MM-DD", "payload": {...}, "source": "cache" | "live"}
+        {"type": "stats", "stats": {...}, "source": "cache" | "live"}  (always last)
+
+    With deadline_ms, sources still running when the time is up are abandoned. Their
+    dates are yielded with whatever finished (source "partial") and listed in
+    stats["unfinished"]; they are not persisted as fresh, so the next call scrapes them
+    again. Every fetch made by the scrape is bounded by the same deadline.
+
+    Cancelling cancel_token, closing the iterator early (a streaming client went away), or
+    starting another scrape with the same supersede_key stops the scrape the same way:
+    queued work is cancelled, running adapters stop at their next fetch, and the
+    cancelled pairs are logged and reported in stats["cancelled"].
+
+    Work items are dispatched by priority (see _resolve_scrape_priority): by default the
+    newest dates and the sources with the lowest sort_order go first. stats["timing"]
+    reports the time to the first completed work item, the first payload and the newest
+    date's payload.
+
+    Date-range and priority validation run eagerly, so ValueError surfaces before the first event.
+    """
     start_date, end_date = _parse_date_range(start_date_text, end_date_text)
+    resolved_priority = _resolve_scrape_priority(priority)
+    deadline = None if deadline_ms is None else time.monotonic() + deadline_ms / 1000
+    cancel_token = cancel_token or util.CancelToken()
+    return _iter_superseding_scrape_events(
+        supersede_key,
+        cancel_token,
+        _iter_scrape_events(
+            start_date,
+            end_date,
+            start_date_text,
+            end_date_text,
+            source_ids,
+            excluded_urls,
+            deadline,
+            cancel_token,
+            resolved_priority,
+        ),
+    )
+
+
+_superseding_scrapes_lock = threading.Lock()
+_superseding_scrapes: dict[str, util.CancelToken] = {}
+
+
+def _iter_superseding_scrape_events(supersede_key: str | None, cancel_token: util.CancelToken, events):
+    """Cancel the scrape still running under supersede_key, then yield events as the newest one."""
+    if supersede_key is None:
+        yield from events
+        return
+
+    with _superseding_scrapes_lock:
+        superseded_token = _superseding_scrapes.get(supersede_key)
+        _superseding_scrapes[supersede_key] = cancel_token
+    if superseded_token is not None:
+        superseded_token.cancel("superseded")
+    try:
+        yield from events
+    finally:
+        with _superseding_scrapes_lock:
+            if _superseding_scrapes.get(supersede_key) is cancel_token:
+                del _superseding_scrapes[supersede_key]
+
+
+def _flush_writes_after_disconnect(writes_by_date: dict[str, Future]) -> None:
+    """Wait for the writes a closed stream already queued.
+
+    A serverless instance may be frozen as soon as the response ends, so dates this
+    request finalized are stored before the generator finishes closing.
+    """
+    if not writes_by_date:
+        return
+    write_stats = payload_writer.wait_for(writes_by_date)
+    logger.info(
+        "flushed writes after disconnect persisted=%s failed=%s",
+        write_stats["persisted"],
+        ",".join(write_stats["failed"]) or "-",
+    )
+
+
+def _iter_scrape_events(
+    start_date,
+    end_date,
+    start_date_text,
+    end_date_text,
+    source_ids,
+    excluded_urls,
+    deadline=None,
+    cancel_token: util.CancelToken | None = None,
+    priority: dict | None = None,
+):
+    started = time.monotonic()
+    priority = priority or _resolve_scrape_priority(None)
     dates = util.get_date_range(start_date, end_date)
     resolved_source_ids = source_ids or get_default_source_ids()
     source_order = {
@@ -167,99 +957,104 @@ def scrape_newsletters_in_date_range(
 
     total_network_fetches = 0
     payloads_by_date: dict[str, dict] = {}
-    dates_to_write: set[str] = set()
-    work_items: list[tuple[date_type, str, str, list[str]]] = []
-
-    # Fetch all cached payloads upfront in one query
-    all_cached_rows = storage_service.get_daily_payloads_range(start_date_text, end_date_text)
-    cache_map: dict[str, dict] = {}
-    cached_at_epoch_map: dict[str, float | None] = {}
-    for row in all_cached_rows:
-        date_key = row['date']
-        cache_map[date_key] = row['payload']
-        cached_at_iso = row['cached_at']
-        if cached_at_iso is None:
-            cached_at_epoch_map[date_key] = None
-        else:
-            cached_at_epoch_map[date_key] = util.parse_cached_at_epoch_seconds(cached_at_iso)
+    dates_to_write: list[str] = []
+    work_items: list[tuple[date_type, str, str, frozenset[str]]] = []
+    # One frozen set per date, shared by every task of that date; adapters and
+    # scrape_flights take it as-is instead of rebuilding it
+    request_excluded = frozenset(excluded_urls or ())
+
+    cache_map, cached_at_epoch_map = _load_cached_range(start_date_text, end_date_text)
+    work_source_ids_by_date, skips = _plan_source_work(
+        _stale_source_ids_by_date(dates, resolved_source_ids, cache_map, cached_at_epoch_map),
+        resolved_source_ids,
+    )
 
     # Fast path: all dates cached and fresh (no rescrape needed)
     all_cached_and_fresh = all(
         util.format_date_for_url(d) in cache_map
-        and not util.should_rescrape(
-            util.format_date_for_url(d),
-            cached_at_epoch_map.get(util.format_date_for_url(d)),
-        )
+        and not work_source_ids_by_date[util.format_date_for_url(d)]
         for d in dates
     )
     if all_cached_and_fresh:
         ordered = [cache_map[util.format_date_for_url(d)] for d in reversed(dates)]
-        return {
-            "success": True,
-            "payloads": ordered,
-            "stats": _build_stats_from_payloads(ordered, total_network_fetches),
-            "source": "cache",
-        }
+        for current_date in reversed(dates):
+            date_str = util.format_date_for_url(current_date)
+            yield {"type": "payload", "date": date_str, "payload": cache_map[date_str], "source": "cache"}
+        stats = _build_stats_from_payloads(ordered, total_network_fetches)
+        stats["cache_age_seconds"] = _cache_ages(cache_map, cached_at_epoch_map)
+        yield {"type": "stats", "stats": stats, "source": "cache"}
+        return
+
+    # Range-capable sources (feeds) fetch once for all stale dates instead of once per date
+    range_source_ids = [
+        source_id for source_id in resolved_source_ids if source_supports_range_scrape(source_id)
+    ]
+    stale_dates: list[date_type] = []
+    stale_range_source_ids: set[str] = set()
+    range_cached_urls: set[str] = set()
+    breaker_skips: dict[str, int] = skips["breaker"]
 
     for current_date in dates:
         date_str = util.format_date_for_url(current_date)
         cached_payload = cache_map.get(date_str)
-        cached_at_epoch = cached_at_epoch_map.get(date_str)
+        date_work_source_ids = work_source_ids_by_date[date_str]
 
-        if util.should_rescrape(date_str, cached_at_epoch):
-            # Rescrape needed: either no cache or cache is stale
-            cached_urls: set[str] = set()
-            if cached_payload:
-                for article in cached_payload.get('articles', []):
-                    url = article.get('url', '')
-                    canonical_url = util.canonicalize_url(url) if url else ''
-                    if canonical_url:
-                        cached_urls.add(canonical_url)
-
-            combined_excluded = list(set(excluded_urls or []) | cached_urls)
-            dates_to_write.add(date_str)
-            for source_id in resolved_source_ids:
-                work_items.append((current_date, date_str, source_id, combined_excluded))
-        else:
-            # Cache is fresh, use it directly
+        if cached_payload is not None and not date_work_source_ids:
+            # Nothing left to scrape for this date, use the cache directly
             payloads_by_date[date_str] = cached_payload
+            continue
 
-    results_by_date: dict[str, list[tuple[str, dict]]] = defaultdict(list)
-    if work_items:
-        max_workers = int(util.resolve_env_var("MAX_PARALLEL_SCRAPES", default="20"))
-        max_workers = max(1, min(max_workers, len(work_items)))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_task = {
-                executor.submit(
-                    scrape_single_source_for_date, date_value, source_id, excluded
-                ): (date_str, source_id)
-                for date_value, date_str, source_id, excluded in work_items
-            }
-            for future in as_completed(future_to_task):
-                task_date_str, source_id = future_to_task[future]
-                try:
-                    date_str, result = future.result()
-                except Exception as error:
-                    logger.error(
-                        "Scrape task failed date=%s source=%s error=%s",
-                        task_date_str,
-                        source_id,
-                        repr(error),
-                        exc_info=True,
-                    )
-                    result = {
-                        "articles": [],
-                        "network_articles": 0,
-                        "error": str(error),
-                        "source_id": source_id,
-                    }
-                    date_str = task_date_str
-                results_by_date[date_str].append((source_id, result))
+        cached_urls: set[str] = set()
+        if cached_payload:
+            cached_urls.update(
+                util.canonicalize_urls(
+                    article['url'] for article in cached_payload.get('articles', []) if article.get('url')
+                )
+            )
+            cached_urls.discard('')
+
+        combined_excluded = request_excluded | cached_urls if cached_urls else request_excluded
+        dates_to_write.append(date_str)
+        stale_dates.append(current_date)
+        range_cached_urls.update(cached_urls)
+        for source_id in date_work_source_ids:
+            if source_id in range_source_ids:
+                stale_range_source_ids.add(source_id)
+            else:
+                work_items.append((current_date, date_str, source_id, combined_excluded))
 
-    for current_date in dates:
-        date_str = util.format_date_for_url(current_date)
-        if date_str not in dates_to_write:
-            continue
+    # One item per range-capable source spanning the stale dates. Exclusions are the union
+    # across those dates; a feed entry belongs to a single publication date, so the union
+    # only ever drops URLs that are already cached somewhere in the range.
+    range_work_items: list[tuple[date_type, date_type, str, frozenset[str]]] = []
+    if stale_dates:
+        range_excluded_set = request_excluded | range_cached_urls if range_cached_urls else request_excluded
+        for source_id in range_source_ids:
+            if source_id not in stale_range_source_ids:
+                continue
+            range_work_items.append(
+                (stale_dates[0], stale_dates[-1], source_id, range_excluded_set)
+            )
+
+    # A date is complete once its own work items and every range item have reported
+    pending_sources_by_date: dict[str, set[str]] = {
+        date_str: {source_id for _, _, source_id, _ in range_work_items}
+        for date_str in dates_to_write
+    }
+    for _, date_str, source_id, _ in work_items:
+        pending_sources_by_date[date_str].add(source_id)
+
+    def _leader_writes_date(date_str: str, source_results: list[tuple[str, dict]]) -> bool:
+        # Every source came from one other scrape, which merges and persists the same results
+        # unless it stops first (see scrape_flights.settle_date_write)
+        return (
+            date_str not in dates_with_owned_work
+            and len(leader_runs_by_date[date_str]) == 1
+            and not any(result.get("error") for _, result in source_results)
+        )
+
+    def finalize_date(date_str: str) -> dict:
+        nonlocal total_network_fetches, coalesced_writes_skipped
         cached_payload = cache_map.get(date_str)
         source_results = results_by_date.get(date_str, [])
         source_results.sort(key=lambda item: source_order.get(item[0], len(source_order)))
@@ -271,28 +1066,291 @@ def scrape_newsletters_in_date_range(
             merged_result.get("articles", []),
         )
         if cached_payload:
-            payloads_by_date[date_str] = _merge_payloads(new_payload, cached_payload)
+            payload = _merge_payloads(new_payload, cached_payload)
         else:
-            payloads_by_date[date_str] = new_payload
+            payload = new_payload
+        payload["sourceMeta"] = _build_source_meta(
+            cached_payload, payload, source_results, datetime.now(timezone.utc).isoformat()
+        )
+        payloads_by_date[date_str] = payload
+        if not pending_sources_by_date[date_str]:
+            if _leader_writes_date(date_str, source_results):
+                handed_off_payloads[date_str] = payload
+            else:
+                writes_by_date[date_str] = payload_writer.submit(
+                    storage_service.set_daily_payload_from_scrape, date_str, payload
+                )
+                if date_str in leader_date_writes:
+                    scrape_flights.settle_date_write(leader_date_writes[date_str], True)
+            return {"type": "payload", "date": date_str, "payload": payload, "source": "live"}
+
+        # Deadline hit: keep what finished without advancing cached_at, so the date stays stale
+        if date_str in leader_date_writes:
+            scrape_flights.settle_date_write(leader_date_writes[date_str], False)
+        if cached_payload:
+            writes_by_date[date_str] = payload_writer.submit(storage_service.set_daily_payload, date_str, payload)
+        return {"type": "payload", "date": date_str, "payload": payload, "source": "partial"}
+
+    # Each date is persisted in the background as soon as it is final (see payload_writer)
+    writes_by_date: dict[str, Future] = {}
+    timing = {"first_result_ms": None, "first_payload_ms": None, "newest_date_ms": None}
+    newest_date_str = util.format_date_for_url(dates[-1])
+
+    def timed(event: dict) -> dict:
+        elapsed_ms = _elapsed_ms(started)
+        if timing["first_payload_ms"] is None:
+            timing["first_payload_ms"] = elapsed_ms
+        if event["date"] == newest_date_str:
+            timing["newest_date_ms"] = elapsed_ms
+        return event
+
+    for current_date in reversed(dates):
+        date_str = util.format_date_for_url(current_date)
+        if date_str in payloads_by_date:
+            yield timed(
+                {"type": "payload", "date": date_str, "payload": payloads_by_date[date_str], "source": "cache"}
+            )
+
+    results_by_date: dict[str, list[tuple[str, dict]]] = defaultdict(list)
+    scrape_fetch_cache = fetch_cache.FetchCache()
+    scrape_host_waits = host_limiter.HostWaitStats()
+    # Pairs already being scraped by a concurrent request are attached to its flight
+    run_id = object()
+    tasks: list[tuple] = []
+    attached: list[tuple] = []
+    attached_excluded: dict[tuple, frozenset[str]] = {}
+    led_flights: list[tuple] = []
+    dates_with_owned_work: set[str] = set(dates_to_write) if range_work_items else set()
+    leader_runs_by_date: dict[str, set] = defaultdict(set)
+    # Whether this run queued the final write of a date it leads, and the same for the
+    # run each attached date is left to
+    leader_date_writes: dict[str, Future] = {}
+    follower_date_writes: dict[str, Future | None] = {}
+    handed_off_payloads: dict[str, dict] = {}
+    coalesced_writes_skipped = 0
+    for date_value, date_str, source_id, excluded in work_items:
+        task_key = ("date", date_str, source_id)
+        flight_key = (date_str, source_id)
+        date_write = leader_date_writes.get(date_str) or Future()
+        flight, is_leader = scrape_flights.claim(flight_key, run_id, excluded, date_write)
+        if not is_leader:
+            rescrape_args = (flight_key, run_id, excluded)
+            attached.append(
+                (
+                    task_key,
+                    flight.future,
+                    functools.partial(
+                        scrape_flights.rescrape,
+                        *rescrape_args,
+                        scrape_single_source_for_date,
+                        date_value,
+                        source_id,
+                        excluded,
+                    ),
+                    functools.partial(
+                        scrape_flights.async_rescrape,
+                        *rescrape_args,
+                        async_scrape_single_source_for_date,
+                        date_value,
+                        source_id,
+                        excluded,
+                    ),
+                )
+            )
+            attached_excluded[task_key] = excluded
+            leader_runs_by_date[date_str].add(flight.run_id)
+            follower_date_writes[date_str] = flight.date_write
+            continue
+        leader_date_writes[date_str] = date_write
+        led_flights.append((flight_key, flight))
+        dates_with_owned_work.add(date_str)
+        tasks.append(
+            (
+                task_key,
+                functools.partial(scrape_flights.lead, flight_key, flight, scrape_single_source_for_date),
+                functools.partial(
+                    scrape_flights.async_lead, flight_key, flight, async_scrape_single_source_for_date
+                ),
+                (date_value, source_id, excluded),
+            )
+        )
+    tasks += [
+        (
+            ("range", None, source_id),
+            scrape_single_source_for_range,
+            async_scrape_single_source_for_range,
+            (range_start, range_end, source_id, excluded),
+        )
+        for range_start, range_end, source_id, excluded in range_work_items
+    ]
+    # Engines start tasks in list order, so this is the dispatch order
+    tasks.sort(key=lambda task: _task_priority_key(task[0], priority))
+    if attached:
+        logger.info("coalesced work_items=%s into concurrent scrapes", len(attached))
+
+    cancel_token = cancel_token or util.CancelToken()
+
+    def withdraw_led_flights():
+        # Later scrapes must not attach to work this one is abandoning
+        for flight_key, flight in led_flights:
+            scrape_flights.withdraw(flight_key, flight)
+
+    cancel_token.on_cancel(withdraw_led_flights)
+    if tasks or attached:
+        # The scopes only need to be active while tasks are started: each task runs in
+        # a copy of this context, and this generator may be resumed from another one.
+        with fetch_cache.scrape_scope(scrape_fetch_cache), host_limiter.wait_stats_scope(
+            scrape_host_waits
+        ), util.deadline_scope(deadline), util.cancel_scope(cancel_token):
+            if _resolve_scrape_engine() == "asyncio":
+                completions = _start_asyncio_tasks(tasks, deadline, attached, cancel_token)
+            else:
+                completions = _start_threaded_tasks(tasks, deadline, attached, cancel_token)
+
+        try:
+            for task_key, outcome, error in completions:
+                if cancel_token.cancelled:
+                    # Outcomes after the cancel may be adapters that swallowed ScrapeCancelled
+                    break
+                if timing["first_result_ms"] is None:
+                    timing["first_result_ms"] = _elapsed_ms(started)
+                task_kind, task_date_str, source_id = task_key
+                if task_kind == "range":
+                    if error is not None:
+                        logger.error(
+                            "Range scrape task failed source=%s error=%s",
+                            source_id,
+                            repr(error),
+                            exc_info=error,
+                        )
+                        outcome = [
+                            (date_str, _build_failed_source_result(source_id, error))
+                            for date_str in dates_to_write
+                        ]
+                    if outcome and outcome[0][1].get("circuit_open"):
+                        breaker_skips[source_id] += 1
+                    for date_str, result in outcome:
+                        if date_str in pending_sources_by_date:
+                            results_by_date[date_str].append((source_id, result))
+                    completed_dates = list(dates_to_write)
+                else:
+                    if error is not None:
+                        logger.error(
+                            "Scrape task failed date=%s source=%s error=%s",
+                            task_date_str,
+                            source_id,
+                            repr(error),
+                            exc_info=error,
+                        )
+                        outcome = (task_date_str, _build_failed_source_result(source_id, error))
+                    elif task_key in attached_excluded:
+                        outcome = scrape_flights.adopt_result(outcome, attached_excluded[task_key])
+                    date_str, result = outcome
+                    if result.get("circuit_open"):
+                        breaker_skips[source_id] += 1
+                    results_by_date[date_str].append((source_id, result))
+                    completed_dates = [task_date_str]
+
+                for date_str in completed_dates:
+                    pending_sources_by_date[date_str].discard(source_id)
+                    if not pending_sources_by_date[date_str]:
+                        yield timed(finalize_date(date_str))
+        except GeneratorExit:
+            # The consumer stopped reading: a streaming client disconnected mid-scrape
+            if cancel_token.cancel("client_disconnected"):
+                _log_cancelled_scrape(start_date_text, end_date_text, cancel_token, pending_sources_by_date)
+            _flush_writes_after_disconnect(writes_by_date)
+            raise
+        finally:
+            # Flights whose task never ran (deadline, cancel) must not leave followers waiting
+            stop_error_type = util.ScrapeCancelled if cancel_token.cancelled else util.DeadlineExceeded
+            for flight_key, flight in led_flights:
+                if not flight.future.done():
+                    scrape_flights.resolve(
+                        flight_key, flight, error=stop_error_type("leading scrape stopped before this item")
+                    )
+            # Led dates not finalized by now will not get a final write here; attached runs write them
+            for date_write in leader_date_writes.values():
+                scrape_flights.settle_date_write(date_write, False)
+
+    # Dates without any work item (no sources resolved) still get an empty payload, and
+    # dates cut off by the deadline get what finished in time
+    try:
+        for date_str in dates_to_write:
+            if date_str not in payloads_by_date:
+                yield timed(finalize_date(date_str))
+    except GeneratorExit:
+        _flush_writes_after_disconnect(writes_by_date)
+        raise
+
+    unfinished = [
+        {"date": date_str, "source_id": source_id}
+        for date_str in dates_to_write
+        for source_id in sorted(
+            pending_sources_by_date[date_str], key=lambda item: source_order.get(item, len(source_order))
+        )
+    ]
+    if cancel_token.cancelled:
+        _log_cancelled_scrape(start_date_text, end_date_text, cancel_token, pending_sources_by_date)
+    elif unfinished:
+        logger.warning(
+            "deadline reached unfinished=%s dates_incomplete=%s",
+            len(unfinished),
+            len({item["date"] for item in unfinished}),
+        )
 
     ordered_payloads = [
         payloads_by_date[util.format_date_for_url(current_date)]
         for current_date in reversed(dates)
     ]
-    for date_str in dates_to_write:
-        storage_service.set_daily_payload_from_scrape(date_str, payloads_by_date[date_str])
-
+    for date_str, payload in handed_off_payloads.items():
+        if scrape_flights.leader_wrote_date(follower_date_writes.get(date_str), _seconds_until(deadline)):
+            coalesced_writes_skipped += 1
+        else:
+            writes_by_date[date_str] = payload_writer.submit(
+                storage_service.set_daily_payload_from_scrape, date_str, payload
+            )
+    write_stats = payload_writer.wait_for(writes_by_date)
+    if write_stats["failed"]:
+        logger.error("daily_cache writes failed dates=%s", ",".join(write_stats["failed"]))
+    fetch_cache_stats = scrape_fetch_cache.stats()
+    timing["total_ms"] = _elapsed_ms(started)
     logger.info(
-        "done dates_processed=%s total_articles=%s",
+        "done dates_processed=%s total_articles=%s fetch_cache_hits=%s calendar_skips=%s missing_issue_skips=%s "
+        "breaker_skips=%s first_payload_ms=%s newest_date_ms=%s total_ms=%s",
         len(ordered_payloads),
         sum(len(payload.get("articles", [])) for payload in ordered_payloads),
+        fetch_cache_stats["hits"],
+        skips["calendar"],
+        skips["missing_issue"],
+        sum(breaker_skips.values()),
+        timing["first_payload_ms"],
+        timing["newest_date_ms"],
+        timing["total_ms"],
     )
-    return {
-        "success": True,
-        "payloads": ordered_payloads,
-        "stats": _build_stats_from_payloads(ordered_payloads, total_network_fetches),
-        "source": "live",
+    stats = _build_stats_from_payloads(ordered_payloads, total_network_fetches)
+    stats["fetch_cache"] = fetch_cache_stats
+    stats["calendar_skips"] = skips["calendar"]
+    stats["missing_issue_skips"] = skips["missing_issue"]
+    stats["unfinished"] = unfinished
+    stats["timing"] = timing
+    stats["cache_age_seconds"] = _cache_ages(
+        {date_str: payloads_by_date[date_str] for date_str in payloads_by_date if date_str not in dates_to_write},
+        cached_at_epoch_map,
+    )
+    stats["cancelled"] = (
+        {"reason": cancel_token.reason, "work_items": len(unfinished)} if cancel_token.cancelled else None
+    )
+    stats["coalesced"] = {"work_items": len(attached), "writes_skipped": coalesced_writes_skipped}
+    stats["writes"] = write_stats
+    stats["circuit_breaker"] = {
+        "skipped": dict(breaker_skips),
+        "sources": source_health_stats(resolved_source_ids),
     }
+    stats["host_waits"] = scrape_host_waits.stats()
+    stats["http_connections"] = http_sessions.stats()
+    stats["executor"] = scrape_executor.stats()
+    yield {"type": "stats", "stats": stats, "source": "live"}
 
 
 _URL_PATH_EXTENSION_PATTERN = re.compile(r"\.(html?|php|aspx?)$", re.IGNORECASE)
@@ -424,7 +1482,7 @@ def add_url_as_article(url: str) -> dict:
 
 
 def _fetch_articles_content_parallel(articles: list[dict]) -> tuple[list[dict], list[dict]]:
-    """Fetch markdown content for multiple articles in parallel using up to 5 workers.
+    """Fetch markdown content for multiple articles in parallel, up to 5 at a time on the shared executor.
 
     Returns (successful, failed) where:
     - successful: list of dicts with keys url, title, category, markdown
@@ -433,9 +1491,9 @@ def _fetch_articles_content_parallel(articles: list[dict]) -> tuple[list[dict],
     successful = []
     failed = []
 
-    with ThreadPoolExecutor(max_workers=5) as executor:
+    with scrape_executor.get_executor().lane("digest-fetch", max_active=5) as executor:
         future_to_article = {
-            executor.submit(summarizer.url_to_markdown, article["url"]): article
+            executor.submit_to_host(article["url"], summarizer.url_to_markdown, article["url"]): article
             for article in articles
         }
         for future in as_completed(future_to_article):
@@ -470,9 +1528,9 @@ def _fetch_article_markdowns_parallel(article_urls: list[str]) -> dict[str, str]
     bodies_by_url: dict[str, str] = {}
     failures: list[tuple[str, str]] = []
 
-    with ThreadPoolExecutor(max_workers=5) as executor:
+    with scrape_executor.get_executor().lane("elaborate-fetch", max_active=5) as executor:
         future_to_url = {
-            executor.submit(summarizer.url_to_markdown, url): url
+            executor.submit_to_host(url, summarizer.url_to_markdown, url): url
             for url in article_urls
         }
         for future in as_completed(future_to_url):
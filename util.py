@@ -1,6 +1,10 @@
+import asyncio
+import contextlib
+import contextvars
 import functools
 import logging
 import os
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
@@ -8,6 +12,11 @@ from zoneinfo import ZoneInfo
 import requests
 from curl_cffi import requests as curl_requests
 
+import conditional_get_store
+import fetch_cache
+import host_limiter
+import http_sessions
+
 PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
 
 
@@ -94,20 +103,48 @@ def utc_day_epoch_seconds_bounds(date_str: str) -> tuple[int, int]:
     return int(start_of_day_utc.timestamp()), int(end_of_day_utc_exclusive.timestamp())
 
 
-def should_rescrape(date_str: str, cached_at_epoch_seconds: float | None) -> bool:
+def should_rescrape(
+    date_str: str,
+    cached_at_epoch_seconds: float | None,
+    settle_seconds: float = 0,
+    cooldown_seconds: float = 0,
+    now_epoch_seconds: float | None = None,
+) -> bool:
     """
     Determine if a date needs rescraping based on when it was last scraped.
 
+    A scrape is final once it happened after the next day's Pacific midnight, plus
+    settle_seconds for sources whose content keeps moving after the day ends. While the
+    day is still in progress, a scrape less than cooldown_seconds old is reused as is.
+
     >>> should_rescrape("2025-01-23", None)
     True
+    >>> scraped_at = next_day_midnight_pacific_epoch_seconds("2025-01-23") + 3600
+    >>> should_rescrape("2025-01-23", scraped_at), should_rescrape("2025-01-23", scraped_at, settle_seconds=7200)
+    (False, True)
+    >>> evening = next_day_midnight_pacific_epoch_seconds("2025-01-23") - 3600
+    >>> should_rescrape("2025-01-23", evening, cooldown_seconds=600, now_epoch_seconds=evening + 300)
+    False
+    >>> should_rescrape("2025-01-23", evening, cooldown_seconds=600, now_epoch_seconds=evening + 900)
+    True
     """
     if cached_at_epoch_seconds is None:
         return True
 
-    next_day_midnight_epoch = next_day_midnight_pacific_epoch_seconds(date_str)
-    return cached_at_epoch_seconds < next_day_midnight_epoch
+    final_after_epoch = next_day_midnight_pacific_epoch_seconds(date_str) + settle_seconds
+    if cached_at_epoch_seconds >= final_after_epoch:
+        return False
+
+    now_epoch_seconds = time.time() if now_epoch_seconds is None else now_epoch_seconds
+    # Once the day is over the next scrape is the final one, so the cooldown no longer applies
+    in_progress = now_epoch_seconds < final_after_epoch
+    return not (in_progress and now_epoch_seconds - cached_at_epoch_seconds < cooldown_seconds)
 
 
+_CANONICAL_URL_CACHE_SIZE = int(resolve_env_var("CANONICAL_URL_CACHE_SIZE", "65536"))
+
+
+@functools.lru_cache(maxsize=_CANONICAL_URL_CACHE_SIZE)
 def canonicalize_url(url) -> str:
     """Canonicalize URL for better deduplication.
 
@@ -118,6 +155,10 @@ def canonicalize_url(url) -> str:
     - Removes URL fragments
     - Removes trailing slashes (including root)
     - Lowercases domain
+
+    Results are memoized in a bounded LRU (CANONICAL_URL_CACHE_SIZE entries), since the
+    same cached and excluded URLs are canonicalized on every scrape.
+    canonicalize_url.__wrapped__ is the uncached function.
     """
     import urllib.parse as urlparse
 
@@ -143,6 +184,15 @@ def canonicalize_url(url) -> str:
     return canonical
 
 
+def canonicalize_urls(urls) -> list[str]:
+    """Canonicalize every URL in urls, in order, through the canonicalize_url memo.
+
+    >>> canonicalize_urls(["https://www.example.com/a/", "example.com/a?ref=x"])
+    ['example.com/a', 'example.com/a']
+    """
+    return list(map(canonicalize_url, urls))
+
+
 def get_domain_name(url) -> str:
     """Extract a friendly domain name from a URL"""
     import urllib.parse as urlparse
@@ -228,6 +278,164 @@ logger = logging.getLogger(__name__)
 RETRIABLE_EXCEPTIONS = (Exception,)
 
 
+class DeadlineExceeded(TimeoutError):
+    """Raised when a fetch would start after the active scrape deadline."""
+
+
+_active_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "active_deadline", default=None
+)
+
+
+@contextlib.contextmanager
+def deadline_scope(deadline_monotonic: float | None):
+    """Bound every fetch() / async_fetch() in this context by a time.monotonic() deadline.
+
+    >>> with deadline_scope(time.monotonic() + 60):
+    ...     0 < remaining_deadline_seconds() <= 60
+    True
+    >>> remaining_deadline_seconds() is None
+    True
+    """
+    token = _active_deadline.set(deadline_monotonic)
+    try:
+        yield
+    finally:
+        _active_deadline.reset(token)
+
+
+class ScrapeCancelled(DeadlineExceeded):
+    """Raised when a fetch would start after the active scrape was cancelled."""
+
+
+class CancelToken:
+    """Cooperative cancellation flag for one scrape, observed before every fetch().
+
+    cancel() is idempotent: the first call records the reason and runs the callbacks
+    registered with on_cancel() on the cancelling thread.
+
+    >>> token = CancelToken()
+    >>> token.on_cancel(lambda: print("stopping"))
+    >>> token.cancel("superseded"), token.cancel("client_disconnected")
+    stopping
+    (True, False)
+    >>> token.cancelled, token.reason
+    (True, 'superseded')
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._callbacks: list = []
+        self.cancelled = False
+        self.reason: str | None = None
+
+    def cancel(self, reason: str) -> bool:
+        with self._lock:
+            if self.cancelled:
+                return False
+            self.cancelled = True
+            self.reason = reason
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("cancel callback failed reason=%s", reason)
+        return True
+
+    def on_cancel(self, callback) -> None:
+        """Run callback once the token is cancelled (right away if it already is)."""
+        with self._lock:
+            if not self.cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+
+_active_cancel_token: contextvars.ContextVar[CancelToken | None] = contextvars.ContextVar(
+    "active_cancel_token", default=None
+)
+
+
+@contextlib.contextmanager
+def cancel_scope(cancel_token: CancelToken | None):
+    """Make every fetch() / async_fetch() in this context raise ScrapeCancelled once cancel_token is cancelled."""
+    token = _active_cancel_token.set(cancel_token)
+    try:
+        yield
+    finally:
+        _active_cancel_token.reset(token)
+
+
+def scrape_cancelled() -> bool:
+    """Return True when the active scrape was cancelled."""
+    cancel_token = _active_cancel_token.get()
+    return cancel_token is not None and cancel_token.cancelled
+
+
+def remaining_deadline_seconds() -> float | None:
+    """Seconds left before the active deadline, or None when no deadline is set."""
+    deadline = _active_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def raise_if_scrape_stopped() -> None:
+    """Raise ScrapeCancelled or DeadlineExceeded when the active scrape was cancelled or is out of time.
+
+    >>> raise_if_scrape_stopped()
+    >>> with deadline_scope(time.monotonic() - 1):
+    ...     raise_if_scrape_stopped()
+    Traceback (most recent call last):
+    ...
+    util.DeadlineExceeded: scrape deadline reached
+    """
+    if scrape_cancelled():
+        raise ScrapeCancelled(f"scrape cancelled: {_active_cancel_token.get().reason}")
+    remaining = remaining_deadline_seconds()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceeded("scrape deadline reached")
+
+
+def clamp_timeout_to_deadline(timeout: float) -> float:
+    """Return timeout, shortened to the time left before the active deadline.
+
+    >>> clamp_timeout_to_deadline(30)
+    30
+    >>> with deadline_scope(time.monotonic() - 1):
+    ...     clamp_timeout_to_deadline(30)
+    Traceback (most recent call last):
+    ...
+    util.DeadlineExceeded: scrape deadline reached
+    """
+    raise_if_scrape_stopped()
+    remaining = remaining_deadline_seconds()
+    if remaining is None:
+        return timeout
+    return min(timeout, remaining)
+
+
+def _retry_fits_deadline(delay: float) -> bool:
+    if scrape_cancelled():
+        return False
+    remaining = remaining_deadline_seconds()
+    return remaining is None or remaining > delay
+
+
+def _should_retry(func_name: str, attempt: int, max_attempts: int, delay: float, error: Exception) -> bool:
+    """Decide whether a failed attempt gets another try after delay, logging when it does.
+
+    Shared by retry() and async_retry(), which differ only in how they sleep.
+    """
+    if isinstance(error, DeadlineExceeded) or not _retry_fits_deadline(delay):
+        return False
+    if attempt >= max_attempts - 1:
+        return False
+    logger.warning(f"{func_name} attempt {attempt + 1} failed: {error}. Retrying in {delay}s...")
+    return True
+
+
 def retry(max_attempts: int = 2, delay: float = 2.0):
     """
     Retry decorator with fixed delay between attempts.
@@ -252,37 +460,206 @@ def retry(max_attempts: int = 2, delay: float = 2.0):
                     return func(*args, **kwargs)
                 except RETRIABLE_EXCEPTIONS as e:
                     last_exception = e
-                    if attempt < max_attempts - 1:
-                        logger.warning(
-                            f"{func.__name__} attempt {attempt + 1} failed: {e}. Retrying in {delay}s..."
-                        )
-                        time.sleep(delay)
+                    if not _should_retry(func.__name__, attempt, max_attempts, delay, e):
+                        break
+                    time.sleep(delay)
             raise last_exception
         return wrapper
     return decorator
 
 
-def fetch(
-    url: str,
-    *,
-    timeout: int = 30,
-    headers: dict | None = None,
-    params: dict | None = None,
-    allow_redirects: bool = True,
-) -> requests.Response:
-    """Fetch URL content using curl_cffi with browser impersonation."""
+def async_retry(max_attempts: int = 2, delay: float = 2.0):
+    """
+    Coroutine counterpart of retry(): waits with asyncio.sleep so the event loop keeps running.
+
+    >>> attempts = []
+    >>> @async_retry(max_attempts=2, delay=0.01)
+    ... async def flaky():
+    ...     attempts.append(1)
+    ...     if len(attempts) < 2:
+    ...         raise IOError("transient")
+    ...     return "ok"
+    >>> asyncio.run(flaky())
+    'ok'
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            last_exception = None
+            for attempt in range(max_attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except RETRIABLE_EXCEPTIONS as e:
+                    last_exception = e
+                    if not _should_retry(func.__name__, attempt, max_attempts, delay, e):
+                        break
+                    await asyncio.sleep(delay)
+            raise last_exception
+        return wrapper
+    return decorator
+
+
+FETCH_IMPERSONATE_PROFILE = "chrome131"
+
+
+def _build_fetch_headers(headers: dict | None) -> dict:
     default_headers = {
         "Accept-Language": "en-US,en;q=0.9",
         "Referer": "https://www.google.com/",
     }
     if headers:
         default_headers.update(headers)
+    return default_headers
+
 
-    return curl_requests.get(
+def _conditional_request(url: str, params: dict | None, default_headers: dict):
+    """Return (store_key, stored_entry, request headers) for a conditional GET of url."""
+    store_key = conditional_get_store.build_store_key(url, params)
+    stored_entry = conditional_get_store.get_entry(store_key)
+    return store_key, stored_entry, {
+        **default_headers,
+        **conditional_get_store.build_validator_headers(stored_entry),
+    }
+
+
+def _resolve_conditional_response(url: str, store_key: str, stored_entry, response):
+    """Answer a 304 with the stored body and remember a fresh 200's validators."""
+    if response.status_code == 304 and stored_entry is not None:
+        logger.info(f"Not modified, serving stored body url={store_key}")
+        return conditional_get_store.build_response_from_entry(url, stored_entry)
+    if response.status_code == 200:
+        conditional_get_store.put_response(store_key, response)
+    return response
+
+
+def _fetch_cache_key(url: str, default_headers: dict, params: dict | None, allow_redirects: bool, conditional: bool) -> tuple:
+    return fetch_cache.build_fetch_key(
+        "fetch",
         url,
-        impersonate="chrome131",
-        timeout=timeout,
         headers=default_headers,
         params=params,
+        impersonate=FETCH_IMPERSONATE_PROFILE,
         allow_redirects=allow_redirects,
+    ) + (conditional,)
+
+
+def _is_cacheable_fetch_response(response) -> bool:
+    return response.status_code < 500
+
+
+def fetch(
+    url: str,
+    *,
+    timeout: int = 30,
+    headers: dict | None = None,
+    params: dict | None = None,
+    allow_redirects: bool = True,
+    conditional: bool = False,
+) -> requests.Response:
+    """Fetch URL content using curl_cffi with browser impersonation.
+
+    Inside a fetch_cache.scrape_scope(), identical requests are served from the
+    scope's memo instead of hitting the network again. 5xx responses are not
+    memoized so retries still reach the origin.
+
+    With conditional=True the request carries the validators stored by
+    conditional_get_store, and a 304 is answered with the stored body as a 200.
+
+    Every network request waits for a slot from host_limiter, which caps per-host
+    concurrency and request rate. Inside a deadline_scope() the timeout is shortened
+    to the time left, and DeadlineExceeded is raised once none is left. Inside a
+    cancel_scope() whose token was cancelled, ScrapeCancelled is raised instead.
+    """
+    default_headers = _build_fetch_headers(headers)
+
+    def get(request_headers: dict):
+        with host_limiter.host_slot(url):
+            return http_sessions.curl_get(
+                url,
+                impersonate=FETCH_IMPERSONATE_PROFILE,
+                timeout=clamp_timeout_to_deadline(timeout),
+                headers=request_headers,
+                params=params,
+                allow_redirects=allow_redirects,
+            )
+
+    def send_request():
+        if not conditional:
+            return get(default_headers)
+        store_key, stored_entry, request_headers = _conditional_request(url, params, default_headers)
+        return _resolve_conditional_response(url, store_key, stored_entry, get(request_headers))
+
+    active_fetch_cache = fetch_cache.get_active_fetch_cache()
+    if active_fetch_cache is None:
+        return send_request()
+    return active_fetch_cache.get_or_fetch(
+        _fetch_cache_key(url, default_headers, params, allow_redirects, conditional),
+        send_request,
+        cacheable=_is_cacheable_fetch_response,
+    )
+
+
+_active_async_session: contextvars.ContextVar["curl_requests.AsyncSession | None"] = contextvars.ContextVar(
+    "active_async_session", default=None
+)
+
+
+@contextlib.asynccontextmanager
+async def async_session_scope(max_clients: int = 100):
+    """Share one curl_cffi AsyncSession across every async_fetch() awaited within this scope."""
+    async with http_sessions.build_async_curl_session(max_clients) as session:
+        token = _active_async_session.set(session)
+        try:
+            yield session
+        finally:
+            _active_async_session.reset(token)
+
+
+async def async_fetch(
+    url: str,
+    *,
+    timeout: int = 30,
+    headers: dict | None = None,
+    params: dict | None = None,
+    allow_redirects: bool = True,
+    conditional: bool = False,
+):
+    """Async counterpart of fetch() on a curl_cffi AsyncSession.
+
+    Shares fetch()'s per-scrape memo, host limits and conditional-GET store, so both
+    scrape engines see the same caching and throttling behavior.
+    """
+    default_headers = _build_fetch_headers(headers)
+
+    async def get(request_headers: dict):
+        async with host_limiter.async_host_slot(url):
+            request_kwargs = {
+                "impersonate": FETCH_IMPERSONATE_PROFILE,
+                "timeout": clamp_timeout_to_deadline(timeout),
+                "headers": request_headers,
+                "params": params,
+                "allow_redirects": allow_redirects,
+            }
+            session = _active_async_session.get()
+            if session is not None:
+                response = await session.get(url, **request_kwargs)
+            else:
+                async with http_sessions.build_async_curl_session(max_clients=1) as session:
+                    response = await session.get(url, **request_kwargs)
+        http_sessions.record_curl_response(response)
+        return response
+
+    async def send_request():
+        if not conditional:
+            return await get(default_headers)
+        store_key, stored_entry, request_headers = _conditional_request(url, params, default_headers)
+        return _resolve_conditional_response(url, store_key, stored_entry, await get(request_headers))
+
+    active_fetch_cache = fetch_cache.get_active_fetch_cache()
+    if active_fetch_cache is None:
+        return await send_request()
+    return await active_fetch_cache.get_or_fetch_async(
+        _fetch_cache_key(url, default_headers, params, allow_redirects, conditional),
+        send_request,
+        cacheable=_is_cacheable_fetch_response,
     )